@@ -0,0 +1,71 @@
+"""
+Circuit breaker contention benchmark
+
+Compares the read-mostly CircuitBreaker against a variant that takes the
+lock on every before_execution/after_success (the previous behaviour),
+with a CLOSED breaker and only successes, across thread counts.
+
+    python benchmarks/bench_cb_contention.py
+"""
+import threading
+import time
+
+from resilience_full_impl.executor.circuit_breaker import CircuitBreaker
+from resilience_full_impl.policy.cb_policy import CircuitBreakerPolicy
+
+THREAD_COUNTS = (1, 4, 16, 64)
+CALLS_PER_THREAD = 20_000
+
+
+class LockedCircuitBreaker(CircuitBreaker):
+    """
+    Always-lock baseline
+    """
+
+    def before_execution(self):
+        with self._lock:
+            if self._state == self.OPEN:
+                pass
+
+    def after_success(self, duration_seconds: float | None = None):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failure_count = 0
+
+
+def run(cb: CircuitBreaker, threads: int) -> float:
+    """
+    :return: calls per second across all threads
+    """
+    barrier = threading.Barrier(threads + 1)
+
+    def worker():
+        barrier.wait()
+        for _ in range(CALLS_PER_THREAD):
+            cb.before_execution()
+            cb.after_success()
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    return threads * CALLS_PER_THREAD / elapsed
+
+
+def main() -> None:
+    policy = CircuitBreakerPolicy(failure_threshold=5, recovery_timeout=5)
+    print(f"{'threads':>8} {'locked ops/s':>14} {'fast-path ops/s':>16} "
+          f"{'speedup':>8}")
+    for threads in THREAD_COUNTS:
+        locked = run(LockedCircuitBreaker(policy), threads)
+        fast = run(CircuitBreaker(policy), threads)
+        print(f"{threads:>8} {locked:>14,.0f} {fast:>16,.0f} "
+              f"{fast / locked:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
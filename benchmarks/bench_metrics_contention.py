@@ -0,0 +1,92 @@
+"""
+Metrics recording contention benchmark
+
+Increments one tagged counter from 1/8/32/128 threads and reports total
+increments per second for:
+
+- locked: a single lock around a dict, with the sorted tag key rebuilt on
+  every call (the previous InMemoryMetricsCollector behaviour)
+- increment: MetricsCollector.increment(name, tags), handle looked up per
+  call
+- handle: a pre-bound MetricsCollector.counter() handle
+
+and checks that every variant counted every increment.
+
+    python benchmarks/bench_metrics_contention.py
+"""
+import threading
+import time
+from collections import defaultdict
+
+from resilience_full_impl.observability.metrics import MetricsCollector
+
+THREAD_COUNTS = (1, 8, 32, 128)
+TOTAL_INCREMENTS = 640_000
+TAGS = {"dependency_name": "svc", "reason": "timeout"}
+
+
+class LockedCollector:
+    """
+    Global-lock baseline
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = defaultdict(int)
+
+    def increment(self, name: str, tags: dict | None = None):
+        key = (name, tuple(sorted((tags or {}).items())))
+        with self._lock:
+            self._counters[key] += 1
+
+
+def run(record, threads: int) -> float:
+    """
+    :return: increments per second across all threads
+    """
+    per_thread = TOTAL_INCREMENTS // threads
+    barrier = threading.Barrier(threads + 1)
+
+    def worker():
+        barrier.wait()
+        for _ in range(per_thread):
+            record()
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return per_thread * threads / (time.perf_counter() - started)
+
+
+def main() -> None:
+    print(f"{'threads':>8} {'locked ops/s':>14} {'increment ops/s':>16} "
+          f"{'handle ops/s':>14}")
+    key = ("calls_total", tuple(sorted(TAGS.items())))
+    for threads in THREAD_COUNTS:
+        expected = TOTAL_INCREMENTS // threads * threads
+
+        locked = LockedCollector()
+        locked_rate = run(lambda: locked.increment("calls_total", TAGS),
+                          threads)
+        assert locked._counters[key] == expected
+
+        metrics = MetricsCollector()
+        increment_rate = run(lambda: metrics.increment("calls_total", TAGS),
+                             threads)
+        assert metrics._counters[key] == expected
+
+        metrics = MetricsCollector()
+        counter = metrics.counter("calls_total", TAGS)
+        handle_rate = run(counter.inc, threads)
+        assert counter.value() == expected
+
+        print(f"{threads:>8} {locked_rate:>14,.0f} {increment_rate:>16,.0f} "
+              f"{handle_rate:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Observability logging overhead
+
+Runs CALLS successful calls through a @resilient function and reports
+calls per second with:
+
+- off: per-event logging disabled (the default)
+- sync: every metric and span event logged through a plain StreamHandler,
+  as before
+- async: every event logged through AsyncLogHandler
+- sampled async: 1% of events logged through AsyncLogHandler
+
+Each is measured against os.devnull and against a slow sink that costs
+SLOW_WRITE_SECONDS per write, like a terminal or a pipe under
+backpressure.
+
+    python benchmarks/bench_observability_logging.py
+"""
+import io
+import logging
+import os
+import time
+
+from resilience_patterns_observability.core.resilience_executor import \
+    resilient
+from resilience_patterns_observability.observability.logging import (
+    AsyncLogHandler, configure_event_logging)
+from resilience_patterns_observability.policies.bulkhead_policy import \
+    BulkheadPolicy
+from resilience_patterns_observability.policies.cb_policy import \
+    CircuitBreakerPolicy
+from resilience_patterns_observability.policies.retry_policy import \
+    RetryPolicy
+from resilience_patterns_observability.policies.timeout_policy import \
+    TimeoutPolicy
+
+CALLS = 5_000
+SLOW_WRITE_SECONDS = 0.0001
+EVENT_LOGGERS = (
+    "resilience_patterns_observability.policies.inmemory_metrics",
+    "resilience_patterns_observability.observability.inmemory_tracing",
+)
+
+
+class SlowStream(io.StringIO):
+    """
+    Sink that blocks on every write
+    """
+
+    def write(self, text: str) -> int:
+        time.sleep(SLOW_WRITE_SECONDS)
+        return len(text)
+
+
+@resilient(RetryPolicy(max_retries=1, delay_seconds=0),
+           CircuitBreakerPolicy(failure_threshold=100, recovery_timeout=10),
+           BulkheadPolicy(max_concurrent_calls=8, acquire_timeout=1),
+           TimeoutPolicy(1))
+def downstream() -> int:
+    return 1
+
+
+def run(handler: logging.Handler | None, sample_rate: float = 1.0) -> float:
+    """
+    :return: calls per second
+    """
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    for name in EVENT_LOGGERS:
+        logging.getLogger(name).setLevel(logging.DEBUG)
+    if handler is not None:
+        root.addHandler(handler)
+        configure_event_logging(True, sample_rate)
+    try:
+        started = time.perf_counter()
+        for _ in range(CALLS):
+            downstream()
+        elapsed = time.perf_counter() - started
+    finally:
+        configure_event_logging(False)
+        if handler is not None:
+            root.removeHandler(handler)
+            handler.close()
+    return CALLS / elapsed
+
+
+def _stream_handler(stream) -> logging.Handler:
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter(
+        "%(asctime)s | %(levelname)s | %(message)s"))
+    return handler
+
+
+def main() -> None:
+    print(f"{'sink':>8} {'off':>9} {'sync':>9} {'async':>9} "
+          f"{'sampled':>9} {'dropped':>8}")
+    with open(os.devnull, "w") as devnull:
+        for sink, stream in (("devnull", devnull), ("slow", SlowStream())):
+            off = run(None)
+            sync = run(_stream_handler(stream))
+            async_handler = AsyncLogHandler([_stream_handler(stream)])
+            async_all = run(async_handler)
+            sampled = run(AsyncLogHandler([_stream_handler(stream)]), 0.01)
+            print(f"{sink:>8} {off:>9,.0f} {sync:>9,.0f} {async_all:>9,.0f} "
+                  f"{sampled:>9,.0f} {async_handler.dropped:>8,}")
+
+
+if __name__ == "__main__":
+    main()
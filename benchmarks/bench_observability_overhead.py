@@ -0,0 +1,114 @@
+"""
+Instrumentation overhead per call, on and off
+
+Runs CALLS successful calls through each executor, once with its default
+tracer and metrics and once with observability disabled at construction,
+and reports the time per call.
+
+- resilience_full_impl ResilienceExecutor and AsyncResilienceExecutor:
+  metrics=NoopMetricsCollector(), tracer=NOOP_TRACER
+- resilience_patterns_observability ResilienceExecutor: observability=False
+
+    python benchmarks/bench_observability_overhead.py
+"""
+import asyncio
+import time
+
+from resilience_full_impl.executor.async_resilience_executor import \
+    AsyncResilienceExecutor
+from resilience_full_impl.executor.resilience_executor import \
+    ResilienceExecutor
+from resilience_full_impl.observability.metrics import NoopMetricsCollector
+from resilience_full_impl.observability.tracing import NOOP_TRACER
+from resilience_full_impl.policy.bulkhead_policy import BulkheadPolicy
+from resilience_full_impl.policy.cb_policy import CircuitBreakerPolicy
+from resilience_full_impl.policy.retry_policy import RetryPolicy
+from resilience_full_impl.policy.timeout_policy import TimeoutPolicy
+from resilience_patterns_observability.core.resilience_executor import \
+    ResilienceExecutor as ObservabilityExecutor
+from resilience_patterns_observability.policies import (
+    bulkhead_policy, cb_policy, retry_policy, timeout_policy)
+
+CALLS = 10_000
+REPEATS = 3
+
+
+def _full_impl_policies() -> tuple:
+    return (RetryPolicy(max_attempts=3, retry_interval_ms=0,
+                        exponential=False),
+            CircuitBreakerPolicy(failure_threshold=100, recovery_timeout=5),
+            BulkheadPolicy(max_concurrent_calls=4, acquire_timeout=1))
+
+
+def sync_executor(enabled: bool):
+    kwargs = {} if enabled else {"metrics": NoopMetricsCollector(),
+                                 "tracer": NOOP_TRACER}
+    executor = ResilienceExecutor(*_full_impl_policies(), **kwargs)
+    timeout = TimeoutPolicy(timeout_seconds=1)
+
+    def run(calls: int) -> None:
+        for _ in range(calls):
+            executor.execute(lambda token: 1, timeout, "svc")
+
+    return run
+
+
+def async_executor(enabled: bool):
+    kwargs = {} if enabled else {"metrics": NoopMetricsCollector(),
+                                 "tracer": NOOP_TRACER}
+    executor = AsyncResilienceExecutor(*_full_impl_policies(), **kwargs)
+    timeout = TimeoutPolicy(timeout_seconds=1)
+
+    async def call(token) -> int:
+        return 1
+
+    async def calls_in_loop(calls: int) -> None:
+        for _ in range(calls):
+            await executor.execute(call, timeout, "svc")
+
+    return lambda calls: asyncio.run(calls_in_loop(calls))
+
+
+def observability_executor(enabled: bool):
+    executor = ObservabilityExecutor(
+        retry_policy.RetryPolicy(max_retries=3, delay_seconds=0),
+        cb_policy.CircuitBreakerPolicy(failure_threshold=100,
+                                       recovery_timeout=5),
+        bulkhead_policy.BulkheadPolicy(max_concurrent_calls=4,
+                                       acquire_timeout=1),
+        timeout_policy.TimeoutPolicy(1),
+        observability=enabled)
+
+    def run(calls: int) -> None:
+        for _ in range(calls):
+            executor.execute(lambda: 1)
+
+    return run
+
+
+def measure(run) -> float:
+    """
+    :return: microseconds per call, best of REPEATS
+    """
+    run(100)
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        run(CALLS)
+        timings.append((time.perf_counter() - started) / CALLS * 1e6)
+    return min(timings)
+
+
+def main() -> None:
+    print(f"{'executor':>16} {'on us':>7} {'off us':>7} {'saved':>6}")
+    for name, build in (("full_impl", sync_executor),
+                        ("full_impl async", async_executor),
+                        ("observability", observability_executor)):
+        on_us = measure(build(True))
+        off_us = measure(build(False))
+        print(f"{name:>16} {on_us:>7.1f} {off_us:>7.1f} "
+              f"{1 - off_us / on_us:>6.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Timer wheel cost per 100k deadlines
+
+Schedules DEADLINES timers spread over 0-30s on a manually driven wheel
+and reports memory (tracemalloc) and CPU time for schedule, cancel and
+expiry, then the same for CancellationTokens with a wheel deadline. For
+comparison, a thread per deadline (threading.Timer) is measured on
+THREAD_TIMERS timers and reported per timer.
+
+    python benchmarks/bench_timer_wheel.py
+"""
+import random
+import threading
+import time
+import tracemalloc
+
+from resilience_full_impl.cancellation.cancellation_token import \
+    CancellationToken
+from resilience_full_impl.clock import VirtualClock
+from resilience_full_impl.timer_wheel import HashedTimerWheel
+
+DEADLINES = 100_000
+THREAD_TIMERS = 1_000
+SPREAD_SECONDS = 30.0
+
+
+def _noop() -> None:
+    pass
+
+
+def _manual_wheel() -> tuple[HashedTimerWheel, VirtualClock]:
+    clock = VirtualClock()
+    return HashedTimerWheel(clock=clock, autostart=False), clock
+
+
+def _traced_memory(build) -> int:
+    """
+    :return: bytes still allocated by build(), measured separately since
+        tracemalloc slows allocation down
+    """
+    tracemalloc.start()
+    kept = build()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return memory
+
+
+def bench_wheel(delays: list[float]) -> None:
+    def build():
+        wheel, _ = _manual_wheel()
+        return wheel, [wheel.schedule(delay, _noop) for delay in delays]
+
+    memory = _traced_memory(build)
+
+    wheel, clock = _manual_wheel()
+    started = time.process_time()
+    timers = [wheel.schedule(delay, _noop) for delay in delays]
+    schedule_cpu = time.process_time() - started
+
+    started = time.process_time()
+    for timer in timers[::2]:
+        wheel.cancel(timer)
+    cancel_cpu = time.process_time() - started
+
+    started = time.process_time()
+    fired = 0
+    while wheel.pending:
+        clock.advance(0.01)
+        fired += wheel.run_due()
+    expire_cpu = time.process_time() - started
+
+    print(f"wheel timers     : {memory / 1e6:6.1f} MB total, "
+          f"{memory / len(delays):5.0f} B/timer")
+    print(f"  schedule       : {schedule_cpu * 1e3:6.1f} ms CPU, "
+          f"{schedule_cpu / len(delays) * 1e9:5.0f} ns/timer")
+    print(f"  cancel (50%)   : {cancel_cpu * 1e3:6.1f} ms CPU, "
+          f"{cancel_cpu / len(timers[::2]) * 1e9:5.0f} ns/timer")
+    print(f"  expire (50%)   : {expire_cpu * 1e3:6.1f} ms CPU over "
+          f"{SPREAD_SECONDS:.0f}s of ticks, {fired} fired")
+
+
+def bench_tokens(delays: list[float]) -> None:
+    wheel, clock = _manual_wheel()
+
+    def build():
+        return [CancellationToken(deadline_seconds=delay, clock=clock,
+                                  timer_wheel=wheel) for delay in delays]
+
+    memory = _traced_memory(build)
+    started = time.process_time()
+    tokens = build()
+    cpu = time.process_time() - started
+    print(f"tokens + wheel   : {memory / 1e6:6.1f} MB total, "
+          f"{memory / len(tokens):5.0f} B/token, "
+          f"{cpu / len(tokens) * 1e9:5.0f} ns/token")
+
+
+def bench_threads() -> None:
+    started = time.perf_counter()
+    timers = [threading.Timer(SPREAD_SECONDS, _noop)
+              for _ in range(THREAD_TIMERS)]
+    for timer in timers:
+        timer.start()
+    for timer in timers:
+        timer.cancel()
+    for timer in timers:
+        timer.join()
+    elapsed = time.perf_counter() - started
+    print(f"thread per timer : {elapsed / THREAD_TIMERS * 1e6:6.1f} us/timer "
+          f"(start + cancel + join), one OS thread and stack each")
+
+
+def main() -> None:
+    rng = random.Random(7)
+    delays = [rng.uniform(0, SPREAD_SECONDS) for _ in range(DEADLINES)]
+    print(f"{DEADLINES:,} deadlines over {SPREAD_SECONDS:.0f}s")
+    bench_wheel(delays)
+    bench_tokens(delays)
+    bench_threads()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,12 @@
-import time
+import itertools
 import threading
-from typing import Optional
+from typing import Callable, Optional
+
+from resilience_full_impl.clock import SYSTEM_CLOCK, Clock
 from resilience_full_impl.cancellation.exceptions import \
                 CancelledException
+from resilience_full_impl.observability.logging import logger
+from resilience_full_impl.timer_wheel import HashedTimerWheel
 
 class CancellationToken:
     """
@@ -11,22 +15,124 @@ class CancellationToken:
         - Supports explicit cancellation
         - Supports deadline-based cancellation
         - Thread-safe
+        - Deadline on the monotonic clock, immune to wall-clock steps
+        - Event driven: register_callback() and wait() instead of polling
+        - Linked: a child() token is cancelled with its parent
+
+        is_cancelled() is lock-free: it reads the Event flag and compares
+        the deadline. Without a timer_wheel the deadline is observed
+        lazily; whoever notices it first (is_cancelled, wait) cancels the
+        token and runs the callbacks. With one, the wheel cancels the
+        token when the deadline passes.
     """
 
-    def __init__(self, deadline_seconds: Optional[float] = None) -> None:
+    def __init__(self, deadline_seconds: Optional[float] = None,
+                 clock: Clock = SYSTEM_CLOCK,
+                 timer_wheel: Optional[HashedTimerWheel] = None) -> None:
+        self._clock = clock
         self._deadline = (
-            time.time() + deadline_seconds if deadline_seconds is not None
-            else None)
-        self._cancelled = False
+            clock.monotonic() + deadline_seconds
+            if deadline_seconds is not None else None)
+        self._event = threading.Event()
+        self._callbacks: dict[int, Callable[[], None]] = {}
+        self._callback_ids = itertools.count()
+        self._unlink: Optional[Callable[[], None]] = None
         self._lock = threading.Lock()
+        self._timer_wheel = timer_wheel
+        self._deadline_timer = None
+        if timer_wheel is not None and deadline_seconds is not None:
+            self._deadline_timer = timer_wheel.schedule(deadline_seconds,
+                                                        self.cancel)
 
     def cancel(self) -> None:
         """
-        Explicitly cancel the token
+        Explicitly cancel the token, wake waiters and run the callbacks
+        once
+        :return:
+        """
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks = list(self._callbacks.values())
+            self._callbacks.clear()
+            unlink, self._unlink = self._unlink, None
+            timer, self._deadline_timer = self._deadline_timer, None
+
+        if timer is not None:
+            self._timer_wheel.cancel(timer)
+        if unlink is not None:
+            unlink()
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                logger.exception("[CANCEL] : cancellation callback failed")
+
+    def close(self) -> None:
+        """
+        Release the deadline timer and the link to the parent without
+        cancelling or running callbacks; call once the work the token
+        guards has finished, so the timer does not keep it alive until
+        the deadline
         :return:
         """
         with self._lock:
-            self._cancelled = True
+            unlink, self._unlink = self._unlink, None
+            timer, self._deadline_timer = self._deadline_timer, None
+        if timer is not None:
+            self._timer_wheel.cancel(timer)
+        if unlink is not None:
+            unlink()
+
+    def register_callback(self, callback: Callable[[], None]
+                          ) -> Callable[[], None]:
+        """
+        Run callback on cancellation, at once if already cancelled
+
+        :param callback:
+        :return: function that unregisters the callback
+        """
+        with self._lock:
+            if not self._event.is_set():
+                callback_id = next(self._callback_ids)
+                self._callbacks[callback_id] = callback
+
+                def unregister() -> None:
+                    with self._lock:
+                        self._callbacks.pop(callback_id, None)
+
+                return unregister
+        callback()
+        return lambda: None
+
+    def child(self, deadline_seconds: Optional[float] = None
+              ) -> "CancellationToken":
+        """
+        Token cancelled with this one, e.g. for one attempt of a request.
+        Its deadline is the earlier of deadline_seconds and this token's.
+
+        :param deadline_seconds:
+        :return:
+        """
+        remaining = self.remaining_seconds()
+        if deadline_seconds is None or (
+                remaining is not None and remaining < deadline_seconds):
+            deadline_seconds = remaining
+        token = CancellationToken(deadline_seconds=deadline_seconds,
+                                  clock=self._clock,
+                                  timer_wheel=self._timer_wheel)
+        token._unlink = self.register_callback(token.cancel)
+        return token
+
+    def remaining_seconds(self) -> Optional[float]:
+        """
+        Time left before the deadline, never negative
+        :return: None when the token has no deadline
+        """
+        if self._deadline is None:
+            return None
+        return max(0.0, self._deadline - self._clock.monotonic())
 
     def is_cancelled(self) -> bool:
         """
@@ -35,10 +141,29 @@ class CancellationToken:
         - deadline exceeded
         :return:
         """
-        if self._deadline is not None and time.time() >= self._deadline:
+        if self._event.is_set():
             return True
-        with self._lock:
-            return self._cancelled
+        if self._deadline is not None and \
+                self._clock.monotonic() >= self._deadline:
+            self.cancel()
+            return True
+        return False
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the token is cancelled, its deadline passes or timeout
+        seconds elapse; a cancellable replacement for time.sleep
+
+        :param timeout:
+        :return: True when the token is cancelled
+        """
+        remaining = self.remaining_seconds()
+        if remaining is not None and (timeout is None or remaining <= timeout):
+            if self._event.wait(remaining):
+                return True
+            self.cancel()
+            return True
+        return self._event.wait(timeout)
 
     def throw_if_cancelled(self) -> None:
         """
@@ -51,4 +176,4 @@ class CancellationToken:
             raise CancelledException(
                 "Operation canceled or Deadline exceeded"
             )
-        
+
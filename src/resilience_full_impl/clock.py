@@ -0,0 +1,99 @@
+"""
+    Clock - time source for deadlines, durations and timers
+
+    Deadlines and durations use the monotonic clock, which NTP steps and
+    manual changes to the system time cannot move. Wall time is only for
+    exported timestamps (span start times, logs).
+
+    Components take any Clock; resilience_patterns_observability.clock
+    declares the same protocol.
+"""
+import threading
+import time
+from typing import Protocol
+
+
+class Clock(Protocol):
+    """
+        Time source; swap in VirtualClock for tests and simulations
+    """
+
+    def monotonic(self) -> float: ...
+
+    def perf_counter(self) -> float: ...
+
+    def wall(self) -> float: ...
+
+    def sleep(self, seconds: float) -> None: ...
+
+
+class SystemClock:
+    """
+        Process clock: time.monotonic_ns / perf_counter_ns
+    """
+
+    def monotonic(self) -> float:
+        """
+
+        :return: monotonic seconds, for deadlines and elapsed time
+        """
+        return time.monotonic_ns() / 1e9
+
+    def perf_counter(self) -> float:
+        """
+
+        :return: highest resolution seconds, for short durations
+        """
+        return time.perf_counter_ns() / 1e9
+
+    def wall(self) -> float:
+        """
+
+        :return: epoch seconds, for export only
+        """
+        return time.time()
+
+    def sleep(self, seconds: float) -> None:
+        """
+
+        :param seconds:
+        """
+        if seconds > 0:
+            time.sleep(seconds)
+
+
+class VirtualClock:
+    """
+        Manually driven clock for tests and simulations: time only moves
+        through advance() or sleep(), which returns at once
+    """
+
+    def __init__(self, start_seconds: float = 0.0,
+                 wall_origin: float = 0.0):
+        self._now_ns = int(start_seconds * 1e9)
+        self._wall_origin = wall_origin
+        self._lock = threading.Lock()
+
+    def monotonic(self) -> float:
+        return self._now_ns / 1e9
+
+    def perf_counter(self) -> float:
+        return self._now_ns / 1e9
+
+    def wall(self) -> float:
+        return self._wall_origin + self._now_ns / 1e9
+
+    def advance(self, seconds: float) -> None:
+        """
+
+        :param seconds:
+        """
+        with self._lock:
+            self._now_ns += int(seconds * 1e9)
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            self.advance(seconds)
+
+
+SYSTEM_CLOCK = SystemClock()
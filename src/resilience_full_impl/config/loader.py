@@ -1,6 +1,9 @@
 import yaml
 
-from resilience_full_impl.policy.retry_policy import RetryPolicy
+from resilience_full_impl.policy.retry_policy import (DECORRELATED_JITTER,
+                                                      EQUAL_JITTER,
+                                                      FULL_JITTER,
+                                                      RetryPolicy)
 from resilience_full_impl.policy.timeout_policy import TimeoutPolicy
 
 
@@ -34,7 +37,10 @@ class ResilienceConfigLoader:
         return RetryPolicy(
             max_attempts=cfg["max_attempts"],
             retry_interval_ms=cfg["retry_interval_ms"],
-            exponential=cfg["exponential"]
+            exponential=cfg["exponential"],
+            jitter=cfg.get("jitter"),
+            max_retry_interval_ms=cfg.get("max_retry_interval_ms"),
+            respect_retry_after=cfg.get("respect_retry_after", False)
         )
 
 
@@ -50,4 +56,13 @@ class ResilienceConfigLoader:
         if cfg["retry_interval_ms"] <= 0:
             raise ValueError("retry_interval_ms must be positive")
         if not isinstance(cfg["exponential"], bool):
-            raise ValueError("exponential must be boolean")
\ No newline at end of file
+            raise ValueError("exponential must be boolean")
+        if cfg.get("jitter") not in (None, FULL_JITTER, EQUAL_JITTER,
+                                     DECORRELATED_JITTER):
+            raise ValueError(f"jitter must be one of {FULL_JITTER}, "
+                             f"{EQUAL_JITTER} or {DECORRELATED_JITTER}")
+        max_interval = cfg.get("max_retry_interval_ms")
+        if max_interval is not None and max_interval <= 0:
+            raise ValueError("max_retry_interval_ms must be positive")
+        if not isinstance(cfg.get("respect_retry_after", False), bool):
+            raise ValueError("respect_retry_after must be boolean")
@@ -0,0 +1,137 @@
+"""
+    Adaptive concurrency limits for the bulkhead
+
+    Each attempt that reached the dependency feeds (round-trip time,
+    succeeded, in_flight) into the algorithm, which returns the new limit,
+    always within [min_concurrent_calls, max_concurrent_calls].
+
+    resilience_patterns_observability.core.adaptive_limit holds the same
+    algorithms: the two packages ship separately and never import each
+    other, so change both together.
+"""
+import math
+
+from resilience_full_impl.policy.bulkhead_policy import (AIMD, GRADIENT,
+                                                         BulkheadPolicy)
+
+
+class AIMDLimit:
+    """
+    Additive increase while latency stays close to the baseline (the
+    lowest latency seen, drifting up slowly), multiplicative decrease on
+    errors or when latency exceeds baseline * tolerance
+    """
+
+    def __init__(self, min_limit: int, max_limit: int, initial_limit: int,
+                 backoff_ratio: float = 0.9, tolerance: float = 2.0):
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._backoff_ratio = backoff_ratio
+        self._tolerance = tolerance
+        self._baseline = None
+        self.limit = initial_limit
+
+    def on_sample(self, latency_seconds: float, succeeded: bool,
+                  in_flight: int) -> int:
+        """
+
+        :param latency_seconds:
+        :param succeeded:
+        :param in_flight: calls in flight when this one completed
+        :return: new limit
+        """
+        if self._baseline is None or latency_seconds < self._baseline:
+            self._baseline = latency_seconds
+        else:
+            self._baseline += (latency_seconds - self._baseline) * 0.01
+
+        if not succeeded or \
+                latency_seconds > self._baseline * self._tolerance:
+            self.limit = max(self._min_limit,
+                             int(self.limit * self._backoff_ratio))
+        elif in_flight * 2 >= self.limit:
+            self.limit = min(self._max_limit, self.limit + 1)
+        return self.limit
+
+
+class GradientLimit:
+    """
+    Compares short-term latency with a long-term baseline;
+    gradient = clamp(tolerance * long / short, 0.5, 1.0) shrinks the limit
+    as latency climbs, sqrt(limit) of headroom lets it grow while latency
+    holds. Errors count as gradient 0.5.
+    """
+
+    def __init__(self, min_limit: int, max_limit: int, initial_limit: int,
+                 smoothing: float = 0.2, tolerance: float = 1.5,
+                 long_window: int = 600, short_window: int = 10):
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._smoothing = smoothing
+        self._tolerance = tolerance
+        self._long_alpha = 2 / (long_window + 1)
+        self._short_alpha = 2 / (short_window + 1)
+        self._long_latency = None
+        self._short_latency = None
+        self._estimate = float(initial_limit)
+        self.limit = initial_limit
+
+    def on_sample(self, latency_seconds: float, succeeded: bool,
+                  in_flight: int) -> int:
+        """
+
+        :param latency_seconds:
+        :param succeeded:
+        :param in_flight: calls in flight when this one completed
+        :return: new limit
+        """
+        if self._long_latency is None:
+            self._long_latency = self._short_latency = latency_seconds
+        else:
+            self._long_latency += (latency_seconds - self._long_latency) \
+                * self._long_alpha
+            self._short_latency += (latency_seconds - self._short_latency) \
+                * self._short_alpha
+
+        if succeeded and in_flight * 2 < self._estimate:
+            return self.limit  # app-limited, latency says nothing
+
+        if not succeeded:
+            gradient = 0.5
+        else:
+            gradient = max(0.5, min(1.0, self._tolerance *
+                                    self._long_latency /
+                                    max(self._short_latency, 1e-9)))
+        target = self._estimate * gradient + math.sqrt(self._estimate)
+        self._estimate = self._estimate * (1 - self._smoothing) + \
+            target * self._smoothing
+        self._estimate = max(self._min_limit,
+                             min(self._max_limit, self._estimate))
+        self.limit = int(self._estimate)
+        return self.limit
+
+
+def build_limit(bulkhead_pol: BulkheadPolicy):
+    """
+    Adaptive limit for the policy, or None for a fixed limit
+    :param bulkhead_pol:
+    :return:
+    """
+    if bulkhead_pol.adaptive_limit is None:
+        return None
+
+    min_limit = bulkhead_pol.min_concurrent_calls
+    max_limit = bulkhead_pol.max_concurrent_calls
+    if not 0 < min_limit <= max_limit:
+        raise ValueError("[BULKHEAD] : min_concurrent_calls must be in "
+                         "(0, max_concurrent_calls]")
+    initial = bulkhead_pol.initial_concurrent_calls or max(min_limit,
+                                                           max_limit // 2)
+    initial = max(min_limit, min(max_limit, initial))
+
+    if bulkhead_pol.adaptive_limit == AIMD:
+        return AIMDLimit(min_limit, max_limit, initial)
+    if bulkhead_pol.adaptive_limit == GRADIENT:
+        return GradientLimit(min_limit, max_limit, initial)
+    raise ValueError(f"[BULKHEAD] : unknown adaptive_limit "
+                     f"{bulkhead_pol.adaptive_limit}")
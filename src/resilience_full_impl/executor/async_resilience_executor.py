@@ -0,0 +1,300 @@
+"""
+    Async Resilience Executor for retry, timeout
+"""
+import asyncio
+from functools import wraps
+from typing import Any, Awaitable, Callable, TypeVar
+
+from resilience_full_impl.cancellation.cancellation_token import \
+    CancellationToken
+from resilience_full_impl.cancellation.exceptions import CancelledException
+from resilience_full_impl.clock import SYSTEM_CLOCK, Clock
+from resilience_full_impl.executor.backoff import Backoff
+from resilience_full_impl.executor.bulkhead import AsyncBulkhead
+from resilience_full_impl.executor.circuit_breaker import CircuitBreaker
+from resilience_full_impl.executor.circuit_breaker import \
+                CircuitBreakerException
+from resilience_full_impl.executor.execution_context import \
+    ExecutionContext
+from resilience_full_impl.executor.latency_estimate import \
+    LatencyEstimates
+from resilience_full_impl.executor.resilience_executor import \
+    TimeoutException
+from resilience_full_impl.observability.metrics import MetricsCollector
+from resilience_full_impl.observability.tracing import NoopTracer, Tracer
+from resilience_full_impl.policy.bulkhead_policy import BulkheadPolicy
+from resilience_full_impl.policy.cb_policy import CircuitBreakerPolicy
+from resilience_full_impl.policy.retry_policy import RetryPolicy
+from resilience_full_impl.policy.timeout_policy import TimeoutPolicy
+from resilience_full_impl.timer_wheel import (TIMER_WHEEL,
+                                           HashedTimerWheel)
+
+
+T = TypeVar("T")
+
+class AsyncResilienceExecutor:
+    """
+         Implements ResilienceExecutor for asyncio callers.
+
+         Same policies and metric names as ResilienceExecutor, but every
+         wait is an await: backoff is asyncio.sleep, the bulkhead is an
+         asyncio.Semaphore and timeouts use asyncio.timeout, so an
+         in-flight call costs a coroutine instead of an OS thread.
+    """
+
+    def __init__(self, retry_policy: RetryPolicy,
+                 cb_policy: CircuitBreakerPolicy,
+                 bulk_head_policy: BulkheadPolicy,
+                 clock: Clock = SYSTEM_CLOCK,
+                 timer_wheel: HashedTimerWheel | None = None,
+                 metrics: MetricsCollector | None = None,
+                 tracer: Tracer | NoopTracer | None = None):
+        """
+        See ResilienceExecutor for clock, timer_wheel, metrics and tracer
+        """
+        self._retry_policy = retry_policy
+        self._clock = clock
+        self._backoff = Backoff(retry_policy)
+        # p50 of each dependency's successful attempts
+        self._attempt_latencies = LatencyEstimates()
+        self._timer_wheel = timer_wheel or (
+            TIMER_WHEEL if clock is SYSTEM_CLOCK
+            else HashedTimerWheel(clock=clock, autostart=False))
+        self._cb_obj = CircuitBreaker(cb_pol_obj=cb_policy, clock=clock,
+                                      timer_wheel=self._timer_wheel)
+        self._metrics = metrics if metrics is not None else MetricsCollector()
+        self._start_span = (tracer or Tracer(clock)).start_span
+        self._attempt_counters = {}
+        self._bulkhead = AsyncBulkhead(bulkhead_pol=bulk_head_policy,
+                                       metrics=self._metrics)
+
+    async def _sleep_before_next_attempt(self, attempt: int,
+                                        previous_delay: float | None,
+                                        ex: Exception,
+                                        ctx: ExecutionContext,
+                                        dependency_name: str) -> float | None:
+        """
+        Back off before the next attempt, unless what is left of the token
+        deadline cannot cover the backoff plus a typical (p50) attempt
+
+        :param attempt: attempt that just failed
+        :param previous_delay: previous backoff of this call, in seconds
+        :param ex: error of the failed attempt, for Retry-After
+        :param ctx:
+        :param dependency_name:
+        :return: the delay slept in seconds, None when the retry is skipped
+        """
+        delay = self._backoff.delay_seconds(attempt, previous_delay, ex)
+        remaining = ctx.token.remaining_seconds()
+        if remaining is not None:
+            typical = self._attempt_latencies.for_dependency(
+                dependency_name).seconds() or 0.0
+            if delay + typical >= remaining:
+                self._metrics.increment(
+                    "retry_deadline_skipped_total",
+                    tags={"dependency_name": dependency_name,
+                          "reason": ("backoff" if delay >= remaining
+                                     else "latency")})
+                return None
+        await asyncio.sleep(delay)
+        return delay
+
+    def _attempt_counter(self, dependency_name: str):
+        """
+        retry_attempts_total handle of the dependency
+        :param dependency_name:
+        :return:
+        """
+        counter = self._attempt_counters.get(dependency_name)
+        if counter is None:
+            counter = self._attempt_counters.setdefault(
+                dependency_name,
+                self._metrics.counter("retry_attempts_total",
+                                      tags={"Dependency": dependency_name}))
+        return counter
+
+    async def execute(self,
+                      func: Callable[[CancellationToken], Awaitable[T]],
+                      timeout_policy: TimeoutPolicy,
+                      dependency_name: str) -> T:
+        """
+
+        :param dependency_name:
+        :param func: coroutine function receiving the CancellationToken
+        :param timeout_policy:
+        :return:
+        """
+        self._validate_policies(self._retry_policy, timeout_policy)
+        token = CancellationToken(
+            deadline_seconds=timeout_policy.timeout_seconds, clock=self._clock,
+            timer_wheel=self._timer_wheel)
+
+        with self._start_span("request", dependency=dependency_name):
+            await self._bulkhead.acquire(dependency_name)
+
+            try:
+
+                ctx = ExecutionContext(retry_pol=self._retry_policy,
+                                       timeout_pol=timeout_policy,
+                                       token=token,
+                                       cb=self._cb_obj)
+
+                return await self._execute_with_retry(func, ctx,
+                                                      dependency_name)
+            finally:
+                token.close()
+                self._bulkhead.release()
+
+    async def _execute_with_retry(
+            self, func: Callable[[CancellationToken], Awaitable[T]],
+            ctx: ExecutionContext,
+            dependency_name: str) -> T:
+        """
+
+        :param func:
+        :return:
+        """
+        last_exception = None
+        delay = None
+        attempt_counter = self._attempt_counter(dependency_name)
+
+        for attempt in range(1, self._retry_policy.max_attempts + 1):
+            with self._start_span("retry_attempt", attempt=attempt):
+                attempt_counter.inc()
+
+            ctx.token.throw_if_cancelled()
+
+            with self._start_span("circuit_breaker_check"):
+                ctx.cb.before_execution()
+
+            started = self._clock.monotonic()
+            try:
+                result_success = await self._execute_with_timeout(func, ctx)
+                duration = self._clock.monotonic() - started
+                ctx.cb.after_success(duration)
+                self._attempt_latencies.for_dependency(
+                    dependency_name).observe(duration)
+                return result_success
+
+            except CircuitBreakerException:
+                raise
+
+            except CancelledException as e:
+                ctx.cb.after_failure(e)
+                raise
+
+            except Exception as e:
+                last_exception = e
+                ctx.cb.after_failure(e, self._clock.monotonic() - started)
+
+            if attempt == ctx.retry_pol.max_attempts:
+                break
+
+            delay = await self._sleep_before_next_attempt(
+                attempt, delay, last_exception, ctx, dependency_name)
+            if delay is None:
+                break
+        raise last_exception
+
+    async def _execute_with_timeout(
+            self, func: Callable[[CancellationToken], Awaitable[T]],
+            ctx: ExecutionContext) -> T:
+        """
+        Run one attempt as a task that is cancelled on timeout or when the
+        token is cancelled
+        :param func:
+        :param ctx:
+        :return:
+        """
+        timeout_seconds = ctx.attempt_timeout()
+        with self._start_span("timeout_execution",
+                              timeout_seconds=timeout_seconds,
+                              ):
+            token = ctx.token.child(deadline_seconds=timeout_seconds)
+            task = asyncio.ensure_future(func(token))
+            unlink = _cancel_task_on_token(task, token)
+            timeout = asyncio.timeout(timeout_seconds)
+            try:
+                async with timeout:
+                    try:
+                        return await task
+                    except asyncio.CancelledError:
+                        if asyncio.current_task().cancelling():
+                            raise
+                        raise CancelledException(
+                            "Operation canceled or Deadline exceeded"
+                        ) from None
+            except TimeoutError:
+                if not timeout.expired():
+                    raise
+                token.cancel()
+                raise TimeoutException(f"Timed out after "
+                                       f"{timeout_seconds} seconds")
+            finally:
+                unlink()
+                token.close()
+
+    def _validate_policies(self, retry_policy: RetryPolicy,
+                           timeout_policy: TimeoutPolicy) -> None:
+        """
+
+        :param retry_policy:
+        :param timeout_policy:
+        :return:
+        """
+        if timeout_policy.timeout_seconds <= 0:
+            raise ValueError(
+                "[TimeoutPolicy] : timeout_policy.timeout_seconds <= 0")
+        if retry_policy.max_attempts <= 0:
+            raise ValueError("[TimeoutPolicy] : retry_policy.max_attempts "
+                             "<= 0")
+
+
+def _cancel_task_on_token(task: asyncio.Future,
+                          token: CancellationToken) -> Callable[[], None]:
+    """
+    Bridge a CancellationToken to an asyncio task: cancelling the token,
+    from any thread, cancels the task on its loop
+    :param task:
+    :param token:
+    :return: function that removes the bridge
+    """
+    loop = asyncio.get_running_loop()
+    return token.register_callback(
+        lambda: loop.call_soon_threadsafe(task.cancel))
+
+
+def resilient(retry_policy: RetryPolicy,
+              cb_policy: CircuitBreakerPolicy,
+              bulk_head_policy: BulkheadPolicy,
+              timeout_policy: TimeoutPolicy,
+              dependency_name: str | None = None) -> Any:
+    """
+    Async resilience decorator factory.
+
+    The decorated coroutine function receives the CancellationToken as its
+    first argument; callers pass the remaining arguments only.
+    """
+    executor = AsyncResilienceExecutor(retry_policy, cb_policy,
+                                       bulk_head_policy)
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Any:
+        """ decorator factory """
+        name = dependency_name or func.__qualname__
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> T:
+            """
+            wrapper decorator factory
+            :param args:
+            :param kwargs:
+            :return:
+            """
+            return await executor.execute(
+                lambda token: func(token, *args, **kwargs),
+                timeout_policy,
+                dependency_name=name)
+
+        return wrapper
+
+    return decorator
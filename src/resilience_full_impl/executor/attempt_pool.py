@@ -0,0 +1,181 @@
+"""
+    Attempt Pool - bounded, reusable workers for timed attempts
+"""
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Callable, TypeVar
+
+from resilience_full_impl.observability.logging import logger
+from resilience_full_impl.observability.metrics import MetricsCollector
+
+T = TypeVar("T")
+
+
+class AttemptPoolExhaustedException(Exception):
+    """
+    Raised when too many timed-out attempts are still occupying workers
+    """
+    pass
+
+
+class AttemptPool:
+    """
+    Worker pool that runs attempts and hands results back through futures.
+
+    - max_workers threads serve live attempts
+    - max_abandoned extra threads absorb attempts that timed out but are
+      still running; once that many are abandoned, new attempts are
+      rejected instead of piling up behind them
+
+    Workers are daemon threads started on demand, so an attempt that
+    ignores its token never keeps the process from exiting.
+    """
+
+    def __init__(self,
+                 max_workers: int,
+                 max_abandoned: int,
+                 metrics: MetricsCollector,
+                 name: str = "attempt"):
+        if max_workers <= 0:
+            raise ValueError("[AttemptPool] : max_workers <= 0")
+        if max_abandoned <= 0:
+            raise ValueError("[AttemptPool] : max_abandoned <= 0")
+
+        self._queue = queue.SimpleQueue()
+        self._max_threads = max_workers + max_abandoned
+        self._threads = []
+        self._busy = 0
+        self._queued = 0
+        self._closed = False
+        self._max_abandoned = max_abandoned
+        self._abandoned = 0
+        self._lock = threading.Lock()
+        self._metrics = metrics
+        self._name = name
+
+    @property
+    def abandoned_count(self) -> int:
+        """
+        Number of timed-out attempts whose worker is still running
+        :return:
+        """
+        return self._abandoned
+
+    def submit(self, func: Callable[..., T], *args) -> "Future[T]":
+        """
+        Schedule an attempt on a pooled worker
+        :param func:
+        :param args:
+        :return: future holding the result or the raised exception
+        """
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("[AttemptPool] : pool is shut down")
+            if self._abandoned >= self._max_abandoned:
+                self._metrics.increment(
+                    "attempt_pool_rejections_total",
+                    tags={"pool": self._name})
+                raise AttemptPoolExhaustedException(
+                    f"[AttemptPool] : {self._abandoned} abandoned attempts "
+                    f"still running")
+            self._queued += 1
+            idle = len(self._threads) - self._busy - self._queued
+            worker = None
+            if idle < 0 and len(self._threads) < self._max_threads:
+                worker = threading.Thread(
+                    target=self._run_worker, daemon=True,
+                    name=f"{self._name}-pool-{len(self._threads)}")
+                self._threads.append(worker)
+
+        self._queue.put((future, func, args))
+        if worker is not None:
+            worker.start()
+        return future
+
+    def _run_worker(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            future, func, args = item
+            with self._lock:
+                self._queued -= 1
+                self._busy += 1
+            try:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(func(*args))
+                    except BaseException as exc:
+                        future.set_exception(exc)
+            finally:
+                with self._lock:
+                    self._busy -= 1
+
+    def abandon(self, future: Future) -> None:
+        """
+        Give up on a timed-out attempt. A queued attempt is cancelled, a
+        running one is counted as abandoned until it returns.
+        :param future:
+        :return:
+        """
+        if future.cancel():
+            return
+
+        with self._lock:
+            self._abandoned += 1
+            abandoned = self._abandoned
+
+        self._metrics.increment("attempt_pool_abandoned_total",
+                                tags={"pool": self._name})
+        self._metrics.set_gauge("attempt_pool_abandoned_workers", abandoned,
+                                tags={"pool": self._name})
+        logger.warning("[POOL] : Attempt abandoned, %s workers still busy "
+                       "with timed-out attempts", abandoned)
+
+        future.add_done_callback(self._on_abandoned_done)
+
+    def release(self, future: Future) -> None:
+        """
+        Let go of an attempt whose result is no longer needed and whose
+        token was cancelled, e.g. a hedge that lost. A queued attempt is
+        cancelled, a running one returns on its own and is not counted as
+        abandoned.
+        :param future:
+        :return:
+        """
+        future.cancel()
+
+    def _on_abandoned_done(self, _future: Future) -> None:
+        with self._lock:
+            self._abandoned -= 1
+            abandoned = self._abandoned
+
+        self._metrics.set_gauge("attempt_pool_abandoned_workers", abandoned,
+                                tags={"pool": self._name})
+
+    def shutdown(self, wait: bool = False) -> None:
+        """
+        Stop accepting attempts, cancel the queued ones and release the
+        workers
+        :param wait: join the workers, including abandoned ones
+        :return:
+        """
+        with self._lock:
+            self._closed = True
+            threads = list(self._threads)
+
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item[0].cancel()
+        for _ in threads:
+            self._queue.put(None)
+        if wait:
+            for thread in threads:
+                thread.join()
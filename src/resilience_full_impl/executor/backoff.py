@@ -0,0 +1,98 @@
+"""
+    Backoff - delay between retry attempts
+"""
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable
+
+from resilience_full_impl.policy.retry_policy import (DECORRELATED_JITTER,
+                                                      EQUAL_JITTER,
+                                                      FULL_JITTER,
+                                                      RetryPolicy)
+
+_JITTERS = (None, FULL_JITTER, EQUAL_JITTER, DECORRELATED_JITTER)
+
+
+def retry_after_seconds(ex: BaseException) -> float | None:
+    """
+    Server-requested delay carried by an error: a retry_after attribute
+    (seconds) or a Retry-After header on ex.response, as seconds or an
+    HTTP date
+    :param ex:
+    :return: None when the error carries no usable value
+    """
+    value = getattr(ex, "retry_after", None)
+    if value is None:
+        headers = getattr(getattr(ex, "response", None), "headers", None)
+        value = headers.get("Retry-After") if headers else None
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        retry_at = parsedate_to_datetime(str(value))
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class Backoff:
+    """
+    Backoff for a RetryPolicy
+
+    base = retry_interval_ms, doubled per attempt when exponential, capped
+    at max_retry_interval_ms; then
+        None         : base
+        FULL         : uniform(0, base)
+        EQUAL        : base / 2 + uniform(0, base / 2)
+        DECORRELATED : uniform(retry_interval_ms, 3 * previous delay),
+                       capped
+    A Retry-After on the error raises the delay to at least that value.
+    """
+
+    def __init__(self, retry_pol: RetryPolicy,
+                 uniform: Callable[[float, float], float] = random.uniform):
+        if retry_pol.jitter not in _JITTERS:
+            raise ValueError(f"[RETRY] : unknown jitter {retry_pol.jitter}")
+        self._retry_pol = retry_pol
+        self._uniform = uniform
+
+    def delay_seconds(self, attempt: int,
+                      previous_delay_seconds: float | None = None,
+                      ex: BaseException | None = None) -> float:
+        """
+
+        :param attempt: attempt that just failed, from 1
+        :param previous_delay_seconds: last delay of this call, for
+            decorrelated jitter
+        :param ex: error of the failed attempt
+        :return:
+        """
+        retry_pol = self._retry_pol
+        cap_ms = retry_pol.max_retry_interval_ms
+        base_ms = retry_pol.retry_interval_ms
+        if retry_pol.jitter == DECORRELATED_JITTER:
+            previous_ms = (previous_delay_seconds * 1000
+                           if previous_delay_seconds else base_ms)
+            delay_ms = self._uniform(base_ms, max(base_ms, previous_ms * 3))
+        else:
+            delay_ms = base_ms * 2 ** (attempt - 1) if retry_pol.exponential \
+                else base_ms
+            if cap_ms is not None:
+                delay_ms = min(delay_ms, cap_ms)
+            if retry_pol.jitter == FULL_JITTER:
+                delay_ms = self._uniform(0, delay_ms)
+            elif retry_pol.jitter == EQUAL_JITTER:
+                delay_ms = delay_ms / 2 + self._uniform(0, delay_ms / 2)
+        if cap_ms is not None:
+            delay_ms = min(delay_ms, cap_ms)
+
+        delay = delay_ms / 1000
+        if retry_pol.respect_retry_after and ex is not None:
+            retry_after = retry_after_seconds(ex)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+        return delay
@@ -1,7 +1,15 @@
+from resilience_full_impl.executor.adaptive_limit import build_limit
 from resilience_full_impl.observability.logging import logger
 from resilience_full_impl.observability.metrics import MetricsCollector
-from resilience_full_impl.policy.bulkhead_policy import BulkheadPolicy
+from resilience_full_impl.policy.bulkhead_policy import (BulkheadPolicy,
+                                                        Priority)
+import asyncio
 import threading
+import math
+import time
+from collections import deque
+
+QUEUE_DEPTH_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
 
 class BulkheadRejectedException(Exception):
     """
@@ -13,24 +21,220 @@ class BulkheadRejectedException(Exception):
 class Bulkhead:
     """
             Bulk Head Definition
+
+            The limit is max_concurrent_calls, or an adaptive limit
+            (BulkheadPolicy.adaptive_limit) moved by record_attempt() with
+            the round-trip time and outcome of every attempt that reached
+            the dependency.
+
+            When full, up to max_queue_length callers wait in FIFO order
+            for at most acquire_timeout seconds. release() hands the freed
+            slot straight to the oldest waiter and wakes it.
+
+            Each caller has a Priority. A class may only fill its share of
+            the limit (priority_utilization_limits); past it, the class is
+            shed at once instead of queued, keeping the remainder for more
+            critical work. Queued callers are served by priority, then
+            FIFO.
     """
     def __init__(self,
                  bulkhead_pol: BulkheadPolicy,
-                 metrics: MetricsCollector):
+                 metrics: MetricsCollector,
+                 name: str = "default"):
 
-        self._semaphore = threading.Semaphore(
-            bulkhead_pol.max_concurrent_calls
-        )
+        self._limiter = build_limit(bulkhead_pol)
+        self._limit = (self._limiter.limit if self._limiter is not None
+                       else bulkhead_pol.max_concurrent_calls)
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._waiters = [deque() for _ in Priority]
+        self._queued = 0
+        self._utilization_limits = (bulkhead_pol.priority_utilization_limits
+                                    or (1.0,) * len(Priority))
+        if len(self._utilization_limits) != len(Priority):
+            raise ValueError("[BULKHEAD] : priority_utilization_limits needs "
+                             "one share per Priority")
+        self._max_queue_length = bulkhead_pol.max_queue_length
+        self._acquire_timeout = bulkhead_pol.acquire_timeout
         self._metrics = metrics
+        self._name = name
+        if self._limiter is not None:
+            self._publish_limit()
 
-    def acquire(self, dependency_name: str):
+    @property
+    def limit(self) -> int:
+        """
+        Current concurrency limit
+        """
+        return self._limit
+
+    def acquire(self, dependency_name: str,
+                priority: Priority = Priority.NORMAL):
         """
 
         :param dependency_name:
+        :param priority: criticality of the request
         """
-        acquired = self._semaphore.acquire(blocking=False)
+        with self._lock:
+            class_limit = self._class_limit(priority)
+            if self._in_flight < class_limit and \
+                    not self._queued_ahead_of(priority):
+                self._in_flight += 1
+                return
+            shed = class_limit < self._limit
+            waiter = None
+            if not shed and self._queued < self._max_queue_length and \
+                    self._acquire_timeout > 0:
+                waiter = _Waiter()
+                self._waiters[priority].append(waiter)
+                self._queued += 1
+                queue_depth = self._queued
+
+        acquired = False
+        if waiter is not None:
+            acquired = self._wait_in_queue(waiter, priority, queue_depth,
+                                           dependency_name)
 
         if not acquired:
+            self._metrics.increment(
+                "bulkhead_rejections_total",
+                tags={"dependency_name":dependency_name,
+                      "priority":priority.name}
+
+            )
+            logger.warning(
+                "[BULKHEAD] : Bulkhead %s %s request due to : %s",
+                "shed" if shed else "Rejected", priority.name,
+                dependency_name)
+
+            raise BulkheadRejectedException("Bulkhead Limit Exceeded")
+
+    def _class_limit(self, priority: Priority) -> int:
+        """
+        Slots the priority class may fill; caller holds the lock
+        """
+        share = self._utilization_limits[priority]
+        if share >= 1.0:
+            return self._limit
+        return math.floor(self._limit * share)
+
+    def _queued_ahead_of(self, priority: Priority) -> bool:
+        """
+        Whether an equal or more critical caller is already waiting
+        """
+        return any(self._waiters[level] for level in range(priority + 1))
+
+    def _wait_in_queue(self, waiter: "_Waiter", priority: Priority,
+                       queue_depth: int, dependency_name: str) -> bool:
+        """
+        Block until release() grants the waiter a slot or the deadline
+        passes
+        :return: True when a slot was granted
+        """
+        tags = {"dependency_name": dependency_name}
+        self._metrics.observe("bulkhead_queue_depth", queue_depth, tags=tags,
+                              buckets=QUEUE_DEPTH_BUCKETS)
+        enqueued_at = time.monotonic()
+
+        waiter.event.wait(timeout=self._acquire_timeout)
+        with self._lock:
+            if not waiter.granted:
+                self._waiters[priority].remove(waiter)
+                self._queued -= 1
+
+        self._metrics.observe("bulkhead_queue_wait_seconds",
+                              time.monotonic() - enqueued_at, tags=tags)
+        return waiter.granted
+
+    def try_acquire(self) -> bool:
+        """
+        Take a slot if one is free and nobody is queued, without counting
+        a rejection
+        :return:
+        """
+        with self._lock:
+            if self._in_flight >= self._limit or self._queued:
+                return False
+            self._in_flight += 1
+            return True
+
+    def record_attempt(self, rtt_seconds: float, succeeded: bool):
+        """
+        Feed the adaptive limit with one attempt; leave out attempts that
+        never reached the dependency (circuit open, pool or rate limiter
+        rejections)
+        :param rtt_seconds: round-trip time of the attempt alone, without
+            backoff or queueing
+        :param succeeded:
+        """
+        if self._limiter is None:
+            return
+        with self._lock:
+            old_limit = self._limit
+            self._limit = self._limiter.on_sample(rtt_seconds, succeeded,
+                                                  self._in_flight)
+            if self._limit > old_limit:
+                self._grant_waiters()
+        if self._limit != old_limit:
+            self._publish_limit()
+
+    def release(self):
+        """
+               slot release
+        """
+        with self._lock:
+            self._in_flight -= 1
+            self._grant_waiters()
+
+    def _grant_waiters(self):
+        """
+        Hand free slots to queued callers, most critical first; caller
+        holds the lock
+        """
+        for priority in Priority:
+            waiters = self._waiters[priority]
+            while waiters and self._in_flight < self._class_limit(priority):
+                waiter = waiters.popleft()
+                waiter.granted = True
+                self._queued -= 1
+                self._in_flight += 1
+                waiter.event.set()
+
+    def _publish_limit(self):
+        self._metrics.set_gauge("bulkhead_concurrency_limit", self._limit,
+                                tags={"bulkhead": self._name})
+
+
+class _Waiter:
+    """
+    Caller queued for a bulkhead slot
+    """
+    __slots__ = ("event", "granted")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.granted = False
+
+
+class AsyncBulkhead:
+    """
+            Bulk Head Definition for asyncio callers
+    """
+    def __init__(self,
+                 bulkhead_pol: BulkheadPolicy,
+                 metrics: MetricsCollector):
+
+        self._semaphore = asyncio.Semaphore(
+            bulkhead_pol.max_concurrent_calls
+        )
+        self._metrics = metrics
+
+    async def acquire(self, dependency_name: str):
+        """
+        Take a slot without waiting, rejecting when none is free
+        :param dependency_name:
+        """
+        if self._semaphore.locked():
             self._metrics.increment(
                 "bulkhead_rejections_total",
                 tags={"dependency_name":dependency_name}
@@ -41,10 +245,10 @@ class Bulkhead:
 
             raise BulkheadRejectedException("Bulkhead Limit Exceeded")
 
+        await self._semaphore.acquire()
+
     def release(self):
         """
                semaphore release
         """
         self._semaphore.release()
-
-
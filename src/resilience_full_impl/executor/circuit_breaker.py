@@ -1,9 +1,12 @@
 import threading
-import time
 
 from resilience_full_impl.cancellation.exceptions import CancelledException
+from resilience_full_impl.clock import SYSTEM_CLOCK, Clock
+from resilience_full_impl.executor.sliding_window import (
+    WindowSnapshot, build_sliding_window)
 from resilience_full_impl.observability.logging import logger
 from resilience_full_impl.policy.cb_policy import CircuitBreakerPolicy
+from resilience_full_impl.timer_wheel import HashedTimerWheel
 
 
 class CircuitBreakerException(Exception):
@@ -16,17 +19,46 @@ class CircuitBreakerException(Exception):
 class CircuitBreaker:
     """
     Thread-safe Cancellation Aware circuit breaker
+
+    Without a sliding window it opens after failure_threshold consecutive
+    failures. With sliding_window_type set it opens when the failure rate
+    or slow-call rate of the window crosses its threshold, once
+    minimum_number_of_calls have been recorded.
+
+    HALF_OPEN hands out permitted_calls_in_half_open trial permits; other
+    callers fail fast. The circuit closes once half_open_success_threshold
+    trials succeed and re-opens once half_open_failure_threshold trials
+    fail, or when every trial finished without reaching the success quorum.
+
+    Read-mostly: a CLOSED check and a success that changes nothing read
+    _state without locking (a single attribute read is atomic). _lock is
+    taken only for failures and state transitions; window recording uses
+    the window's own lock.
+
+    OPEN -> HALF_OPEN happens on the first call after recovery_timeout,
+    or when the recovery timer fires if a timer_wheel is given.
     """
 
     CLOSED = "CLOSED"
     OPEN = "OPEN"
     HALF_OPEN = "HALF_OPEN"
 
-    def __init__(self, cb_pol_obj: CircuitBreakerPolicy):
+    def __init__(self, cb_pol_obj: CircuitBreakerPolicy,
+                 clock: Clock = SYSTEM_CLOCK,
+                 timer_wheel: HashedTimerWheel | None = None):
         self._cb_pol_obj = cb_pol_obj
+        self._clock = clock
+        self._timer_wheel = timer_wheel
+        self._recovery_timer = None
         self._state = self.CLOSED
         self._failure_count = 0
         self._last_failure_time = None
+        self._opened_at = None
+        self._half_open_permits = 0
+        self._half_open_successes = 0
+        self._half_open_failures = 0
+        self._window = build_sliding_window(cb_pol_obj,
+                                            clock=clock.monotonic)
         self._lock = threading.Lock()
 
     def before_execution(self):
@@ -34,40 +66,183 @@ class CircuitBreaker:
         Before execution
         :return:
         """
+        if self._state == self.CLOSED:
+            return
+
         with (self._lock):
             if self._state == self.OPEN:
-                if time.time() - self._last_failure_time >= \
+                if self._clock.monotonic() - self._opened_at >= \
                         self._cb_pol_obj.recovery_timeout:
-                    self._state = self.HALF_OPEN
+                    self._half_open()
                 else:
                     raise CircuitBreakerException("[CB]: Circuit is Still "
                                                   "OPEN")
 
-    def after_success(self):
+            if self._state == self.HALF_OPEN:
+                if self._half_open_permits >= \
+                        self._cb_pol_obj.permitted_calls_in_half_open:
+                    raise CircuitBreakerException("[CB]: Circuit is "
+                                                  "HALF_OPEN, no trial "
+                                                  "permits left")
+                self._half_open_permits += 1
+
+    def after_success(self, duration_seconds: float | None = None):
         """
         After execution
+        :param duration_seconds: attempt duration, used for slow-call rate
         :return:
         """
+        if self._window is None:
+            if self._state == self.CLOSED and self._failure_count == 0:
+                return
+            with self._lock:
+                if self._state == self.HALF_OPEN:
+                    self._record_trial(succeeded=True)
+                elif self._state == self.CLOSED:
+                    self._failure_count = 0
+            return
+
+        snapshot = self._window.record(
+            failed=False, slow=self._is_slow(duration_seconds))
+        if self._state == self.CLOSED and not self._should_trip(snapshot):
+            return
+
         with self._lock:
-            self._state = self.CLOSED
-            self._failure_count = 0
+            if self._state == self.HALF_OPEN:
+                self._record_trial(succeeded=True)
+            elif self._state == self.CLOSED and self._should_trip(snapshot):
+                self._open()
 
-    def after_failure(self, ex: Exception):
+    def after_failure(self, ex: Exception,
+                      duration_seconds: float | None = None):
         """
         After failure
         :param ex:
+        :param duration_seconds: attempt duration, used for slow-call rate
         :return:
         """
         if isinstance(ex, CancelledException):
-            return  # CANCEL SHOULD NOT TRIP CIRCUIT
+            # CANCEL SHOULD NOT TRIP CIRCUIT, but hands back a trial permit
+            self.release_permit()
+            return
 
         with self._lock:
             self._failure_count += 1
-            self._last_failure_time = time.time()
-
-            if self._failure_count >= self._cb_pol_obj.failure_threshold:
-                if self._state != self.OPEN:
-                    logger.warning(
-                        "[CB]: Circuit Breaker State Changed: OLD -> CLOSED "
-                        "|| NEW -> OPEN")
-                self._state = self.OPEN
+            self._last_failure_time = self._clock.monotonic()
+
+            if self._state == self.HALF_OPEN:
+                self._record_trial(succeeded=False)
+                return
+
+            if self._window is None:
+                if self._failure_count >= self._cb_pol_obj.failure_threshold:
+                    self._open()
+                return
+
+            snapshot = self._window.record(
+                failed=True, slow=self._is_slow(duration_seconds))
+            if self._should_trip(snapshot):
+                self._open()
+
+    def release_permit(self):
+        """
+        Hand back the trial permit of a call that never reached the
+        dependency; records no outcome
+        :return:
+        """
+        if self._state == self.HALF_OPEN:
+            with self._lock:
+                if self._state == self.HALF_OPEN and \
+                        self._half_open_permits > 0:
+                    self._half_open_permits -= 1
+
+    def _record_trial(self, succeeded: bool):
+        """
+        Apply the half-open quorum rules; caller holds the lock
+        :param succeeded:
+        """
+        policy = self._cb_pol_obj
+        success_quorum = (policy.half_open_success_threshold
+                          or policy.permitted_calls_in_half_open)
+        if succeeded:
+            self._half_open_successes += 1
+        else:
+            self._half_open_failures += 1
+
+        if self._half_open_failures >= policy.half_open_failure_threshold:
+            self._open()
+        elif self._half_open_successes >= success_quorum:
+            self._close()
+        elif self._half_open_successes + self._half_open_failures >= \
+                policy.permitted_calls_in_half_open:
+            self._open()
+
+    def _is_slow(self, duration_seconds: float | None) -> bool:
+        return (duration_seconds is not None and duration_seconds >=
+                self._cb_pol_obj.slow_call_duration_threshold)
+
+    def _should_trip(self, snapshot: WindowSnapshot) -> bool:
+        if snapshot.total_calls < self._cb_pol_obj.minimum_number_of_calls:
+            return False
+        return (snapshot.failure_rate >=
+                self._cb_pol_obj.failure_rate_threshold or
+                snapshot.slow_call_rate >=
+                self._cb_pol_obj.slow_call_rate_threshold)
+
+    def _open(self):
+        """
+        Move to OPEN and start the recovery timer; caller holds the lock
+        """
+        if self._state != self.OPEN:
+            logger.warning(
+                "[CB]: Circuit Breaker State Changed: OLD -> %s "
+                "|| NEW -> OPEN", self._state)
+        self._state = self.OPEN
+        self._opened_at = self._clock.monotonic()
+        if self._timer_wheel is not None:
+            self._cancel_recovery_timer()
+            self._recovery_timer = self._timer_wheel.schedule(
+                self._cb_pol_obj.recovery_timeout, self._on_recovery_timer)
+
+    def _on_recovery_timer(self):
+        """
+        Recovery timer fired: half-open without waiting for a call
+        """
+        with self._lock:
+            self._recovery_timer = None
+            if self._state == self.OPEN and \
+                    self._clock.monotonic() - self._opened_at >= \
+                    self._cb_pol_obj.recovery_timeout:
+                self._half_open()
+
+    def _cancel_recovery_timer(self):
+        """
+        Caller holds the lock
+        """
+        if self._recovery_timer is not None:
+            self._timer_wheel.cancel(self._recovery_timer)
+            self._recovery_timer = None
+
+    def _half_open(self):
+        """
+        Move to HALF_OPEN with a fresh set of trial permits; caller holds
+        the lock
+        """
+        logger.warning("[CB]: Circuit Breaker State Changed: OLD -> OPEN "
+                       "|| NEW -> HALF_OPEN")
+        self._cancel_recovery_timer()
+        self._state = self.HALF_OPEN
+        self._half_open_permits = 0
+        self._half_open_successes = 0
+        self._half_open_failures = 0
+
+    def _close(self):
+        """
+        Move to CLOSED with a fresh window; caller holds the lock
+        """
+        logger.warning("[CB]: Circuit Breaker State Changed: OLD -> %s "
+                       "|| NEW -> CLOSED", self._state)
+        self._state = self.CLOSED
+        self._failure_count = 0
+        if self._window is not None:
+            self._window.reset()
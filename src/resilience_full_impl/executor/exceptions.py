@@ -0,0 +1,5 @@
+class TimeoutException(Exception):
+    """
+    Exception raised when a timeout occurs
+    """
+    pass
@@ -22,3 +22,13 @@ class ExecutionContext:
         self.timeout_pol = timeout_pol
         self.cb = cb
         self.token = token
+
+    def attempt_timeout(self) -> float:
+        """
+        Per-attempt timeout clamped to what is left of the token deadline
+        :return:
+        """
+        remaining = self.token.remaining_seconds()
+        if remaining is None:
+            return self.timeout_pol.timeout_seconds
+        return min(self.timeout_pol.timeout_seconds, remaining)
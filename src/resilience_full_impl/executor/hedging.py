@@ -0,0 +1,73 @@
+"""
+    Hedging helpers - adaptive hedge delay and hedge budget
+"""
+import threading
+
+from resilience_full_impl.executor.latency_estimate import LatencyEstimate
+from resilience_full_impl.policy.hedge_policy import HedgePolicy
+
+
+class HedgeDelay:
+    """
+    Delay before a hedge is launched: fixed, or the observed latency
+    percentile over the last successful attempts
+    """
+
+    def __init__(self, hedge_pol: HedgePolicy):
+        self._hedge_pol = hedge_pol
+        self._estimate = (
+            LatencyEstimate(percentile=hedge_pol.latency_percentile,
+                            min_samples=hedge_pol.min_samples)
+            if hedge_pol.adaptive else None)
+
+    def observe(self, latency_seconds: float) -> None:
+        """
+
+        :param latency_seconds: duration of a successful attempt
+        :return:
+        """
+        if self._estimate is not None:
+            self._estimate.observe(latency_seconds)
+
+    def seconds(self) -> float:
+        """
+
+        :return: current hedge delay
+        """
+        adaptive_seconds = (self._estimate.seconds()
+                            if self._estimate is not None else None)
+        if adaptive_seconds is not None:
+            return adaptive_seconds
+        return self._hedge_pol.delay_ms / 1000
+
+
+class HedgeBudget:
+    """
+    Every attempt earns budget_percent / 100 of a hedge; a hedge spends
+    one. Unused budget is capped at what 100 attempts earn.
+    """
+
+    def __init__(self, hedge_pol: HedgePolicy):
+        self._ratio = hedge_pol.budget_percent / 100
+        self._cap = max(1.0, hedge_pol.budget_percent)
+        self._balance = self._cap
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        """
+
+        :return:
+        """
+        with self._lock:
+            self._balance = min(self._cap, self._balance + self._ratio)
+
+    def try_spend(self) -> bool:
+        """
+
+        :return: True when a hedge may be launched
+        """
+        with self._lock:
+            if self._balance < 1.0:
+                return False
+            self._balance -= 1.0
+            return True
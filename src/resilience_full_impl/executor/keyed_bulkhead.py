@@ -0,0 +1,229 @@
+"""
+    Keyed Bulkhead - one concurrency partition per tenant/route/host key
+"""
+import heapq
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable
+
+from resilience_full_impl.executor.bulkhead import BulkheadRejectedException
+from resilience_full_impl.observability.logging import logger
+from resilience_full_impl.observability.metrics import MetricsCollector
+from resilience_full_impl.policy.keyed_bulkhead_policy import \
+    KeyedBulkheadPolicy
+
+_EVICTION_PROBES = 8
+# gauges are republished after an eviction at most this often
+_PUBLISH_INTERVAL_SECONDS = 1.0
+
+
+class _Partition:
+    """
+    Concurrency state of one key
+    """
+    __slots__ = ("in_flight", "last_used")
+
+    def __init__(self, now: float):
+        self.in_flight = 0
+        self.last_used = now
+
+
+class HotKeys:
+    """
+    Space-Saving top-K counter: approximate hottest keys in O(K) memory
+
+    A min-heap of (count, seq, key) finds the coldest key in O(log K).
+    Increments push a new entry and leave the old one stale; stale entries
+    are skipped when popped and the heap is rebuilt once it holds twice
+    the tracked keys, so record() is O(log K) amortized.
+    """
+
+    def __init__(self, capacity: int):
+        self._capacity = capacity
+        self._counts: dict[Hashable, int] = {}
+        self._heap: list[tuple[int, int, Hashable]] = []
+        # tie-breaker, so keys themselves are never compared
+        self._seq = itertools.count()
+
+    def record(self, key: Hashable) -> None:
+        """
+
+        :param key:
+        :return:
+        """
+        if key in self._counts:
+            count = self._counts[key] + 1
+        elif len(self._counts) < self._capacity:
+            count = 1
+        else:
+            count = self._pop_coldest() + 1
+        self._counts[key] = count
+        heapq.heappush(self._heap, (count, next(self._seq), key))
+        if len(self._heap) > 2 * self._capacity:
+            self._heap = [(count, next(self._seq), key)
+                          for key, count in self._counts.items()]
+            heapq.heapify(self._heap)
+
+    def _pop_coldest(self) -> int:
+        """
+        Drop the key with the lowest count
+        :return: its count
+        """
+        while True:
+            count, _, key = heapq.heappop(self._heap)
+            if self._counts.get(key) == count:
+                del self._counts[key]
+                return count
+
+    def top(self, n: int | None = None) -> list[tuple[Hashable, int]]:
+        """
+
+        :param n:
+        :return: (key, approximate count), hottest first
+        """
+        ranked = sorted(self._counts.items(), key=lambda item: -item[1])
+        return ranked[:n]
+
+
+class KeyedBulkhead:
+    """
+    Bulkhead partitioned by key; each key gets
+    max_concurrent_calls_per_key slots.
+
+    The key table is an LRU bounded by max_keys: busy partitions are never
+    evicted, idle ones are dropped when the table is full or when they
+    have been idle for idle_eviction_seconds. acquire/release are O(1).
+    Metrics are per dependency, never per key; the hottest keys are
+    reported through a bounded top-K instead, republished after
+    evictions at most once per second.
+    """
+
+    def __init__(self, keyed_pol: KeyedBulkheadPolicy,
+                 metrics: MetricsCollector):
+        self._keyed_pol = keyed_pol
+        self._partitions: OrderedDict[Hashable, _Partition] = OrderedDict()
+        self._hot_keys = HotKeys(keyed_pol.hot_keys_tracked)
+        self._lock = threading.Lock()
+        self._metrics = metrics
+        self._evicted = False
+        self._published_at = None
+
+    def acquire(self, dependency_name: str, key: Hashable):
+        """
+
+        :param dependency_name:
+        :param key:
+        """
+        tags = {"dependency_name": dependency_name}
+        now = time.monotonic()
+        with self._lock:
+            self._hot_keys.record(key)
+            self._evict_idle(now, tags)
+            partition = self._partitions.get(key)
+            if partition is None:
+                if not self._make_room(tags):
+                    rejected = "table_full"
+                else:
+                    partition = self._partitions[key] = _Partition(now)
+                    rejected = None
+            else:
+                self._partitions.move_to_end(key)
+                rejected = None
+
+            if partition is not None:
+                if partition.in_flight < \
+                        self._keyed_pol.max_concurrent_calls_per_key:
+                    partition.in_flight += 1
+                    partition.last_used = now
+                else:
+                    rejected = "key_limit"
+            publish = self._evicted and (
+                self._published_at is None or
+                now - self._published_at >= _PUBLISH_INTERVAL_SECONDS)
+            if publish:
+                self._evicted = False
+                self._published_at = now
+
+        if publish:
+            self.publish(dependency_name)
+        if rejected is None:
+            return
+
+        self._metrics.increment("keyed_bulkhead_rejections_total",
+                                tags={**tags, "reason": rejected})
+        logger.warning("[BULKHEAD] : Keyed bulkhead rejected %s (%s)",
+                       dependency_name, rejected)
+        raise BulkheadRejectedException("Keyed Bulkhead Limit Exceeded")
+
+    def release(self, key: Hashable):
+        """
+
+        :param key:
+        """
+        with self._lock:
+            partition = self._partitions[key]
+            partition.in_flight -= 1
+            partition.last_used = time.monotonic()
+
+    def _evict_idle(self, now: float, tags: dict):
+        """
+        Drop the least recently used partition if it has gone idle; one
+        probe per acquire keeps the cost O(1). Caller holds the lock.
+        """
+        if not self._partitions:
+            return
+        key, partition = next(iter(self._partitions.items()))
+        if partition.in_flight == 0 and now - partition.last_used >= \
+                self._keyed_pol.idle_eviction_seconds:
+            del self._partitions[key]
+            self._evicted = True
+            self._metrics.increment("keyed_bulkhead_evictions_total",
+                                    tags={**tags, "reason": "idle"})
+
+    def _make_room(self, tags: dict) -> bool:
+        """
+        Evict an idle LRU partition when the table is full, probing a
+        bounded number of entries. Caller holds the lock.
+        :return: False when every probed partition is busy
+        """
+        if len(self._partitions) < self._keyed_pol.max_keys:
+            return True
+        for _ in range(min(_EVICTION_PROBES, len(self._partitions))):
+            key, partition = next(iter(self._partitions.items()))
+            if partition.in_flight == 0:
+                del self._partitions[key]
+                self._evicted = True
+                self._metrics.increment("keyed_bulkhead_evictions_total",
+                                        tags={**tags, "reason": "lru"})
+                return True
+            self._partitions.move_to_end(key)
+        return False
+
+    def publish(self, dependency_name: str):
+        """
+        Gauges for the table size and the hottest keys' share of traffic,
+        tagged by rank so the series count stays bounded
+        :param dependency_name:
+        """
+        tags = {"dependency_name": dependency_name}
+        with self._lock:
+            size = len(self._partitions)
+            hot = self._hot_keys.top()
+        self._metrics.set_gauge("keyed_bulkhead_keys", size, tags=tags)
+        for rank, (_, count) in enumerate(hot, start=1):
+            self._metrics.set_gauge("keyed_bulkhead_hot_key_calls", count,
+                                    tags={**tags, "rank": str(rank)})
+
+    def hot_keys(self, n: int | None = None) -> list[tuple[Hashable, int]]:
+        """
+        Hottest keys with their approximate call counts
+        :param n:
+        :return:
+        """
+        with self._lock:
+            return self._hot_keys.top(n)
+
+    def __len__(self) -> int:
+        return len(self._partitions)
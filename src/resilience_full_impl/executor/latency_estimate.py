@@ -0,0 +1,74 @@
+"""
+    Latency Estimate - percentile of recent attempt latencies
+"""
+import threading
+from collections import deque
+
+_LATENCY_SAMPLES = 256
+_RECOMPUTE_EVERY = 32
+
+
+class LatencyEstimate:
+    """
+    Percentile over the last successful attempts, recomputed every
+    _RECOMPUTE_EVERY samples so observe() stays cheap
+    """
+
+    def __init__(self, percentile: float = 50.0, min_samples: int = 20):
+        self._percentile = percentile
+        self._min_samples = min_samples
+        self._samples = deque(maxlen=_LATENCY_SAMPLES)
+        self._since_recompute = 0
+        self._estimate = None
+        self._lock = threading.Lock()
+
+    def observe(self, latency_seconds: float) -> None:
+        """
+
+        :param latency_seconds:
+        :return:
+        """
+        with self._lock:
+            self._samples.append(latency_seconds)
+            self._since_recompute += 1
+            if len(self._samples) >= self._min_samples and (
+                    self._estimate is None or
+                    self._since_recompute >= _RECOMPUTE_EVERY):
+                ordered = sorted(self._samples)
+                rank = int(len(ordered) * self._percentile / 100)
+                self._estimate = ordered[min(rank, len(ordered) - 1)]
+                self._since_recompute = 0
+
+    def seconds(self) -> float | None:
+        """
+
+        :return: None until min_samples were observed
+        """
+        return self._estimate
+
+
+class LatencyEstimates:
+    """
+    LatencyEstimate per dependency, created on first use; shared by the
+    sync and async executors
+    """
+
+    def __init__(self, percentile: float = 50.0, min_samples: int = 20):
+        self._percentile = percentile
+        self._min_samples = min_samples
+        self._estimates = {}
+        self._lock = threading.Lock()
+
+    def for_dependency(self, dependency_name: str) -> LatencyEstimate:
+        """
+
+        :param dependency_name:
+        :return: estimate of the dependency's successful attempts
+        """
+        estimate = self._estimates.get(dependency_name)
+        if estimate is None:
+            with self._lock:
+                estimate = self._estimates.setdefault(
+                    dependency_name,
+                    LatencyEstimate(self._percentile, self._min_samples))
+        return estimate
@@ -0,0 +1,160 @@
+"""
+    Rate Limiter - token bucket and GCRA, refilled lazily on each call
+
+    resilience_patterns_observability.core.rate_limiter holds the same
+    algorithms: the two packages ship separately and never import each
+    other, so change both together.
+"""
+import threading
+import time
+from typing import Callable
+
+from resilience_full_impl.cancellation.cancellation_token import \
+    CancellationToken
+from resilience_full_impl.observability.logging import logger
+from resilience_full_impl.observability.metrics import MetricsCollector
+from resilience_full_impl.policy.rate_limiter_policy import (
+    GCRA, TOKEN_BUCKET, RateLimiterPolicy)
+
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+# absorbs float rounding in refill arithmetic
+_EPSILON_SECONDS = 1e-9
+
+
+class RateLimitExceededException(Exception):
+    """
+        Raised when no permit is available within the allowed wait
+    """
+    pass
+
+
+class TokenBucket:
+    """
+    Holds up to burst tokens, refilled at rate tokens per second. A caller
+    willing to wait reserves a future token, so the balance may go
+    negative and later callers queue behind it.
+    """
+
+    def __init__(self, rate: float, burst: int, now: float):
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = now
+
+    def reserve(self, now: float, max_wait: float) -> float | None:
+        """
+
+        :param now:
+        :param max_wait:
+        :return: seconds to wait for the permit, None when that exceeds
+            max_wait (nothing is reserved then)
+        """
+        self._tokens = min(self._burst,
+                           self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+        wait = max(0.0, (1.0 - self._tokens) / self._rate)
+        if wait > max_wait + _EPSILON_SECONDS:
+            return None
+        self._tokens -= 1.0
+        return wait
+
+
+class GCRALimit:
+    """
+    Generic Cell Rate Algorithm: a single theoretical arrival time (TAT)
+    per limiter. A call conforms while TAT is at most
+    (burst - 1) emission intervals ahead of now.
+    """
+
+    def __init__(self, rate: float, burst: int, now: float):
+        self._interval = 1.0 / rate
+        self._tolerance = (burst - 1) * self._interval
+        self._tat = now
+
+    def reserve(self, now: float, max_wait: float) -> float | None:
+        """
+
+        :param now:
+        :param max_wait:
+        :return: seconds to wait for the permit, None when that exceeds
+            max_wait (nothing is reserved then)
+        """
+        tat = max(self._tat, now)
+        wait = max(0.0, tat - self._tolerance - now)
+        if wait > max_wait + _EPSILON_SECONDS:
+            return None
+        self._tat = tat + self._interval
+        return wait
+
+
+class RateLimiter:
+    """
+    Rate limiter over the configured algorithm. No background thread:
+    state catches up with the clock whenever a permit is requested.
+    """
+
+    def __init__(self,
+                 rate_limiter_pol: RateLimiterPolicy,
+                 metrics: MetricsCollector,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        if rate_limiter_pol.rate_per_second <= 0 or \
+                rate_limiter_pol.burst < 1:
+            raise ValueError("[RATE_LIMITER] : rate_per_second must be > 0 "
+                             "and burst >= 1")
+        algorithms = {TOKEN_BUCKET: TokenBucket, GCRA: GCRALimit}
+        if rate_limiter_pol.algorithm not in algorithms:
+            raise ValueError(f"[RATE_LIMITER] : unknown algorithm "
+                             f"{rate_limiter_pol.algorithm}")
+        self._rate_limiter_pol = rate_limiter_pol
+        self._clock = clock
+        self._sleep = sleep
+        self._algorithm = algorithms[rate_limiter_pol.algorithm](
+            rate_limiter_pol.rate_per_second, rate_limiter_pol.burst,
+            clock())
+        self._lock = threading.Lock()
+        self._metrics = metrics
+
+    def try_acquire(self) -> bool:
+        """
+        Fail-fast permit
+        :return: True when a permit was taken
+        """
+        with self._lock:
+            return self._algorithm.reserve(self._clock(), 0.0) is not None
+
+    def acquire(self, dependency_name: str,
+                max_wait_seconds: float | None = None,
+                token: CancellationToken | None = None):
+        """
+        Take a permit, blocking up to max_wait_seconds (policy default)
+
+        :param dependency_name:
+        :param max_wait_seconds:
+        :param token: never wait past its deadline; cancelling it ends the
+            wait with CancelledException
+        """
+        if max_wait_seconds is None:
+            max_wait_seconds = self._rate_limiter_pol.max_wait_seconds
+        remaining = token.remaining_seconds() if token is not None else None
+        if remaining is not None:
+            max_wait_seconds = min(max_wait_seconds, remaining)
+        tags = {"dependency_name": dependency_name}
+        with self._lock:
+            wait = self._algorithm.reserve(self._clock(),
+                                           max(0.0, max_wait_seconds))
+
+        if wait is None:
+            self._metrics.increment("rate_limiter_rejections_total",
+                                    tags=tags)
+            logger.warning("[RATE_LIMITER] : Rate limit exceeded for %s",
+                           dependency_name)
+            raise RateLimitExceededException("Rate Limit Exceeded")
+
+        if wait > 0:
+            self._metrics.observe("rate_limiter_wait_seconds", wait,
+                                  tags=tags, buckets=WAIT_BUCKETS)
+            if token is None:
+                self._sleep(wait)
+            elif token.wait(wait):
+                token.throw_if_cancelled()
@@ -2,37 +2,52 @@
     Resilience Executor for retry, timeout
 """
 import threading
-import time
+from concurrent.futures import FIRST_COMPLETED, wait
 from typing import TypeVar, Callable
 
 from resilience_full_impl.cancellation.cancellation_token import \
     CancellationToken
 from resilience_full_impl.cancellation.exceptions import CancelledException
+from resilience_full_impl.clock import SYSTEM_CLOCK, Clock
+from resilience_full_impl.executor.attempt_pool import (
+    AttemptPool, AttemptPoolExhaustedException)
+from resilience_full_impl.executor.backoff import Backoff
 from resilience_full_impl.executor.bulkhead import Bulkhead
 from resilience_full_impl.executor.circuit_breaker import CircuitBreaker
+from resilience_full_impl.executor.exceptions import TimeoutException
 from resilience_full_impl.executor.execution_context import \
     ExecutionContext
+from resilience_full_impl.executor.hedging import HedgeBudget, HedgeDelay
+from resilience_full_impl.executor.keyed_bulkhead import KeyedBulkhead
+from resilience_full_impl.executor.latency_estimate import \
+    LatencyEstimates
+from resilience_full_impl.executor.rate_limiter import RateLimiter
+from resilience_full_impl.executor.retry_budget import RetryBudget
+from resilience_full_impl.executor.single_flight import SingleFlight
 from resilience_full_impl.observability.metrics import MetricsCollector
-from resilience_full_impl.observability.tracing import start_span
+from resilience_full_impl.observability.tracing import NoopTracer, Tracer
 from resilience_full_impl.policy.cb_policy import CircuitBreakerPolicy
+from resilience_full_impl.policy.hedge_policy import HedgePolicy
+from resilience_full_impl.policy.keyed_bulkhead_policy import \
+    KeyedBulkheadPolicy
+from resilience_full_impl.policy.rate_limiter_policy import \
+    RateLimiterPolicy
+from resilience_full_impl.policy.retry_budget_policy import \
+    RetryBudgetPolicy
 from resilience_full_impl.policy.retry_policy import RetryPolicy
 from resilience_full_impl.policy.timeout_policy import TimeoutPolicy
 from resilience_full_impl.executor.circuit_breaker import \
                 CircuitBreakerException
 
-from resilience_full_impl.policy.bulkhead_policy import BulkheadPolicy
+from resilience_full_impl.policy.bulkhead_policy import (BulkheadPolicy,
+                                                        Priority)
+from resilience_full_impl.timer_wheel import (TIMER_WHEEL,
+                                           HashedTimerWheel)
 
 
 T = TypeVar("T")
 
 
-class TimeoutException(Exception):
-    """
-    Exception raised when a timeout occurs
-    """
-    pass
-
-
 class ResilienceExecutor:
     """
          Implements ResilienceExecutor for retry, timeout
@@ -40,39 +55,241 @@ class ResilienceExecutor:
 
     def __init__(self, retry_policy: RetryPolicy,
                  cb_policy: CircuitBreakerPolicy,
-                 bulk_head_policy: BulkheadPolicy ):
+                 bulk_head_policy: BulkheadPolicy,
+                 max_abandoned_attempts: int | None = None,
+                 hedge_policy: HedgePolicy | None = None,
+                 keyed_bulkhead_policy: KeyedBulkheadPolicy | None = None,
+                 rate_limiter_policy: RateLimiterPolicy | None = None,
+                 retry_budget_policy: RetryBudgetPolicy | None = None,
+                 clock: Clock = SYSTEM_CLOCK,
+                 timer_wheel: HashedTimerWheel | None = None,
+                 metrics: MetricsCollector | None = None,
+                 tracer: Tracer | NoopTracer | None = None):
+        """
+
+        :param retry_policy:
+        :param cb_policy:
+        :param bulk_head_policy:
+        :param max_abandoned_attempts: timed-out attempts allowed to keep
+            running before new attempts are rejected; defaults to
+            max_concurrent_calls
+        :param hedge_policy: launch duplicate attempts for slow calls
+        :param keyed_bulkhead_policy: per-key partitions in front of the
+            shared bulkhead, used when execute() gets a partition_key
+        :param rate_limiter_policy: cap on outgoing attempts per second;
+            every attempt, retries included, takes a permit
+        :param retry_budget_policy: share of requests each dependency may
+            retry; retries past it fail fast with the last error
+        :param clock: time source for deadlines, durations and backoff
+        :param timer_wheel: fires token deadlines, backoff wake-ups and
+            circuit recovery; defaults to the shared TIMER_WHEEL
+        :param metrics: defaults to a new MetricsCollector; pass
+            NoopMetricsCollector() to turn metrics off
+        :param tracer: defaults to a Tracer on clock; pass NOOP_TRACER to
+            turn tracing off
+        """
         self._retry_policy = retry_policy
-        self._cb_obj = CircuitBreaker(cb_pol_obj=cb_policy)
-        self._metrics = MetricsCollector()
+        self._clock = clock
+        self._backoff = Backoff(retry_policy)
+        # p50 of each dependency's successful attempts
+        self._attempt_latencies = LatencyEstimates()
+        self._timer_wheel = timer_wheel or (
+            TIMER_WHEEL if clock is SYSTEM_CLOCK
+            else HashedTimerWheel(clock=clock, autostart=False))
+        self._cb_obj = CircuitBreaker(cb_pol_obj=cb_policy, clock=clock,
+                                      timer_wheel=self._timer_wheel)
+        self._metrics = metrics if metrics is not None else MetricsCollector()
+        # bound once: a disabled tracer or collector costs a call per site
+        self._start_span = (tracer or Tracer(clock)).start_span
+        self._attempt_counters = {}
         self._bulkhead = Bulkhead(bulkhead_pol=bulk_head_policy,
                                   metrics=self._metrics)
-        
-
-    def _sleep_before_next_attempt(self, attempt: int) -> None:
-        delay_ms = self._retry_policy.retry_interval_ms
+        self._attempt_pool = AttemptPool(
+            max_workers=bulk_head_policy.max_concurrent_calls,
+            max_abandoned=(max_abandoned_attempts
+                           if max_abandoned_attempts is not None
+                           else bulk_head_policy.max_concurrent_calls),
+            metrics=self._metrics)
+        self._single_flight = SingleFlight(metrics=self._metrics)
+        self._hedge_policy = hedge_policy
+        self._hedge_states = {}
+        self._hedge_states_lock = threading.Lock()
+        self._keyed_bulkhead = (
+            KeyedBulkhead(keyed_bulkhead_policy, metrics=self._metrics)
+            if keyed_bulkhead_policy is not None else None)
+        self._rate_limiter = (
+            RateLimiter(rate_limiter_policy, metrics=self._metrics,
+                        clock=clock.monotonic, sleep=clock.sleep)
+            if rate_limiter_policy is not None else None)
+        self._retry_budget_policy = retry_budget_policy
+        self._retry_budgets = {}
+        self._retry_budgets_lock = threading.Lock()
+
+    def shutdown(self) -> None:
+        """
+        Release the pooled attempt workers
+        :return:
+        """
+        self._attempt_pool.shutdown()
 
-        if self._retry_policy.exponential:
-            delay_ms = delay_ms * 2 ** (attempt - 1)
+    def _retry_budget(self, dependency_name: str) -> RetryBudget | None:
+        """
+        Budget shared by every call to the dependency, created on first use
+        :param dependency_name:
+        :return:
+        """
+        if self._retry_budget_policy is None:
+            return None
+        budget = self._retry_budgets.get(dependency_name)
+        if budget is None:
+            with self._retry_budgets_lock:
+                budget = self._retry_budgets.setdefault(
+                    dependency_name,
+                    RetryBudget(self._retry_budget_policy,
+                                clock=self._clock.monotonic))
+        return budget
+
+    def _hedge_state(self, dependency_name: str
+                     ) -> tuple[HedgeDelay, HedgeBudget]:
+        """
+        Hedge delay and budget of the dependency, created on first use, so
+        a slow dependency neither sets the delay of a fast one nor spends
+        its budget
+        :param dependency_name:
+        :return:
+        """
+        state = self._hedge_states.get(dependency_name)
+        if state is None:
+            with self._hedge_states_lock:
+                state = self._hedge_states.setdefault(
+                    dependency_name,
+                    (HedgeDelay(self._hedge_policy),
+                     HedgeBudget(self._hedge_policy)))
+        return state
+
+    def _sleep_before_next_attempt(self, attempt: int,
+                                  previous_delay: float | None,
+                                  ex: Exception,
+                                  ctx: ExecutionContext,
+                                  dependency_name: str) -> float | None:
+        """
+        Back off before the next attempt, unless what is left of the token
+        deadline cannot cover the backoff plus a typical (p50) attempt
 
-        time.sleep(delay_ms / 1000)
+        :param attempt: attempt that just failed
+        :param previous_delay: previous backoff of this call, in seconds
+        :param ex: error of the failed attempt, for Retry-After
+        :param ctx:
+        :param dependency_name:
+        :return: the delay slept in seconds, None when the retry is skipped
+        """
+        delay = self._backoff.delay_seconds(attempt, previous_delay, ex)
+        remaining = ctx.token.remaining_seconds()
+        if remaining is not None:
+            typical = self._attempt_latencies.for_dependency(
+                dependency_name).seconds() or 0.0
+            if delay + typical >= remaining:
+                self._metrics.increment(
+                    "retry_deadline_skipped_total",
+                    tags={"dependency_name": dependency_name,
+                          "reason": ("backoff" if delay >= remaining
+                                     else "latency")})
+                return None
+        self._timer_wheel.sleep(delay, ctx.token)
+        return delay
+
+    def _attempt_counter(self, dependency_name: str):
+        """
+        retry_attempts_total handle of the dependency
+        :param dependency_name:
+        :return:
+        """
+        counter = self._attempt_counters.get(dependency_name)
+        if counter is None:
+            counter = self._attempt_counters.setdefault(
+                dependency_name,
+                self._metrics.counter("retry_attempts_total",
+                                      tags={"Dependency": dependency_name}))
+        return counter
 
     def execute(self,
                 func: Callable[[CancellationToken], T],
                 timeout_policy: TimeoutPolicy,
-                dependency_name: str) -> T:
+                dependency_name: str,
+                coalesce_key: str | None = None,
+                priority: Priority = Priority.NORMAL,
+                partition_key: str | None = None) -> T:
         """
 
         :param dependency_name:
         :param func:
         :param timeout_policy:
+        :param coalesce_key: opt-in single-flight key; concurrent calls to
+            the same dependency with the same key share one execution
+        :param priority: criticality used by the bulkhead to shed load
+        :param partition_key: tenant/route/host key for the keyed bulkhead
         :return:
         """
         self._validate_policies(self._retry_policy, timeout_policy)
+        if coalesce_key is None:
+            return self._execute_partitioned(func, timeout_policy,
+                                             dependency_name, priority,
+                                             partition_key)
+
+        return self._single_flight.do(
+            (dependency_name, coalesce_key),
+            lambda: self._execute_partitioned(func, timeout_policy,
+                                              dependency_name, priority,
+                                              partition_key),
+            dependency_name=dependency_name,
+            timeout_seconds=timeout_policy.timeout_seconds)
+
+    def _execute_partitioned(self,
+                             func: Callable[[CancellationToken], T],
+                             timeout_policy: TimeoutPolicy,
+                             dependency_name: str,
+                             priority: Priority,
+                             partition_key: str | None) -> T:
+        """
+        Hold the key's partition slot, when one applies, around the call
+
+        :param func:
+        :param timeout_policy:
+        :param dependency_name:
+        :param priority:
+        :param partition_key:
+        :return:
+        """
+        if self._keyed_bulkhead is None or partition_key is None:
+            return self._execute(func, timeout_policy, dependency_name,
+                                 priority)
+
+        self._keyed_bulkhead.acquire(dependency_name, partition_key)
+        try:
+            return self._execute(func, timeout_policy, dependency_name,
+                                 priority)
+        finally:
+            self._keyed_bulkhead.release(partition_key)
+
+    def _execute(self,
+                 func: Callable[[CancellationToken], T],
+                 timeout_policy: TimeoutPolicy,
+                 dependency_name: str,
+                 priority: Priority) -> T:
+        """
+
+        :param dependency_name:
+        :param func:
+        :param timeout_policy:
+        :param priority:
+        :return:
+        """
         token = CancellationToken(
-            deadline_seconds=timeout_policy.timeout_seconds)
+            deadline_seconds=timeout_policy.timeout_seconds, clock=self._clock,
+            timer_wheel=self._timer_wheel)
 
-        with start_span("request", dependency=dependency_name):
-            self._bulkhead.acquire(dependency_name)
+        with self._start_span("request", dependency=dependency_name):
+            self._bulkhead.acquire(dependency_name, priority)
 
             try:
 
@@ -83,6 +300,7 @@ class ResilienceExecutor:
 
                 return self._execute_with_retry(func, ctx, dependency_name)
             finally:
+                token.close()
                 self._bulkhead.release()
                 
     def _execute_with_retry(self, func: Callable[[CancellationToken], T],
@@ -95,76 +313,210 @@ class ResilienceExecutor:
         :return: 
         """
         last_exception = None
+        delay = None
+        retry_budget = self._retry_budget(dependency_name)
+        if retry_budget is not None:
+            retry_budget.record_request()
+        attempt_counter = self._attempt_counter(dependency_name)
 
         for attempt in range(1, self._retry_policy.max_attempts + 1):
-            with start_span("retry_attempt", attempt=attempt) as span:
-                self._metrics.increment(
-                    "retry_attempts_total",
-                    tags={"Dependency":dependency_name}
-                )
+            with self._start_span("retry_attempt", attempt=attempt):
+                attempt_counter.inc()
 
             ctx.token.throw_if_cancelled()
 
-            with start_span("circuit_breaker_check"):
+            if self._rate_limiter is not None:
+                with self._start_span("rate_limiter_acquire"):
+                    self._rate_limiter.acquire(dependency_name,
+                                               token=ctx.token)
+
+            with self._start_span("circuit_breaker_check"):
                 ctx.cb.before_execution()
 
 
+            started = self._clock.monotonic()
             try:
-                result_success = self._execute_with_timeout(func, ctx)
-                ctx.cb.after_success()
+                result_success = self._execute_with_timeout(
+                    func, ctx, dependency_name)
+                duration = self._clock.monotonic() - started
+                ctx.cb.after_success(duration)
+                self._bulkhead.record_attempt(duration, succeeded=True)
+                self._attempt_latencies.for_dependency(
+                    dependency_name).observe(duration)
                 return result_success
 
-            except (CircuitBreakerException, CancelledException,) as e:
+            except CircuitBreakerException:
+                raise
+
+            except AttemptPoolExhaustedException:
+                # rejected locally, the dependency was never called
+                ctx.cb.release_permit()
+                raise
+
+            except CancelledException as e:
+                ctx.cb.after_failure(e)
                 raise
 
             except Exception as e:
                 last_exception = e
-                ctx.cb.after_failure(e)
+                duration = self._clock.monotonic() - started
+                ctx.cb.after_failure(e, duration)
+                self._bulkhead.record_attempt(duration, succeeded=False)
 
             if attempt == ctx.retry_pol.max_attempts:
                 break
 
-            self._sleep_before_next_attempt(attempt)
+            if retry_budget is not None and not retry_budget.try_spend():
+                self._metrics.increment(
+                    "retry_budget_exhausted_total",
+                    tags={"dependency_name": dependency_name})
+                break
+
+            delay = self._sleep_before_next_attempt(
+                attempt, delay, last_exception, ctx, dependency_name)
+            if delay is None:
+                break
         raise last_exception
 
     def _execute_with_timeout(self, func: Callable[[CancellationToken], T],
-                              ctx: ExecutionContext) -> T:
+                              ctx: ExecutionContext,
+                              dependency_name: str) -> T:
         """
         
         :param func:
         :param ctx:
+        :param dependency_name:
         :return:
         """
 
-        with start_span("timeout_execution",
-                        timeout_seconds=ctx.timeout_pol.timeout_seconds,
-                        ):
-
-            result_container = {}
-            exception_container = {}
+        timeout_seconds = ctx.attempt_timeout()
+        with self._start_span("timeout_execution",
+                              timeout_seconds=timeout_seconds,
+                              ):
+            if self._hedge_policy is not None:
+                return self._execute_hedged(func, ctx, dependency_name)
 
-            def target():
-                """
-                     Target method for executing function
-                """
-                try:
-                    result_container["result"] = func(ctx.token)
-                except Exception as e:
-                    exception_container["exception"] = e
-
-            thread = threading.Thread(target=target, daemon=True)
-            thread.start()
-            thread.join(timeout=ctx.timeout_pol.timeout_seconds)
-            if thread.is_alive():
-                ctx.token.cancel()
+            token = ctx.token.child(deadline_seconds=timeout_seconds)
+            future = self._attempt_pool.submit(func, token)
+            try:
+                return future.result(timeout=timeout_seconds)
+            except TimeoutError:
+                if future.done():
+                    # finished just after the wait gave up, or the call
+                    # itself raised TimeoutError
+                    return future.result()
+                token.cancel()
+                self._attempt_pool.abandon(future)
                 raise TimeoutException(f"Timed out after "
-                                       f"{ctx.timeout_pol.timeout_seconds} "
-                                       f"seconds")
+                                       f"{timeout_seconds} seconds")
+            finally:
+                token.close()
 
-            if "exception" in exception_container:
-                raise exception_container["exception"]
+    def _execute_hedged(self, func: Callable[[CancellationToken], T],
+                        ctx: ExecutionContext,
+                        dependency_name: str) -> T:
+        """
+        Run the attempt and, while it is slower than the hedge delay, launch
+        duplicates. The first success wins and the losers are cancelled
+        through their own child CancellationToken and released, not counted
+        as abandoned. Every hedge holds a bulkhead slot until it returns and
+        spends hedge budget.
 
-            return result_container.get("result")
+        :param func:
+        :param ctx:
+        :param dependency_name:
+        :return:
+        """
+        tags = {"dependency_name": dependency_name}
+        timeout_seconds = ctx.attempt_timeout()
+        deadline = self._clock.monotonic() + timeout_seconds
+        attempts = {}
+
+        def launch(is_hedge: bool):
+            token = ctx.token.child(
+                deadline_seconds=deadline - self._clock.monotonic())
+            future = self._attempt_pool.submit(func, token)
+            attempts[future] = (token, self._clock.monotonic(), is_hedge)
+            return future
+
+        hedge_delay, hedge_budget = self._hedge_state(dependency_name)
+        hedge_budget.deposit()
+        pending = {launch(is_hedge=False)}
+        hedges = 0
+        # cleared once the budget, the bulkhead or the pool refuses a hedge
+        hedging = True
+        won = False
+        next_hedge_at = (self._clock.monotonic()
+                         + hedge_delay.seconds())
+        last_exception = None
+
+        try:
+            while pending:
+                now = self._clock.monotonic()
+                if now >= deadline:
+                    break
+                can_hedge = hedging and \
+                    hedges < self._hedge_policy.max_hedges
+                wake_at = min(deadline, next_hedge_at) if can_hedge \
+                    else deadline
+                done, pending = wait(pending, timeout=max(0.0, wake_at - now),
+                                     return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    if future.exception() is not None:
+                        last_exception = future.exception()
+                        continue
+                    _, launched_at, is_hedge = attempts[future]
+                    hedge_delay.observe(
+                        self._clock.monotonic() - launched_at)
+                    if is_hedge:
+                        self._metrics.increment("hedge_wins_total", tags=tags)
+                    won = True
+                    return future.result()
+
+                if not pending or not can_hedge or \
+                        self._clock.monotonic() < next_hedge_at:
+                    continue
+
+                if not hedge_budget.try_spend():
+                    self._metrics.increment("hedge_budget_exhausted_total",
+                                            tags=tags)
+                    hedging = False
+                    continue
+                if not self._bulkhead.try_acquire():
+                    self._metrics.increment(
+                        "hedge_bulkhead_rejections_total", tags=tags)
+                    hedging = False
+                    continue
+                try:
+                    hedge = launch(is_hedge=True)
+                except AttemptPoolExhaustedException:
+                    self._bulkhead.release()
+                    hedging = False
+                    continue
+                hedge.add_done_callback(lambda _: self._bulkhead.release())
+                pending.add(hedge)
+                hedges += 1
+                self._metrics.increment("hedge_attempts_total", tags=tags)
+                next_hedge_at = (self._clock.monotonic()
+                                 + hedge_delay.seconds())
+
+            if not pending and last_exception is not None:
+                raise last_exception
+
+            ctx.token.cancel()
+            raise TimeoutException(f"Timed out after {timeout_seconds} "
+                                   f"seconds")
+        finally:
+            for future, (token, _, _) in attempts.items():
+                if future.done():
+                    token.close()
+                    continue
+                token.cancel()
+                if won:
+                    self._attempt_pool.release(future)
+                else:
+                    self._attempt_pool.abandon(future)
 
     def _validate_policies(self, retry_policy: RetryPolicy,
                            timeout_policy: TimeoutPolicy) -> None:
@@ -0,0 +1,55 @@
+"""
+    Retry Budget - caps retries to a share of requests per dependency
+"""
+import threading
+import time
+from typing import Callable
+
+from resilience_full_impl.executor.sliding_window import \
+    TimeBasedSlidingWindow
+from resilience_full_impl.policy.retry_budget_policy import \
+    RetryBudgetPolicy
+
+
+class RetryBudget:
+    """
+    Counts requests and retries over the last window_seconds, each on a
+    TimeBasedSlidingWindow of one-second buckets. A retry is allowed while
+
+        retries < min_retries_per_second * window_seconds
+                  + retry_ratio * requests
+    """
+
+    def __init__(self, retry_budget_pol: RetryBudgetPolicy,
+                 clock: Callable[[], float] = time.monotonic):
+        if retry_budget_pol.window_seconds <= 0:
+            raise ValueError("[RETRY] : retry budget window_seconds <= 0")
+        self._retry_budget_pol = retry_budget_pol
+        self._requests = TimeBasedSlidingWindow(
+            retry_budget_pol.window_seconds, clock=clock)
+        self._retries = TimeBasedSlidingWindow(
+            retry_budget_pol.window_seconds, clock=clock)
+        # makes the check and the spend in try_spend one step
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        """
+
+        :return:
+        """
+        self._requests.record(failed=False, slow=False)
+
+    def try_spend(self) -> bool:
+        """
+        Take one retry from the budget
+        :return: False when the budget is exhausted
+        """
+        policy = self._retry_budget_pol
+        with self._lock:
+            allowed = (policy.min_retries_per_second * policy.window_seconds
+                       + policy.retry_ratio
+                       * self._requests.snapshot().total_calls)
+            if self._retries.snapshot().total_calls >= allowed:
+                return False
+            self._retries.record(failed=False, slow=False)
+            return True
@@ -0,0 +1,80 @@
+"""
+    Single-flight request coalescing
+"""
+import threading
+from typing import Callable, Hashable, TypeVar
+
+from resilience_full_impl.executor.exceptions import TimeoutException
+from resilience_full_impl.observability.metrics import MetricsCollector
+
+T = TypeVar("T")
+
+
+class _InFlightCall:
+    """
+    Outcome of one shared execution
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.exception = None
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls with the same key into one execution.
+
+    The first caller (leader) runs the function; callers arriving while it
+    is in flight wait for the leader and receive its result or exception.
+    The key is forgotten as soon as the leader finishes, so nothing is
+    cached.
+    """
+
+    def __init__(self, metrics: MetricsCollector):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _InFlightCall] = {}
+        self._metrics = metrics
+
+    def do(self, key: Hashable, func: Callable[[], T],
+           dependency_name: str,
+           timeout_seconds: float | None = None) -> T:
+        """
+
+        :param key: calls sharing this key are coalesced
+        :param func: execution shared by the leader and its followers
+        :param dependency_name:
+        :param timeout_seconds: how long a follower waits for the leader
+        :return:
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _InFlightCall()
+                self._calls[key] = call
+
+        if not leader:
+            self._metrics.increment(
+                "single_flight_coalesced_total",
+                tags={"dependency_name": dependency_name})
+            if not call.done.wait(timeout=timeout_seconds):
+                raise TimeoutException(
+                    f"[SINGLE_FLIGHT] : shared call for {dependency_name} "
+                    f"still running after {timeout_seconds} seconds")
+            if call.exception is not None:
+                raise call.exception
+            return call.result
+
+        self._metrics.increment("single_flight_executions_total",
+                                tags={"dependency_name": dependency_name})
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.exception = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
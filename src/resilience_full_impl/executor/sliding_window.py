@@ -0,0 +1,210 @@
+"""
+    Sliding windows feeding the circuit breaker failure-rate evaluation
+
+    COUNT_BASED : ring buffer of the last N call outcomes
+    TIME_BASED  : ring of N one-second buckets
+
+    record() and snapshot() are O(1) (amortized for TIME_BASED); running
+    totals are adjusted as slots are overwritten instead of re-summed.
+    Each window guards its slots with its own short lock so recording does
+    not contend with circuit breaker state transitions.
+"""
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from resilience_full_impl.policy.cb_policy import (COUNT_BASED, TIME_BASED,
+                                                   CircuitBreakerPolicy)
+
+_FAILED = 1
+_SLOW = 2
+
+
+@dataclass(frozen=True)
+class WindowSnapshot:
+    """
+    Aggregated outcomes currently inside the window
+    """
+    total_calls:int
+    failed_calls:int
+    slow_calls:int
+
+    @property
+    def failure_rate(self) -> float:
+        """
+        failed calls in percent
+        """
+        if not self.total_calls:
+            return 0.0
+        return self.failed_calls * 100.0 / self.total_calls
+
+    @property
+    def slow_call_rate(self) -> float:
+        """
+        slow calls in percent
+        """
+        if not self.total_calls:
+            return 0.0
+        return self.slow_calls * 100.0 / self.total_calls
+
+
+class CountBasedSlidingWindow:
+    """
+    Last-N calls window
+    """
+
+    def __init__(self, size: int):
+        if size <= 0:
+            raise ValueError("[CB] : sliding_window_size <= 0")
+        self._outcomes = [0] * size
+        self._size = size
+        self._lock = threading.Lock()
+        self._index = 0
+        self._total = 0
+        self._failed = 0
+        self._slow = 0
+
+    def record(self, failed: bool, slow: bool) -> WindowSnapshot:
+        """
+
+        :param failed:
+        :param slow:
+        :return:
+        """
+        outcome = (_FAILED if failed else 0) | (_SLOW if slow else 0)
+        with self._lock:
+            if self._total == self._size:
+                evicted = self._outcomes[self._index]
+                self._failed -= evicted & _FAILED
+                self._slow -= (evicted & _SLOW) >> 1
+            else:
+                self._total += 1
+
+            self._outcomes[self._index] = outcome
+            self._failed += outcome & _FAILED
+            self._slow += (outcome & _SLOW) >> 1
+            self._index = (self._index + 1) % self._size
+            return WindowSnapshot(self._total, self._failed, self._slow)
+
+    def snapshot(self) -> WindowSnapshot:
+        """
+
+        :return:
+        """
+        with self._lock:
+            return WindowSnapshot(self._total, self._failed, self._slow)
+
+    def reset(self) -> None:
+        """
+
+        :return:
+        """
+        with self._lock:
+            self._outcomes = [0] * self._size
+            self._index = 0
+            self._total = 0
+            self._failed = 0
+            self._slow = 0
+
+
+class TimeBasedSlidingWindow:
+    """
+    Last-N seconds window made of one-second buckets
+    """
+
+    def __init__(self, size_seconds: int,
+                 clock: Callable[[], float] = time.monotonic):
+        if size_seconds <= 0:
+            raise ValueError("[CB] : sliding_window_size <= 0")
+        self._size = size_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._calls = [0] * size_seconds
+        self._failed_calls = [0] * size_seconds
+        self._slow_calls = [0] * size_seconds
+        self._head_second = int(clock())
+        self._total = 0
+        self._failed = 0
+        self._slow = 0
+
+    def _roll(self) -> int:
+        """
+        Evict the buckets that fell out of the window since the last call;
+        caller holds the lock
+        :return: index of the current bucket
+        """
+        now_second = int(self._clock())
+        stale = min(now_second - self._head_second, self._size)
+        for step in range(1, stale + 1):
+            index = (self._head_second + step) % self._size
+            self._total -= self._calls[index]
+            self._failed -= self._failed_calls[index]
+            self._slow -= self._slow_calls[index]
+            self._calls[index] = 0
+            self._failed_calls[index] = 0
+            self._slow_calls[index] = 0
+        if now_second > self._head_second:
+            self._head_second = now_second
+        return self._head_second % self._size
+
+    def record(self, failed: bool, slow: bool) -> WindowSnapshot:
+        """
+
+        :param failed:
+        :param slow:
+        :return:
+        """
+        with self._lock:
+            index = self._roll()
+            self._calls[index] += 1
+            self._total += 1
+            if failed:
+                self._failed_calls[index] += 1
+                self._failed += 1
+            if slow:
+                self._slow_calls[index] += 1
+                self._slow += 1
+            return WindowSnapshot(self._total, self._failed, self._slow)
+
+    def snapshot(self) -> WindowSnapshot:
+        """
+
+        :return:
+        """
+        with self._lock:
+            self._roll()
+            return WindowSnapshot(self._total, self._failed, self._slow)
+
+    def reset(self) -> None:
+        """
+
+        :return:
+        """
+        with self._lock:
+            for buckets in (self._calls, self._failed_calls,
+                            self._slow_calls):
+                buckets[:] = [0] * self._size
+            self._head_second = int(self._clock())
+            self._total = 0
+            self._failed = 0
+            self._slow = 0
+
+
+def build_sliding_window(cb_pol_obj: CircuitBreakerPolicy,
+                         clock: Callable[[], float] = time.monotonic):
+    """
+    Window for the policy, or None for consecutive-failure counting
+    :param cb_pol_obj:
+    :param clock: monotonic seconds, for TIME_BASED buckets
+    :return:
+    """
+    if cb_pol_obj.sliding_window_type is None:
+        return None
+    if cb_pol_obj.sliding_window_type == COUNT_BASED:
+        return CountBasedSlidingWindow(cb_pol_obj.sliding_window_size)
+    if cb_pol_obj.sliding_window_type == TIME_BASED:
+        return TimeBasedSlidingWindow(cb_pol_obj.sliding_window_size,
+                                      clock=clock)
+    raise ValueError(f"[CB] : unknown sliding_window_type "
+                     f"{cb_pol_obj.sliding_window_type}")
@@ -1,9 +1,138 @@
 """
 Observability - Metrics
+
+Series are resolved once into handles (counter(), gauge(), histogram())
+that hot paths may keep. Counters and histograms record into a shard owned
+by the calling thread, so recording takes no lock and threads never write
+the same memory; shards are summed when the metrics are read.
 """
 
+import bisect
+import threading
 from collections import defaultdict
 
+from resilience_full_impl.observability.thread_shards import ThreadShards
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                   1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram: count per upper bound, plus an overflow bucket
+    """
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        """
+
+        :param value:
+        :return:
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def merge(self, other: "Histogram"):
+        """
+        Add the counts of a histogram with the same buckets
+
+        :param other:
+        :return:
+        """
+        for index, bucket_count in enumerate(other.counts):
+            self.counts[index] += bucket_count
+        self.count += other.count
+        self.sum += other.sum
+
+
+class Counter(ThreadShards):
+    """
+    Pre-bound counter series
+    """
+
+    def _new_shard(self):
+        return [0]
+
+    def _fold(self, into, shard):
+        into[0] += shard[0]
+
+    def inc(self, value: int = 1):
+        """
+
+        :param value:
+        :return:
+        """
+        try:
+            self._local.shard[0] += value
+        except AttributeError:
+            self._local_shard()[0] += value
+
+    def value(self) -> int:
+        """
+        Sum over every thread
+        :return:
+        """
+        return self._collect([0])[0]
+
+
+class HistogramSeries(ThreadShards):
+    """
+    Pre-bound histogram series
+    """
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__()
+
+    def _new_shard(self):
+        return Histogram(self.buckets)
+
+    def _fold(self, into, shard):
+        into.merge(shard)
+
+    def observe(self, value: float):
+        """
+
+        :param value:
+        :return:
+        """
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._local_shard()
+        shard.observe(value)
+
+    def snapshot(self) -> Histogram:
+        """
+        Histogram merged over every thread
+        :return:
+        """
+        return self._collect(Histogram(self.buckets))
+
+
+class Gauge:
+    """
+    Pre-bound gauge series; the last write wins
+    """
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def set(self, value: float):
+        """
+
+        :param value:
+        :return:
+        """
+        self.value = value
+
 
 class MetricsCollector:
     """
@@ -11,14 +140,179 @@ class MetricsCollector:
     """
 
     def __init__(self):
-        self._counters = defaultdict(int)
+        self._counter_series = {}
+        self._gauge_series = {}
+        self._histogram_series = {}
+        # (kind, name, *tags.items()) as passed -> handle, so repeated
+        # calls skip sorting the tags
+        self._handles = {}
+        self._series_lock = threading.Lock()
+
+    def _bind(self, series: dict, name: str, tags: dict | None, factory):
+        """
+        Resolve name and tags to a handle, creating the series once
+
+        :param series: the series table of the metric kind
+        :param name:
+        :param tags:
+        :param factory: builds the handle of a new series
+        :return:
+        """
+        handle_key = (id(series), name, *tags.items()) if tags \
+            else (id(series), name)
+        handle = self._handles.get(handle_key)
+        if handle is None:
+            key = (name, tuple(sorted((tags or {}).items())))
+            with self._series_lock:
+                handle = series.get(key)
+                if handle is None:
+                    handle = series[key] = factory()
+                self._handles[handle_key] = handle
+        return handle
+
+    def counter(self, name: str, tags: dict | None = None) -> Counter:
+        """
+
+        :param name:
+        :param tags:
+        :return: handle for repeated increments of the series
+        """
+        return self._bind(self._counter_series, name, tags, Counter)
+
+    def gauge(self, name: str, tags: dict | None = None) -> Gauge:
+        """
+
+        :param name:
+        :param tags:
+        :return: handle for repeated writes of the series
+        """
+        return self._bind(self._gauge_series, name, tags, Gauge)
+
+    def histogram(self, name: str, tags: dict | None = None,
+                  buckets: tuple | None = None) -> HistogramSeries:
+        """
+
+        :param name:
+        :param tags:
+        :param buckets: bucket upper bounds, used when the series is created
+        :return: handle for repeated observations of the series
+        """
+        return self._bind(self._histogram_series, name, tags,
+                          lambda: HistogramSeries(buckets or DEFAULT_BUCKETS))
 
     def increment(self, name: str, tags: dict | None = None):
         """
-        
+
         :param name:
         :param tags:
         :return:
         """
-        key = (name, tuple(sorted((tags or {}).items())))
-        self._counters[key] += 1
+        self.counter(name, tags).inc()
+
+    def set_gauge(self, name: str, value: float, tags: dict | None = None):
+        """
+
+        :param name:
+        :param value:
+        :param tags:
+        :return:
+        """
+        self.gauge(name, tags).value = value
+
+    def observe(self, name: str, value: float, tags: dict | None = None,
+                buckets: tuple | None = None):
+        """
+
+        :param name:
+        :param value:
+        :param tags:
+        :param buckets: bucket upper bounds, used when the series is created
+        :return:
+        """
+        self.histogram(name, tags, buckets).observe(value)
+
+    @property
+    def _counters(self) -> dict:
+        """
+        Counter values by (name, sorted tags), aggregated on read
+        """
+        with self._series_lock:
+            series = list(self._counter_series.items())
+        return defaultdict(int, {key: counter.value()
+                                 for key, counter in series})
+
+    @property
+    def _gauges(self) -> dict:
+        """
+        Gauge values by (name, sorted tags)
+        """
+        with self._series_lock:
+            series = list(self._gauge_series.items())
+        return {key: gauge.value for key, gauge in series}
+
+    @property
+    def _histograms(self) -> dict:
+        """
+        Merged histograms by (name, sorted tags)
+        """
+        with self._series_lock:
+            series = list(self._histogram_series.items())
+        return {key: histogram.snapshot() for key, histogram in series}
+
+
+class NoopSeries:
+    """
+    Series handle of NoopMetricsCollector; records nothing
+    """
+    __slots__ = ()
+
+    def inc(self, value: int = 1):
+        """
+
+        :param value:
+        :return:
+        """
+
+    def set(self, value: float):
+        """
+
+        :param value:
+        :return:
+        """
+
+    def observe(self, value: float):
+        """
+
+        :param value:
+        :return:
+        """
+
+
+NOOP_SERIES = NoopSeries()
+
+
+class NoopMetricsCollector(MetricsCollector):
+    """
+    Collector for observability disabled: every series is NOOP_SERIES and
+    nothing is stored
+    """
+
+    def counter(self, name: str, tags: dict | None = None) -> NoopSeries:
+        return NOOP_SERIES
+
+    def gauge(self, name: str, tags: dict | None = None) -> NoopSeries:
+        return NOOP_SERIES
+
+    def histogram(self, name: str, tags: dict | None = None,
+                  buckets: tuple | None = None) -> NoopSeries:
+        return NOOP_SERIES
+
+    def increment(self, name: str, tags: dict | None = None):
+        pass
+
+    def set_gauge(self, name: str, value: float, tags: dict | None = None):
+        pass
+
+    def observe(self, name: str, value: float, tags: dict | None = None,
+                buckets: tuple | None = None):
+        pass
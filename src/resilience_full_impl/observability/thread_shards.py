@@ -0,0 +1,81 @@
+"""
+Per-thread metric shards
+
+A series handle keeps one shard per recording thread. Only that thread
+writes it, so recording takes no lock and threads never contend on the
+same memory; readers fold the shards together. Shards of finished threads
+are folded into a retired shard whenever a new thread registers one, so
+memory stays bounded by the live threads even if nothing ever reads.
+
+resilience_patterns_observability.observability.thread_shards is the same
+base for that package; the packages never import each other.
+"""
+import threading
+from abc import ABC, abstractmethod
+
+
+class ThreadShards(ABC):
+    """
+    Base of the series handles
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards = []
+        self._retired = self._new_shard()
+        self._shards_lock = threading.Lock()
+
+    @abstractmethod
+    def _new_shard(self):
+        """
+        Empty shard
+        :return:
+        """
+
+    @abstractmethod
+    def _fold(self, into, shard):
+        """
+        Add shard into `into`
+        :param into:
+        :param shard:
+        :return:
+        """
+
+    def _local_shard(self):
+        """
+        Shard of the calling thread, created on its first record
+        :return:
+        """
+        shard = self._new_shard()
+        self._local.shard = shard
+        with self._shards_lock:
+            self._retire_dead()
+            self._shards.append((threading.current_thread(), shard))
+        return shard
+
+    def _retire_dead(self):
+        """
+        Fold the shards of finished threads into the retired shard and
+        drop them; caller holds _shards_lock
+        :return:
+        """
+        live = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                live.append((thread, shard))
+            else:
+                self._fold(self._retired, shard)
+        self._shards = live
+
+    def _collect(self, into):
+        """
+        Fold every shard into `into`
+        :param into: a fresh shard
+        :return:
+        """
+        with self._shards_lock:
+            self._retire_dead()
+            self._fold(into, self._retired)
+            for _, shard in self._shards:
+                self._fold(into, shard)
+        return into
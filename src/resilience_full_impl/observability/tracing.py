@@ -3,17 +3,24 @@ Observability = Tracing
 """
 
 from contextlib import contextmanager
-import time
+
+from resilience_full_impl.clock import SYSTEM_CLOCK, Clock
 
 class TraceSpan:
     """
         TraceSpan
+
+        start_time is wall time, for export; duration_ms is measured on
+        the performance counter
     """
-    def __init__(self, name: str, attributes: dict | None = None):
+    def __init__(self, name: str, attributes: dict | None = None,
+                 clock: Clock = SYSTEM_CLOCK):
         self.duration_ms = None
         self.name = name
         self.attributes = attributes or {}
-        self.start_time = time.time()
+        self._clock = clock
+        self.start_time = clock.wall()
+        self._started = clock.perf_counter()
 
     def set_attribute(self, key, value):
         """
@@ -28,21 +35,87 @@ class TraceSpan:
         
         :return: 
         """
-        self.duration_ms = (time.time() - self.start_time) * 1000
+        self.duration_ms = (self._clock.perf_counter() - self._started) * 1000
         
 
 
-@contextmanager
+class NoopSpan:
+    """
+        Span of a disabled tracer; one shared instance is its own context
+        manager, so entering it allocates nothing
+    """
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set_attribute(self, key, value):
+        """
+
+        :param key:
+        :param value:
+        """
+
+    def end_span(self):
+        """
+
+        :return:
+        """
+
+
+NOOP_SPAN = NoopSpan()
+
+
+class Tracer:
+    """
+        Creates TraceSpans on the given clock
+    """
+
+    def __init__(self, clock: Clock = SYSTEM_CLOCK):
+        self._clock = clock
+
+    @contextmanager
+    def start_span(self, name: str, **attrs):
+        """
+
+        :param name:
+        :param attrs:
+        """
+        span = TraceSpan(name, attrs, clock=self._clock)
+        try:
+            yield span
+        finally:
+            span.end_span()
+
+
+class NoopTracer:
+    """
+        Tracer for observability disabled: every span is NOOP_SPAN
+    """
+
+    def start_span(self, name: str, **attrs):
+        """
+
+        :param name:
+        :param attrs:
+        :return: NOOP_SPAN
+        """
+        return NOOP_SPAN
+
+
+TRACER = Tracer()
+NOOP_TRACER = NoopTracer()
+
+
 def start_span(name: str, **attrs):
     """
 
     :param name:
     :param attrs:
     """
-    span = TraceSpan(name, attrs) 
-    try:
-        yield span
-    finally:
-        TraceSpan.end_span(span)
+    return TRACER.start_span(name, **attrs)
 
 
@@ -1,9 +1,44 @@
 from dataclasses import dataclass
+from enum import IntEnum
+
+AIMD = "AIMD"
+GRADIENT = "GRADIENT"
+
+
+class Priority(IntEnum):
+    """
+    Request criticality, most important first
+    """
+    CRITICAL = 0
+    HIGH = 1
+    NORMAL = 2
+    LOW = 3
+
 
 @dataclass(frozen=True)
 class BulkheadPolicy:
     """
     Bulkhead policy
+    :param: max_concurrent_calls:int  fixed limit, or upper bound when
+        adaptive_limit is set
+    :param: acquire_timeout:int  seconds a queued caller waits for a slot
+    :param: adaptive_limit:str | None  AIMD or GRADIENT to let the limit
+        follow observed latency and errors
+    :param: min_concurrent_calls:int  lower bound for the adaptive limit
+    :param: initial_concurrent_calls:int | None  starting adaptive limit,
+        defaults to half of max_concurrent_calls
+    :param: max_queue_length:int  callers allowed to wait (FIFO) for a
+        slot; 0 rejects at once when the bulkhead is full
+    :param: priority_utilization_limits:tuple[float, ...] | None  share of
+        the limit each Priority may fill, indexed by Priority; a class
+        below 1.0 leaves the rest reserved for more critical work and is
+        shed once utilization reaches its share. None admits every
+        priority up to the full limit.
     """
     max_concurrent_calls:int
     acquire_timeout:int
+    adaptive_limit:str | None = None
+    min_concurrent_calls:int = 1
+    initial_concurrent_calls:int | None = None
+    max_queue_length:int = 0
+    priority_utilization_limits:tuple[float, ...] | None = None
@@ -1,11 +1,42 @@
 from dataclasses import dataclass
 
+COUNT_BASED = "COUNT_BASED"
+TIME_BASED = "TIME_BASED"
+
+
 @dataclass(frozen=True)
 class CircuitBreakerPolicy:
     """
     Circuit Breaker Policy Class
-    :param: failure_threshold:int
+    :param: failure_threshold:int  consecutive failures that open the
+        circuit when no sliding window is configured
     :param: recovery_timeout:int
+    :param: sliding_window_type:str | None  COUNT_BASED (last N calls),
+        TIME_BASED (last N seconds) or None for consecutive failures
+    :param: sliding_window_size:int  N calls or N seconds
+    :param: minimum_number_of_calls:int  calls in the window before rates
+        are evaluated
+    :param: failure_rate_threshold:float  percent of failed calls that
+        opens the circuit
+    :param: slow_call_rate_threshold:float  percent of slow calls that
+        opens the circuit
+    :param: slow_call_duration_threshold:float  seconds after which a call
+        counts as slow
+    :param: permitted_calls_in_half_open:int  trial calls let through once
+        recovery_timeout has passed; further callers are rejected
+    :param: half_open_success_threshold:int | None  trial successes that
+        close the circuit, defaults to permitted_calls_in_half_open
+    :param: half_open_failure_threshold:int  trial failures that re-open
+        the circuit
     """
     failure_threshold:int
     recovery_timeout:int
+    sliding_window_type:str | None = None
+    sliding_window_size:int = 100
+    minimum_number_of_calls:int = 10
+    failure_rate_threshold:float = 50.0
+    slow_call_rate_threshold:float = 100.0
+    slow_call_duration_threshold:float = 60.0
+    permitted_calls_in_half_open:int = 1
+    half_open_success_threshold:int | None = None
+    half_open_failure_threshold:int = 1
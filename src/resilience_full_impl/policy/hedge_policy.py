@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """
+    Hedged requests policy
+    :param: delay_ms:int  wait before a duplicate attempt is launched
+    :param: adaptive:bool  use the observed latency_percentile as delay
+        once min_samples successes were seen (delay_ms until then)
+    :param: latency_percentile:float
+    :param: min_samples:int
+    :param: max_hedges:int  duplicates per attempt
+    :param: budget_percent:float  hedges allowed per 100 attempts
+    """
+    delay_ms:int = 50
+    adaptive:bool = False
+    latency_percentile:float = 95.0
+    min_samples:int = 20
+    max_hedges:int = 1
+    budget_percent:float = 10.0
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class KeyedBulkheadPolicy:
+    """
+    Per-key (tenant, route, host) bulkhead policy
+    :param: max_concurrent_calls_per_key:int
+    :param: max_keys:int  partitions kept in memory; idle least recently
+        used keys are evicted beyond it
+    :param: idle_eviction_seconds:float  idle partitions older than this
+        are dropped
+    :param: hot_keys_tracked:int  hottest keys tracked for metrics
+    """
+    max_concurrent_calls_per_key:int
+    max_keys:int = 10_000
+    idle_eviction_seconds:float = 300.0
+    hot_keys_tracked:int = 10
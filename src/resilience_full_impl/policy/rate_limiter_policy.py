@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+TOKEN_BUCKET = "TOKEN_BUCKET"
+GCRA = "GCRA"
+
+
+@dataclass(frozen=True)
+class RateLimiterPolicy:
+    """
+    Outgoing call rate limit
+    :param: rate_per_second:float  sustained permits per second
+    :param: burst:int  permits that may be taken at once after idling
+    :param: algorithm:str  TOKEN_BUCKET or GCRA
+    :param: max_wait_seconds:float  how long a caller may block for a
+        permit; 0 fails fast
+    """
+    rate_per_second:float
+    burst:int = 1
+    algorithm:str = TOKEN_BUCKET
+    max_wait_seconds:float = 0.0
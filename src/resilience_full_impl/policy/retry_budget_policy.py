@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class RetryBudgetPolicy:
+    """
+    Retry budget shared by all callers of a dependency
+    :param: retry_ratio:float  retries allowed per request over the window
+    :param: min_retries_per_second:float  floor that keeps low-traffic
+        dependencies retryable
+    :param: window_seconds:int
+    """
+    retry_ratio:float = 0.1
+    min_retries_per_second:float = 10.0
+    window_seconds:int = 10
@@ -1,9 +1,27 @@
 from dataclasses import dataclass
 
+FULL_JITTER = "FULL"
+EQUAL_JITTER = "EQUAL"
+DECORRELATED_JITTER = "DECORRELATED"
+
+
 @dataclass(frozen=True)
 class RetryPolicy:
+    """
+    Retry policy
+    :param: max_attempts:int
+    :param: retry_interval_ms:int  base backoff
+    :param: exponential:bool  double the backoff on every attempt
+    :param: jitter:str | None  FULL_JITTER, EQUAL_JITTER or
+        DECORRELATED_JITTER to spread retries of concurrent callers;
+        None keeps the deterministic backoff
+    :param: max_retry_interval_ms:int | None  cap on a single backoff
+    :param: respect_retry_after:bool  wait at least the server's
+        Retry-After when the error carries one
+    """
     max_attempts:int
     retry_interval_ms:int
     exponential:bool
-
-
+    jitter:str | None = None
+    max_retry_interval_ms:int | None = None
+    respect_retry_after:bool = False
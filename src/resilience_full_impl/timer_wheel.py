@@ -0,0 +1,186 @@
+"""
+    Timer Wheel - one scheduler thread for many coarse timers
+
+    Hashed timer wheel: wheel_size slots of tick_seconds each. A timer goes
+    into the slot of its expiry tick and remembers how many full turns of
+    the wheel remain, so schedule() and cancel() are O(1) and a tick only
+    visits the timers of one slot. Timers fire up to one tick late, which
+    is fine for deadlines, backoff and recovery timeouts.
+"""
+import math
+import threading
+from typing import Callable
+
+from resilience_full_impl.clock import SYSTEM_CLOCK, Clock
+from resilience_full_impl.observability.logging import logger
+
+
+class Timeout:
+    """
+        Handle of a scheduled timer
+    """
+    __slots__ = ("callback", "rounds", "slot", "cancelled")
+
+    def __init__(self, callback: Callable[[], None], rounds: int, slot: set):
+        self.callback = callback
+        self.rounds = rounds
+        self.slot = slot
+        self.cancelled = False
+
+
+class HashedTimerWheel:
+    """
+        Shared timer service
+
+        With autostart a daemon thread drives the wheel; it is started by
+        the first schedule() and sleeps while no timer is pending. Without
+        it, whoever owns the clock calls run_due() (tests, simulations on
+        a VirtualClock). Callbacks run on the wheel thread and must be
+        short: set an Event, cancel a token, hand work to a pool.
+    """
+
+    def __init__(self, tick_seconds: float = 0.01, wheel_size: int = 512,
+                 clock: Clock = SYSTEM_CLOCK, autostart: bool = True):
+        if tick_seconds <= 0 or wheel_size <= 0:
+            raise ValueError("[TIMER] : tick_seconds and wheel_size must be "
+                             "> 0")
+        self._tick_seconds = tick_seconds
+        self._slots = [set() for _ in range(wheel_size)]
+        self._clock = clock
+        self._autostart = autostart
+        self._origin = clock.monotonic()
+        self._processed_tick = 0
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    @property
+    def pending(self) -> int:
+        """
+        Timers scheduled and not yet fired or cancelled
+        """
+        return self._pending
+
+    def _tick_of(self, monotonic_seconds: float) -> int:
+        return int((monotonic_seconds - self._origin) / self._tick_seconds)
+
+    def schedule(self, delay_seconds: float,
+                 callback: Callable[[], None]) -> Timeout:
+        """
+        Run callback once delay_seconds have passed
+
+        :param delay_seconds:
+        :param callback:
+        :return: handle for cancel()
+        """
+        now = self._clock.monotonic()
+        expiry = now + max(0.0, delay_seconds)
+        with self._lock:
+            if not self._pending:
+                # idle: skip the ticks nobody visited instead of walking
+                # them on the next run_due() and firing this timer early
+                self._processed_tick = max(self._processed_tick,
+                                           self._tick_of(now))
+            # a timer never lands in a tick that was already processed
+            ticks = max(math.ceil((expiry - self._origin)
+                                  / self._tick_seconds),
+                        self._processed_tick + 1)
+            distance = ticks - self._processed_tick - 1
+            slot = self._slots[ticks % len(self._slots)]
+            timeout = Timeout(callback, distance // len(self._slots), slot)
+            slot.add(timeout)
+            # the wheel thread only parks while nothing is pending
+            was_idle = not self._pending
+            self._pending += 1
+            if self._autostart and self._thread is None:
+                self._thread = threading.Thread(target=self._run,
+                                                name="timer-wheel",
+                                                daemon=True)
+                self._thread.start()
+        if was_idle and self._autostart:
+            self._wakeup.set()
+        return timeout
+
+    def cancel(self, timeout: Timeout) -> None:
+        """
+        Drop a timer that has not fired yet
+
+        :param timeout:
+        """
+        with self._lock:
+            if timeout.cancelled or timeout not in timeout.slot:
+                return
+            timeout.cancelled = True
+            timeout.slot.discard(timeout)
+            self._pending -= 1
+
+    def run_due(self) -> int:
+        """
+        Fire every timer whose tick has passed, catching up on missed
+        ticks
+
+        :return: timers fired
+        """
+        now_tick = self._tick_of(self._clock.monotonic())
+        expired = []
+        with self._lock:
+            while self._processed_tick < now_tick:
+                self._processed_tick += 1
+                slot = self._slots[self._processed_tick % len(self._slots)]
+                for timeout in list(slot):
+                    if timeout.rounds > 0:
+                        timeout.rounds -= 1
+                        continue
+                    slot.discard(timeout)
+                    expired.append(timeout)
+                if not self._pending - len(expired):
+                    # nothing left to visit; skip straight to now
+                    self._processed_tick = now_tick
+            self._pending -= len(expired)
+
+        for timeout in expired:
+            try:
+                timeout.callback()
+            except Exception:
+                logger.exception("[TIMER] : timer callback failed")
+        return len(expired)
+
+    def sleep(self, seconds: float, token=None) -> None:
+        """
+        Block for seconds on the wheel's clock, returning early once token
+        (a CancellationToken) is cancelled. On a manual wheel the clock is
+        advanced instead and due timers fire.
+
+        :param seconds:
+        :param token:
+        """
+        if not self._autostart:
+            self._clock.sleep(seconds)
+            self.run_due()
+            return
+        event = threading.Event()
+        timeout = self.schedule(seconds, event.set)
+        unregister = (token.register_callback(event.set)
+                      if token is not None else None)
+        try:
+            event.wait()
+        finally:
+            self.cancel(timeout)
+            if unregister is not None:
+                unregister()
+
+    def _run(self) -> None:
+        while True:
+            self.run_due()
+            if not self._pending:
+                self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+            next_tick = self._processed_tick + 1
+            self._clock.sleep(max(0.0, self._origin
+                                  + next_tick * self._tick_seconds
+                                  - self._clock.monotonic()))
+
+
+TIMER_WHEEL = HashedTimerWheel()
@@ -0,0 +1,127 @@
+"""
+Adaptive concurrency limits for the bulkhead
+
+AIMD     : +1 while latency holds near the baseline, x0.9 on errors or
+           latency above baseline * tolerance
+GRADIENT : limit * clamp(tolerance * long_latency / short_latency, 0.5, 1)
+           + sqrt(limit), smoothed
+
+Samples are per-attempt round-trip times. resilience_full_impl keeps the
+same algorithms in executor.adaptive_limit: the packages ship separately
+and never import each other, so change both together.
+"""
+
+import math
+from typing import Optional, Protocol
+
+from resilience_patterns_observability.policies.bulkhead_policy import (
+    AIMD, GRADIENT, BulkheadPolicy)
+
+
+class ConcurrencyLimit(Protocol):
+    """
+    feeds on completed calls and returns the new limit
+    """
+    limit: int
+
+    def on_sample(self, latency_seconds: float, succeeded: bool,
+                  in_flight: int) -> int:
+        ...
+
+
+class AIMDLimit:
+    """
+    Additive increase / multiplicative decrease against a latency baseline
+    """
+
+    def __init__(self, min_limit: int, max_limit: int, initial_limit: int,
+                 backoff_ratio: float = 0.9, tolerance: float = 2.0) -> None:
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.tolerance = tolerance
+        self.baseline: Optional[float] = None
+        self.limit = initial_limit
+
+    def on_sample(self, latency_seconds: float, succeeded: bool,
+                  in_flight: int) -> int:
+        if self.baseline is None or latency_seconds < self.baseline:
+            self.baseline = latency_seconds
+        else:
+            self.baseline += (latency_seconds - self.baseline) * 0.01
+
+        if not succeeded or latency_seconds > self.baseline * self.tolerance:
+            self.limit = max(self.min_limit,
+                             int(self.limit * self.backoff_ratio))
+        elif in_flight * 2 >= self.limit:
+            self.limit = min(self.max_limit, self.limit + 1)
+        return self.limit
+
+
+class GradientLimit:
+    """
+    Short-term vs long-term latency gradient with sqrt(limit) headroom
+    """
+
+    def __init__(self, min_limit: int, max_limit: int, initial_limit: int,
+                 smoothing: float = 0.2, tolerance: float = 1.5,
+                 long_window: int = 600, short_window: int = 10) -> None:
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.smoothing = smoothing
+        self.tolerance = tolerance
+        self.long_alpha = 2 / (long_window + 1)
+        self.short_alpha = 2 / (short_window + 1)
+        self.long_latency: Optional[float] = None
+        self.short_latency: float = 0.0
+        self.estimate = float(initial_limit)
+        self.limit = initial_limit
+
+    def on_sample(self, latency_seconds: float, succeeded: bool,
+                  in_flight: int) -> int:
+        if self.long_latency is None:
+            self.long_latency = self.short_latency = latency_seconds
+        else:
+            self.long_latency += ((latency_seconds - self.long_latency)
+                                  * self.long_alpha)
+            self.short_latency += ((latency_seconds - self.short_latency)
+                                   * self.short_alpha)
+
+        if succeeded and in_flight * 2 < self.estimate:
+            return self.limit  # app-limited, latency says nothing
+
+        if not succeeded:
+            gradient = 0.5
+        else:
+            gradient = max(0.5, min(1.0, self.tolerance * self.long_latency
+                                    / max(self.short_latency, 1e-9)))
+        target = self.estimate * gradient + math.sqrt(self.estimate)
+        self.estimate = (self.estimate * (1 - self.smoothing)
+                         + target * self.smoothing)
+        self.estimate = max(self.min_limit, min(self.max_limit,
+                                                self.estimate))
+        self.limit = int(self.estimate)
+        return self.limit
+
+
+def build_limit(policy: BulkheadPolicy) -> Optional[ConcurrencyLimit]:
+    """
+    adaptive limit for the policy, None for a fixed limit
+    """
+    if policy.adaptive_limit is None:
+        return None
+
+    min_limit = policy.min_concurrent_calls
+    max_limit = policy.max_concurrent_calls
+    if not 0 < min_limit <= max_limit:
+        raise ValueError("[BK] min_concurrent_calls must be in "
+                         "(0, max_concurrent_calls]")
+    initial = policy.initial_concurrent_calls or max(min_limit,
+                                                     max_limit // 2)
+    initial = max(min_limit, min(max_limit, initial))
+
+    if policy.adaptive_limit == AIMD:
+        return AIMDLimit(min_limit, max_limit, initial)
+    if policy.adaptive_limit == GRADIENT:
+        return GradientLimit(min_limit, max_limit, initial)
+    raise ValueError(f"[BK] unknown adaptive_limit {policy.adaptive_limit}")
@@ -2,16 +2,69 @@
 class tha holds bulkhead specific items
 """
 
-from threading import Semaphore
+import threading
+from typing import Optional
 
+from resilience_patterns_observability.core.adaptive_limit import build_limit
+from resilience_patterns_observability.observability.metrics import \
+    MetricsCollector
+from resilience_patterns_observability.observability.runtime import metrics
 from resilience_patterns_observability.policies.bulkhead_policy import BulkheadPolicy
 
 
 class Bulkhead:
     """
-    includes Semaphore, acquire_timeout and max_concurrent_calls
+    includes the concurrency limit, acquire_timeout and max_concurrent_calls
+    the limit is fixed, or adaptive when policy.adaptive_limit is set; the
+    adaptive limit moves with record_attempt()
     """
 
-    def __init__(self, policy: BulkheadPolicy):
-        self.semaphore = Semaphore(policy.max_concurrent_calls)
+    def __init__(self, policy: BulkheadPolicy,
+                 metrics_collector: MetricsCollector = metrics) -> None:
+        self.metrics_collector = metrics_collector
         self.acquire_timeout = policy.acquire_timeout
+        self.limiter = build_limit(policy)
+        self.limit: int = (self.limiter.limit if self.limiter is not None
+                           else policy.max_concurrent_calls)
+        self.in_flight = 0
+        self._condition = threading.Condition()
+        if self.limiter is not None:
+            metrics_collector.set_gauge("bulkhead_concurrency_limit",
+                                        self.limit)
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        wait up to timeout (acquire_timeout by default) for a free slot
+        """
+        wait_seconds = self.acquire_timeout if timeout is None else timeout
+        with self._condition:
+            if not self._condition.wait_for(
+                    lambda: self.in_flight < self.limit, wait_seconds):
+                return False
+            self.in_flight += 1
+            return True
+
+    def record_attempt(self, rtt_seconds: float, succeeded: bool) -> None:
+        """
+        round-trip time and outcome of one attempt that reached the
+        dependency; feeds the adaptive limit
+        """
+        if self.limiter is None:
+            return
+        with self._condition:
+            old_limit = self.limit
+            self.limit = self.limiter.on_sample(rtt_seconds, succeeded,
+                                                self.in_flight)
+            if self.limit > old_limit:
+                self._condition.notify(self.limit - old_limit)
+        if self.limit != old_limit:
+            self.metrics_collector.set_gauge("bulkhead_concurrency_limit",
+                                             self.limit)
+
+    def release(self) -> None:
+        """
+        free a slot
+        """
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify(max(1, self.limit - self.in_flight))
@@ -10,6 +10,7 @@ ExecutionContext
 
 import time
 import uuid
+from typing import Optional
 
 
 class ExecutionContext:
@@ -22,7 +23,16 @@ class ExecutionContext:
     from typing import Optional
     
     def __init__(self) -> None:
-        self.req_id = str(uuid.uuid4())
+        self._req_id: Optional[str] = None
         self.timestamp : float= time.time()
         self.attempt = 0
         self.last_exception = None
+
+    @property
+    def req_id(self) -> str:
+        """
+        Correlation id, generated the first time it is logged
+        """
+        if self._req_id is None:
+            self._req_id = str(uuid.uuid4())
+        return self._req_id
@@ -0,0 +1,128 @@
+"""
+Outgoing rate limit - token bucket and GCRA, refilled lazily on each call
+
+resilience_full_impl keeps the same algorithms in executor.rate_limiter:
+the packages ship separately and never import each other, so change both
+together.
+"""
+
+import logging
+import threading
+from typing import Optional, Union
+
+from resilience_patterns_observability.clock import SYSTEM_CLOCK, Clock
+from resilience_patterns_observability.observability.metrics import \
+    MetricsCollector
+from resilience_patterns_observability.observability.runtime import metrics
+from resilience_patterns_observability.policies.rate_limiter_policy import (
+    TOKEN_BUCKET, RateLimiterPolicy)
+
+logger = logging.getLogger(__name__)
+
+# absorbs float rounding in refill arithmetic
+_EPSILON_SECONDS = 1e-9
+
+
+class RateLimitExceededError(RuntimeError):
+    """
+    Raised when no permit is available within the allowed wait
+    """
+
+
+class TokenBucket:
+    """
+    Holds up to burst tokens, refilled at rate tokens per second. A caller
+    willing to wait reserves a future token, so the balance may go
+    negative and later callers queue behind it.
+    """
+
+    def __init__(self, rate: float, burst: int, now: float) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = now
+
+    def reserve(self, now: float, max_wait: float) -> Optional[float]:
+        """
+        seconds to wait for the permit, None when that exceeds max_wait
+        (nothing is reserved then)
+        """
+        self._tokens = min(self._burst,
+                           self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+        wait = max(0.0, (1.0 - self._tokens) / self._rate)
+        if wait > max_wait + _EPSILON_SECONDS:
+            return None
+        self._tokens -= 1.0
+        return wait
+
+
+class GCRALimit:
+    """
+    Generic Cell Rate Algorithm: a single theoretical arrival time (TAT)
+    per limiter. A call conforms while TAT is at most
+    (burst - 1) emission intervals ahead of now.
+    """
+
+    def __init__(self, rate: float, burst: int, now: float) -> None:
+        self._interval = 1.0 / rate
+        self._tolerance = (burst - 1) * self._interval
+        self._tat = now
+
+    def reserve(self, now: float, max_wait: float) -> Optional[float]:
+        """
+        seconds to wait for the permit, None when that exceeds max_wait
+        (nothing is reserved then)
+        """
+        tat = max(self._tat, now)
+        wait = max(0.0, tat - self._tolerance - now)
+        if wait > max_wait + _EPSILON_SECONDS:
+            return None
+        self._tat = tat + self._interval
+        return wait
+
+
+class RateLimiter:
+    """
+    Rate limiter over the policy's algorithm. No background thread: state
+    catches up with the clock whenever a permit is requested.
+    """
+
+    def __init__(self, policy: RateLimiterPolicy,
+                 metrics_collector: MetricsCollector = metrics,
+                 clock: Clock = SYSTEM_CLOCK) -> None:
+        self.policy = policy
+        self.clock = clock
+        self.metrics_collector = metrics_collector
+        self._algorithm: Union[TokenBucket, GCRALimit] = (
+            TokenBucket if policy.algorithm == TOKEN_BUCKET else GCRALimit
+        )(policy.rate_per_second, policy.burst, clock.monotonic())
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        """
+        Fail-fast permit
+        """
+        with self._lock:
+            return self._algorithm.reserve(self.clock.monotonic(),
+                                           0.0) is not None
+
+    def acquire(self, max_wait_seconds: Optional[float] = None) -> None:
+        """
+        Take a permit, blocking up to max_wait_seconds (policy default)
+        """
+        if max_wait_seconds is None:
+            max_wait_seconds = self.policy.max_wait_seconds
+        with self._lock:
+            wait = self._algorithm.reserve(self.clock.monotonic(),
+                                           max(0.0, max_wait_seconds))
+
+        if wait is None:
+            self.metrics_collector.inc_counter("rate_limiter_rejected_total")
+            logger.warning("[RL] Rate limit exceeded")
+            raise RateLimitExceededError("[RL] Rate limit exceeded")
+
+        if wait > 0:
+            self.metrics_collector.observe_latency("rate_limiter_wait_ms",
+                                                   wait * 1000)
+            self.clock.sleep(wait)
@@ -3,16 +3,25 @@ Implements Resilience Executor
 """
 
 import logging
-import time
-from functools import wraps
+import threading
+import uuid
+from functools import partial, wraps
 from typing import Optional, Callable, Any
 
+from resilience_patterns_observability.clock import SYSTEM_CLOCK, Clock
 from resilience_patterns_observability.core.bulkhead import Bulkhead
 from resilience_patterns_observability.core.execution_context import ExecutionContext
-from resilience_patterns_observability.core.timeout_executor import TimeoutExecutor
+from resilience_patterns_observability.core.rate_limiter import RateLimiter
+from resilience_patterns_observability.core.result_cache import (
+    FRESH, STALE, ResultCache)
+from resilience_patterns_observability.core.timeout_executor import (
+    TimeoutExecutor, WorkerShareExhaustedError)
 from resilience_patterns_observability.policies.bulkhead_policy import BulkheadPolicy
+from resilience_patterns_observability.policies.cache_policy import CachePolicy
 from resilience_patterns_observability.policies.cb_policy import CircuitBreakerPolicy
 from resilience_patterns_observability.policies.cb_state import CircuitBreakerState
+from resilience_patterns_observability.policies.rate_limiter_policy import \
+    RateLimiterPolicy
 from resilience_patterns_observability.policies.retry_policy import \
     RetryPolicy, before_retry_attempt, after_retry_attempt
 from resilience_patterns_observability.policies.timeout_policy import TimeoutPolicy
@@ -21,16 +30,37 @@ from resilience_patterns_observability.observability.context import (
     current_span, current_trace_id)
 from resilience_patterns_observability.observability.inmemory_tracing import \
     InMemoryTraceSpan
+from resilience_patterns_observability.observability.metrics import \
+    MetricsCollector
+from resilience_patterns_observability.observability.noop import (
+    NOOP_METRICS, NOOP_SPAN)
 from resilience_patterns_observability.observability.runtime import metrics
+from resilience_patterns_observability.observability.sampling import \
+    trace_sampled
+from resilience_patterns_observability.observability.tracing import TraceSpan
 
 
 
 logger = logging.getLogger(__name__)
 
 
+def _no_retry_span(attempt: int) -> None:
+    return None
+
+
 class ResilienceExecutor:
     """
     Orchestrates Retry, Circuit Breaker, Bulkhead, and Timeout patterns.
+
+    With a rate_limiter_policy every attempt takes a permit before the
+    circuit check, so retries count against the quota and a rejection
+    neither takes a half-open permit nor counts as a dependency failure.
+
+    With observability=False the executor records no spans or metrics of
+    its own: the untraced pipeline is bound at construction, so a call
+    allocates no span and takes no clock reads for tracing.
+    A call whose trace is not head-sampled (observability.sampling) runs
+    without spans as well, but still carries current_trace_id.
     """
 
     def __init__(
@@ -39,136 +69,287 @@ class ResilienceExecutor:
         cb_policy: CircuitBreakerPolicy,
         bulkhead_policy: BulkheadPolicy,
         timeout_policy: TimeoutPolicy,
+        cache_policy: Optional[CachePolicy] = None,
+        clock: Clock = SYSTEM_CLOCK,
+        observability: bool = True,
+        rate_limiter_policy: Optional[RateLimiterPolicy] = None,
     ) -> None:
+        self.clock: Clock = clock
         self.retry_policy: RetryPolicy = retry_policy
         self.cb_policy: CircuitBreakerPolicy = cb_policy
         self.bulkhead_policy: BulkheadPolicy = bulkhead_policy
         self.timeout_policy: TimeoutPolicy = timeout_policy
 
         self.cb_state: CircuitBreakerState = CircuitBreakerState()
-        self.bulkhead: Bulkhead = Bulkhead(bulkhead_policy)
-        self.timeout_executor: TimeoutExecutor = TimeoutExecutor(timeout_policy)
+        self._cb_lock = threading.Lock()
+        self._metrics: MetricsCollector = (metrics if observability
+                                           else NOOP_METRICS)
+        self.bulkhead: Bulkhead = Bulkhead(bulkhead_policy, self._metrics)
+        self.timeout_executor: TimeoutExecutor = TimeoutExecutor(
+            timeout_policy, capacity=bulkhead_policy.max_concurrent_calls,
+            metrics_collector=self._metrics)
+        self.rate_limiter: Optional[RateLimiter] = (
+            RateLimiter(rate_limiter_policy, self._metrics, clock)
+            if rate_limiter_policy else None)
+        self.result_cache: Optional[ResultCache] = (
+            ResultCache(cache_policy, self._metrics) if cache_policy
+            else None)
+        self._execute: Callable[..., Any] = (
+            self._execute_traced if observability
+            else partial(self._run, NOOP_SPAN, _no_retry_span))
 
     def execute(self, func: Callable[..., Any], *args: Any,
                 **kwargs: Any) -> Any:
-        ctx = ExecutionContext()
-
+        if self.result_cache is None:
+            return self._execute(func, *args, **kwargs)
+        return self._execute_cached(self.result_cache, func, *args, **kwargs)
+
+    def _execute_cached(self, cache: ResultCache, func: Callable[..., Any],
+                        *args: Any, **kwargs: Any) -> Any:
+        """
+        Cache stage in front of the pipeline: fresh hits skip the
+        downstream, stale entries are served while revalidating or when
+        the pipeline fails (circuit OPEN, retries exhausted, ...)
+        """
+        key = cache.key_for(func, args, kwargs)
+        if key is None:
+            return self._execute(func, *args, **kwargs)
+
+        tags = {"function": func.__qualname__}
+        state, value = cache.get(key)
+
+        if state == FRESH:
+            self._metrics.inc_counter("cache_hit_total", tags=tags)
+            return value
+
+        if state == STALE and cache.policy.stale_while_revalidate:
+            self._metrics.inc_counter("cache_stale_served_total",
+                                      tags={**tags, "reason": "revalidate"})
+            cache.refresh_in_background(
+                key, lambda: self._execute(func, *args, **kwargs))
+            return value
+
+        self._metrics.inc_counter("cache_miss_total", tags=tags)
+        try:
+            result = self._execute(func, *args, **kwargs)
+        except Exception as exc:
+            if state != STALE:
+                raise
+            self._metrics.inc_counter("cache_stale_served_total",
+                                      tags={**tags, "reason": "error"})
+            logger.warning(f"[CACHE] Serving stale result after failure: "
+                           f"{exc}")
+            return value
+
+        cache.put(key, result)
+        return result
+
+    def _execute_traced(self, func: Callable[..., Any], *args: Any,
+                        **kwargs: Any) -> Any:
         parent_span = current_span.get()
-        trace_id = current_trace_id.get()
-
-        root_span = InMemoryTraceSpan(
-            name="resilience_executor.execute",
-            trace_id=trace_id,
-            parent_span_id=parent_span.span_id if parent_span else None,
-        )
-
-        span_token = current_span.set(root_span)
-        trace_token = current_trace_id.set(root_span.trace_id)
+        trace_id = current_trace_id.get() or str(uuid.uuid4())
+
+        root_span: TraceSpan = NOOP_SPAN
+        retry_span_factory: Callable[[int], Any] = _no_retry_span
+        span_token = None
+        if trace_sampled(trace_id):
+            root_span = InMemoryTraceSpan(
+                name="resilience_executor.execute",
+                trace_id=trace_id,
+                parent_span_id=parent_span.span_id if parent_span else None,
+                clock=self.clock,
+            )
+            retry_span_factory = before_retry_attempt
+            span_token = current_span.set(root_span)
+        # carried even when not sampled, so nested calls decide alike
+        trace_token = current_trace_id.set(trace_id)
 
         root_span.start()
-        start_time = time.time()
+        start_time = self.clock.monotonic()
 
         try:
-            acquired = self.bulkhead.semaphore.acquire(
-                timeout=self.bulkhead.acquire_timeout
+            return self._run(root_span, retry_span_factory, func, *args,
+                             **kwargs)
+        finally:
+            duration_ms = (self.clock.monotonic() - start_time) * 1000
+            self._metrics.observe_latency(
+                "request_latency_ms",
+                duration_ms,
+                tags={"executor":"resilience_full_impl"},
             )
-            if not acquired:
-                raise RuntimeError("[BK] Bulkhead limit exceeded")
+            root_span.end()
+            if span_token is not None:
+                current_span.reset(span_token)
+            current_trace_id.reset(trace_token)
 
-            try:
-                if self._is_circuit_open():
-                    raise RuntimeError("[CB] Circuit is OPEN (fail-fast)")
+    def _run(self, root_span: TraceSpan,
+             retry_span_factory: Callable[[int], Any],
+             func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Bulkhead, circuit breaker and retries around func
+        """
+        ctx = ExecutionContext()
 
-                last_exception: Optional[Exception] = None
+        acquired = self.bulkhead.acquire()
+        if not acquired:
+            raise RuntimeError("[BK] Bulkhead limit exceeded")
 
-                for ctx.attempt in range(1, self.retry_policy.max_retries + 1):
-                    logger.debug(
-                        f"[RE][{ctx.req_id}] Attempt {ctx.attempt}/"
-                        f"{self.retry_policy.max_retries}"
-                    )
+        try:
+            last_exception: Optional[Exception] = None
+            delay: Optional[float] = None
 
-                    retry_span = before_retry_attempt(ctx.attempt)
+            for ctx.attempt in range(1, self.retry_policy.max_retries + 1):
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[RE][%s] Attempt %s/%s", ctx.req_id,
+                                 ctx.attempt, self.retry_policy.max_retries)
 
-                    try:
-                        result = self.timeout_executor.execute(func, *args,
-                                                               **kwargs)
-                        self._on_success(ctx)
-                        return result
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
 
-                    except Exception as exc:
-                        self._on_failure(ctx, exc)
-                        root_span.record_error(exc)
-                        metrics.inc_counter(
-                            "request_failure_total",
-                            tags={"exception":type(exc).__name__},
-                        )
-                        last_exception = exc
+                # every attempt reports an outcome, so each takes a permit
+                if self._is_circuit_open():
+                    raise RuntimeError("[CB] Circuit is OPEN (fail-fast)")
 
-                        if ctx.attempt == self.retry_policy.max_retries:
-                            break
+                retry_span = retry_span_factory(ctx.attempt)
+                attempt_started = self.clock.monotonic()
+
+                try:
+                    result = self.timeout_executor.execute(func, *args,
+                                                           **kwargs)
+                    self.bulkhead.record_attempt(
+                        self.clock.monotonic() - attempt_started, True)
+                    self._on_success(ctx)
+                    return result
+
+                except WorkerShareExhaustedError:
+                    # rejected locally, the dependency was never called
+                    self._release_permit()
+                    raise
+
+                except Exception as exc:
+                    self.bulkhead.record_attempt(
+                        self.clock.monotonic() - attempt_started, False)
+                    self._on_failure(ctx, exc)
+                    root_span.record_error(exc)
+                    self._metrics.inc_counter(
+                        "request_failure_total",
+                        tags={"exception":type(exc).__name__},
+                    )
+                    last_exception = exc
 
-                        time.sleep(self.retry_policy.delay_seconds)
+                    if ctx.attempt == self.retry_policy.max_retries:
+                        break
 
-                    finally:
-                        after_retry_attempt(retry_span)
+                    delay = self.retry_policy.next_delay(ctx.attempt,
+                                                         delay)
+                    self.clock.sleep(delay)
 
-                # retries exhausted
-                raise last_exception or RuntimeError("[RE] Execution failed")
+                finally:
+                    after_retry_attempt(retry_span)
 
-            finally:
-                self.bulkhead.semaphore.release()
+            # retries exhausted
+            raise last_exception or RuntimeError("[RE] Execution failed")
 
         finally:
-            duration_ms = (time.time() - start_time) * 1000
-            metrics.observe_latency(
-                "request_latency_ms",
-                duration_ms,
-                tags={"executor":"resilience_full_impl"},
-            )
-            root_span.end()
-            current_span.reset(span_token)
-            current_trace_id.reset(trace_token)
+            self.bulkhead.release()
 
     def _is_circuit_open(self) -> bool:
-        if self.cb_state.state != "OPEN":
+        if self.cb_state.state == "CLOSED":
             return False
 
-        elapsed:Optional[float] = time.time() - self.cb_state.last_failure_time
-        logger.debug(
-            f"[CB] OPEN for {elapsed:.2f}s "
-            f"(recovery={self.cb_policy.recovery_timeout}s)"
-        )
-
-        if elapsed >= self.cb_policy.recovery_timeout:
-            self.cb_state.state = "HALF_OPEN"
-            logger.info("[CB] State transition: OPEN → HALF_OPEN")
-            return False
-
-        return True
+        with self._cb_lock:
+            if self.cb_state.state == "OPEN":
+                elapsed: Optional[float] = (self.clock.monotonic() -
+                                            self.cb_state.last_failure_time)
+                logger.debug(
+                    f"[CB] OPEN for {elapsed:.2f}s "
+                    f"(recovery={self.cb_policy.recovery_timeout}s)"
+                )
+
+                if elapsed < self.cb_policy.recovery_timeout:
+                    return True
+
+                self.cb_state.state = "HALF_OPEN"
+                self.cb_state.half_open_calls = 0
+                self.cb_state.half_open_successes = 0
+                self.cb_state.half_open_failures = 0
+                logger.info("[CB] State transition: OPEN → HALF_OPEN")
+
+            if self.cb_state.state == "HALF_OPEN":
+                if self.cb_state.half_open_calls >= \
+                        self.cb_policy.half_open_max_calls:
+                    logger.debug("[CB] HALF_OPEN trial permits exhausted")
+                    return True
+                self.cb_state.half_open_calls += 1
+
+        return False
+
+    def _release_permit(self) -> None:
+        """
+        Hand back the trial permit of an attempt that never reached the
+        dependency; records no outcome
+        """
+        if self.cb_state.state != "HALF_OPEN":
+            return
+
+        with self._cb_lock:
+            if self.cb_state.state == "HALF_OPEN" and \
+                    self.cb_state.half_open_calls > 0:
+                self.cb_state.half_open_calls -= 1
 
     def _on_success(self, ctx: ExecutionContext) -> None:
-        logger.debug(
-            f"[CB][{ctx.req_id}] Attempt {ctx.attempt} succeeded"
-        )
-
-        if self.cb_state.state == "HALF_OPEN":
-            logger.info("[CB] State transition: HALF_OPEN → CLOSED")
-
-        self.cb_state.state = "CLOSED"
-        self.cb_state.failure_count = 0
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[CB][%s] Attempt %s succeeded", ctx.req_id,
+                         ctx.attempt)
+
+        with self._cb_lock:
+            if self.cb_state.state == "HALF_OPEN":
+                self.cb_state.half_open_successes += 1
+                if self.cb_state.half_open_successes < \
+                        self.cb_policy.half_open_success_threshold:
+                    self._reopen_if_trials_exhausted()
+                    return
+                logger.info("[CB] State transition: HALF_OPEN → CLOSED")
+
+            self.cb_state.state = "CLOSED"
+            self.cb_state.failure_count = 0
 
     def _on_failure(self, ctx: ExecutionContext, exc: Exception) -> None:
-        self.cb_state.failure_count += 1
-        self.cb_state.last_failure_time = time.time()
         ctx.last_exception = exc
 
         logger.error(
             f"[CB][{ctx.req_id}] Attempt {ctx.attempt} failed: {exc}"
         )
 
-        if self.cb_state.failure_count >= self.cb_policy.failure_threshold:
+        with self._cb_lock:
+            self.cb_state.failure_count += 1
+            self.cb_state.last_failure_time = self.clock.monotonic()
+
+            if self.cb_state.state == "HALF_OPEN":
+                self.cb_state.half_open_failures += 1
+                if self.cb_state.half_open_failures >= \
+                        self.cb_policy.half_open_failure_threshold:
+                    self.cb_state.state = "OPEN"
+                    logger.error("[CB] State transition: HALF_OPEN → OPEN")
+                else:
+                    self._reopen_if_trials_exhausted()
+                return
+
+            if self.cb_state.failure_count >= \
+                    self.cb_policy.failure_threshold:
+                self.cb_state.state = "OPEN"
+                logger.error("[CB] State transition: CLOSED → OPEN")
+
+    def _reopen_if_trials_exhausted(self) -> None:
+        """
+        Every trial finished without a success quorum; caller holds _cb_lock
+        """
+        finished = (self.cb_state.half_open_successes +
+                    self.cb_state.half_open_failures)
+        if finished >= self.cb_policy.half_open_max_calls:
             self.cb_state.state = "OPEN"
-            logger.error("[CB] State transition: CLOSED → OPEN")
+            self.cb_state.last_failure_time = self.clock.monotonic()
+            logger.error("[CB] State transition: HALF_OPEN → OPEN")
 
 
 def resilient(
@@ -176,12 +357,20 @@ def resilient(
     cb_policy: CircuitBreakerPolicy,
     bulkhead_policy: BulkheadPolicy,
     timeout_policy: TimeoutPolicy,
+    cache_policy: Optional[CachePolicy] = None,
+    observability: bool = True,
+    rate_limiter_policy: Optional[RateLimiterPolicy] = None,
 ) -> Any:
     """
     Resilience decorator factory.
+    cache_policy enables the result cache stage for idempotent reads.
+    observability=False drops the executor's own spans and metrics.
+    rate_limiter_policy caps the outgoing call rate.
     """
     executor = ResilienceExecutor(
-        retry_policy, cb_policy, bulkhead_policy, timeout_policy
+        retry_policy, cb_policy, bulkhead_policy, timeout_policy,
+        cache_policy, observability=observability,
+        rate_limiter_policy=rate_limiter_policy,
     )
 
     def decorator(func: Callable[..., Any]) -> Any:
@@ -0,0 +1,119 @@
+"""
+TTL + LRU result cache with stale serving
+
+FRESH  : younger than ttl_seconds
+STALE  : expired, but within stale_ttl_seconds
+MISS   : absent, or older than ttl_seconds + stale_ttl_seconds
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+
+from resilience_patterns_observability.observability.metrics import \
+    MetricsCollector
+from resilience_patterns_observability.observability.runtime import metrics
+from resilience_patterns_observability.policies.cache_policy import \
+    CachePolicy
+
+FRESH = "FRESH"
+STALE = "STALE"
+MISS = "MISS"
+
+
+def default_cache_key(func: Callable[..., Any], args: Tuple[Any, ...],
+                      kwargs: Dict[str, Any]) -> Hashable:
+    """
+    function identity + arguments
+    """
+    return (func.__module__, func.__qualname__, args,
+            tuple(sorted(kwargs.items())))
+
+
+class ResultCache:
+    """
+    Bounded result store; least recently used entries are evicted first
+    """
+
+    def __init__(self, policy: CachePolicy,
+                 metrics_collector: MetricsCollector = metrics) -> None:
+        self.policy = policy
+        self.metrics_collector = metrics_collector
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = \
+            OrderedDict()
+        self._refreshing: Set[Hashable] = set()
+        self._refresher = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="cache-refresh")
+
+    def key_for(self, func: Callable[..., Any], args: Tuple[Any, ...],
+                kwargs: Dict[str, Any]) -> Optional[Hashable]:
+        """
+        Cache key, or None when the arguments cannot be hashed
+        """
+        builder = self.policy.key_builder or default_cache_key
+        key = builder(func, args, kwargs)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, key: Hashable) -> Tuple[str, Any]:
+        """
+        :return: (FRESH | STALE | MISS, value)
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISS, None
+            stored_at, value = entry
+            age = now - stored_at
+            if age <= self.policy.ttl_seconds:
+                self._entries.move_to_end(key)
+                return FRESH, value
+            if age <= self.policy.ttl_seconds + self.policy.stale_ttl_seconds:
+                return STALE, value
+            del self._entries[key]
+            return MISS, None
+
+    def put(self, key: Hashable, value: Any) -> None:
+        evicted = 0
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.policy.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+        if evicted:
+            self.metrics_collector.inc_counter("cache_evictions_total",
+                                               value=evicted)
+
+    def refresh_in_background(self, key: Hashable,
+                              load: Callable[[], Any]) -> None:
+        """
+        Reload a stale key off the caller's thread; at most one refresh per
+        key runs at a time and a failed refresh keeps the stale value
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh() -> None:
+            try:
+                self.put(key, load())
+            except Exception:
+                self.metrics_collector.inc_counter(
+                    "cache_refresh_failure_total")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        self._refresher.submit(refresh)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,150 @@
+"""
+Process-wide elastic worker pool shared by every TimeoutExecutor
+
+capacity = sum of the bulkhead limits of the registered executors
+workers  = started lazily up to capacity, retired after idling
+"""
+
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from resilience_patterns_observability.observability.metrics import \
+    MetricsCollector
+from resilience_patterns_observability.observability.runtime import metrics
+
+logger = logging.getLogger(__name__)
+
+_WorkItem = Tuple["Future[Any]", Callable[..., Any], Tuple[Any, ...],
+                  Dict[str, Any]]
+
+
+class SharedWorkerPool:
+    """
+    Size-aware thread pool. Executors register the concurrency they are
+    allowed (their bulkhead limit) so the pool never serializes calls the
+    bulkhead would have let through. Each TimeoutExecutor keeps its running
+    calls, timed-out ones included, within what it registered, so one
+    executor's hung calls never hold another's workers. Gauges go to the
+    collector the caller passes, so an executor with observability off
+    publishes none.
+    """
+
+    def __init__(self, idle_timeout_seconds: float = 60.0) -> None:
+        self._lock = threading.Lock()
+        self._queue: "queue.SimpleQueue[Optional[_WorkItem]]" = \
+            queue.SimpleQueue()
+        self._idle_timeout_seconds = idle_timeout_seconds
+        self._capacity = 0
+        self._workers = 0
+        self._busy = 0
+        self._pending = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def queue_depth(self) -> int:
+        return self._pending
+
+    @property
+    def busy_workers(self) -> int:
+        return self._busy
+
+    def register(self, capacity: int,
+                 metrics_collector: MetricsCollector = metrics) -> None:
+        """
+        Grow the pool by the concurrency an executor is allowed
+        :param capacity:
+        :param metrics_collector:
+        """
+        if capacity <= 0:
+            raise ValueError("[POOL] capacity must be positive")
+        with self._lock:
+            self._capacity += capacity
+        self.publish_gauges(metrics_collector)
+
+    def unregister(self, capacity: int,
+                   metrics_collector: MetricsCollector = metrics) -> None:
+        """
+        Shrink the pool; surplus workers retire once they are idle
+        :param capacity:
+        :param metrics_collector:
+        """
+        with self._lock:
+            self._capacity = max(0, self._capacity - capacity)
+            surplus = self._workers - self._capacity
+        for _ in range(max(0, surplus)):
+            self._queue.put(None)
+        self.publish_gauges(metrics_collector)
+
+    def submit(self, func: Callable[..., Any], *args: Any,
+               **kwargs: Any) -> "Future[Any]":
+        """
+        Queue a call and return the future carrying its outcome
+        :param func:
+        :param args:
+        :param kwargs:
+        :return:
+        """
+        future: "Future[Any]" = Future()
+        with self._lock:
+            self._pending += 1
+            idle = self._workers - self._busy - (self._pending - 1)
+            spawn = idle <= 0 and self._workers < max(self._capacity, 1)
+            if spawn:
+                self._workers += 1
+        self._queue.put((future, func, args, kwargs))
+        if spawn:
+            threading.Thread(target=self._run_worker, daemon=True,
+                             name="resilience-shared-worker").start()
+        return future
+
+    def _run_worker(self) -> None:
+        while True:
+            try:
+                item = self._queue.get(timeout=self._idle_timeout_seconds)
+            except queue.Empty:
+                item = None
+
+            if item is None:
+                with self._lock:
+                    if self._pending == 0 or \
+                            self._workers > self._capacity:
+                        self._workers -= 1
+                        return
+                continue
+
+            future, func, args, kwargs = item
+            with self._lock:
+                self._pending -= 1
+                self._busy += 1
+            try:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(func(*args, **kwargs))
+                    except BaseException as exc:
+                        future.set_exception(exc)
+            finally:
+                with self._lock:
+                    self._busy -= 1
+
+    def publish_gauges(self,
+                       metrics_collector: MetricsCollector = metrics) -> None:
+        """
+        Queue depth and utilization, published after every submit
+        :param metrics_collector:
+        """
+        capacity = self._capacity
+        metrics_collector.set_gauge("worker_pool_queue_depth",
+                                    float(self._pending))
+        metrics_collector.set_gauge(
+            "worker_pool_utilization",
+            self._busy / capacity if capacity else 0.0,
+        )
+
+
+shared_worker_pool = SharedWorkerPool()
@@ -1,31 +1,113 @@
 """
-Timeout with ThreadPoolExecutor
+Timeout on the process-wide SharedWorkerPool
 """
 
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from concurrent.futures import Future
 from typing import Any, Callable, Optional
 
+from resilience_patterns_observability.core.shared_worker_pool import (
+    SharedWorkerPool, shared_worker_pool)
+from resilience_patterns_observability.observability.metrics import \
+    MetricsCollector
+from resilience_patterns_observability.observability.runtime import metrics
 from resilience_patterns_observability.policies.timeout_policy import \
     TimeoutPolicy
 
 
+class ExecutionTimeoutError(TimeoutError):
+    """
+    Raised when a call does not finish within TimeoutPolicy.timeout_seconds
+    """
+
+
+class WorkerShareExhaustedError(RuntimeError):
+    """
+    Raised when every slot of an executor's share of the shared pool is
+    held by calls that timed out but are still running
+    """
+
+
 class TimeoutExecutor:
     """
     TimeoutExecutor - Runs the Timeout Logic
+    capacity: concurrency this executor adds to the shared pool, normally
+    BulkheadPolicy.max_concurrent_calls. It is a hard limit on the
+    executor's running calls, timed-out ones included, so a hung
+    dependency cannot take workers another executor registered.
+    metrics_collector: where the timeout counter and the pool gauges go
     """
 
-    def __init__(self, timeout_policy: TimeoutPolicy) -> None:
+    def __init__(self, timeout_policy: TimeoutPolicy, capacity: int = 1,
+                 pool: Optional[SharedWorkerPool] = None,
+                 metrics_collector: MetricsCollector = metrics) -> None:
         self.timeout_policy = timeout_policy
-        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.capacity = capacity
+        self.pool = pool or shared_worker_pool
+        self.metrics_collector = metrics_collector
+        self._lock = threading.Lock()
+        self._running = 0
+        self._abandoned = 0
+        self.pool.register(capacity, metrics_collector)
+
+    @property
+    def abandoned_calls(self) -> int:
+        """
+        Timed-out calls whose worker is still running
+        """
+        return self._abandoned
 
     def execute(self, func: Callable[..., Any], *args:Any, **kwargs:Any) -> (
             Any):
         """
-        the function to be run is fed to the executor.
+        the function to be run is fed to the shared pool.
         """
-        future_1 = self.executor.submit(func, *args, **kwargs)
+        with self._lock:
+            if self._running >= self.capacity:
+                self.metrics_collector.inc_counter(
+                    "worker_share_rejections_total")
+                raise WorkerShareExhaustedError(
+                    f"[TO] {self._abandoned} timed-out calls still running")
+            self._running += 1
+
+        abandoned = False
+        try:
+            future_1 = self.pool.submit(func, *args, **kwargs)
+        except BaseException:
+            self._release_slot()
+            raise
+        self.pool.publish_gauges(self.metrics_collector)
         try:
             return future_1.result(timeout=self.timeout_policy.timeout_seconds)
-        except TimeoutError as e:
-            future_1.cancel()
-        
+        except TimeoutError:
+            if future_1.done():
+                # finished just as the wait gave up
+                return future_1.result()
+            abandoned = not future_1.cancel()
+            self.metrics_collector.inc_counter("request_timeout_total")
+            raise ExecutionTimeoutError(
+                f"[TO] Timed out after {self.timeout_policy.timeout_seconds}s"
+            ) from None
+        finally:
+            if abandoned:
+                # the worker keeps its slot until the call returns
+                with self._lock:
+                    self._abandoned += 1
+                future_1.add_done_callback(self._on_abandoned_done)
+            else:
+                self._release_slot()
+
+    def _release_slot(self) -> None:
+        with self._lock:
+            self._running -= 1
+
+    def _on_abandoned_done(self, _future: "Future[Any]") -> None:
+        with self._lock:
+            self._abandoned -= 1
+            self._running -= 1
+
+    def close(self) -> None:
+        """
+        Return this executor's capacity to the shared pool
+        """
+        self.pool.unregister(self.capacity, self.metrics_collector)
@@ -29,9 +29,9 @@ class FailureTranslator:
         if isinstance(exc, requests.HTTPError) and exc.response is not None:
             if exc.response.status_code == 429:
                 return Failure(
-                    failure_type=FailureType.VALIDATION,
+                    failure_type=FailureType.RATE_LIMIT,
                     message= str(exc),
-                    retryable=False,
+                    retryable=True,
                     original_exception=exc
                 )
 
@@ -0,0 +1,125 @@
+"""
+Bounded latency histogram
+
+HDR-style log-linear buckets: values are counted in units of
+`resolution`, every power of two is split into 2**significant_bits linear
+sub-buckets, so memory is fixed and any recorded value is reported within
+a relative error of 2**-significant_bits (about 3% by default).
+"""
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+class LogLinearHistogram:
+    """
+    Fixed-memory histogram with O(1) record, merge and percentile queries
+    """
+
+    def __init__(self, significant_bits: int = 5, resolution: float = 0.001,
+                 max_value: float = 3_600_000.0) -> None:
+        """
+        :param significant_bits: linear sub-buckets per power of two, as
+            bits
+        :param resolution: smallest distinguishable value (0.001 = 1µs
+            for milliseconds)
+        :param max_value: larger values are counted in the top bucket
+        """
+        if significant_bits < 1 or resolution <= 0 or \
+                max_value <= resolution:
+            raise ValueError("[HISTOGRAM] invalid bucket layout")
+        self.significant_bits = significant_bits
+        self.resolution = resolution
+        self.max_value = max_value
+        self._sub_buckets = 1 << significant_bits
+        self._max_units = int(max_value / resolution)
+        self.counts: List[int] = [0] * (self._index(self._max_units) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def _index(self, units: int) -> int:
+        if units < self._sub_buckets:
+            return units
+        shift = units.bit_length() - self.significant_bits - 1
+        return (shift + 1) * self._sub_buckets + (
+                (units >> shift) - self._sub_buckets)
+
+    def _bucket_midpoint(self, index: int) -> float:
+        if index < self._sub_buckets:
+            return index * self.resolution
+        shift = index // self._sub_buckets - 1
+        sub_bucket = index % self._sub_buckets + self._sub_buckets
+        lower = sub_bucket << shift
+        return (lower + (1 << shift) / 2) * self.resolution
+
+    def record(self, value: float) -> None:
+        """
+        :param value: negative values are counted as 0
+        """
+        units = min(max(int(value / self.resolution), 0), self._max_units)
+        self.counts[self._index(units)] += 1
+        self.count += 1
+        self.sum += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other: "LogLinearHistogram") -> None:
+        """
+        Add another histogram with the same layout into this one
+        """
+        if len(other.counts) != len(self.counts) or \
+                other.resolution != self.resolution:
+            raise ValueError("[HISTOGRAM] cannot merge different layouts")
+        for index, bucket_count in enumerate(other.counts):
+            if bucket_count:
+                self.counts[index] += bucket_count
+        self.count += other.count
+        self.sum += other.sum
+        for bound in (other.min, other.max):
+            if bound is not None:
+                self.min = bound if self.min is None else min(self.min, bound)
+                self.max = bound if self.max is None else max(self.max, bound)
+
+    def copy(self) -> "LogLinearHistogram":
+        """
+        Point-in-time snapshot that can be merged and queried independently
+        """
+        snapshot = LogLinearHistogram(self.significant_bits, self.resolution,
+                                      self.max_value)
+        snapshot.merge(self)
+        return snapshot
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """
+        :param percentile: 0-100
+        :return: None when empty
+        """
+        if not self.count:
+            return None
+        rank = max(1, int(round(self.count * percentile / 100)))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                value = self._bucket_midpoint(index)
+                # keep the estimate within the recorded range
+                return min(max(value, self.min or 0.0),
+                           self.max if self.max is not None else value)
+        return self.max
+
+    def percentiles(self,
+                    percentiles: Tuple[float, ...] = DEFAULT_PERCENTILES
+                    ) -> Dict[str, Optional[float]]:
+        """
+        :return: e.g. {"p50": ..., "p90": ..., "p99": ..., "p999": ...}
+        """
+        return {"p" + f"{p:g}".replace(".", ""): self.percentile(p)
+                for p in percentiles}
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
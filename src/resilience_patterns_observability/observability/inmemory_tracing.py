@@ -3,10 +3,14 @@ In-memory tracing
 """
 # observability/inmemory_tracing.py
 import logging
-import time
 import uuid
 from typing import Any, Dict, List
 
+from resilience_patterns_observability.clock import SYSTEM_CLOCK, Clock
+from resilience_patterns_observability.observability.logging import \
+    EVENT_LOGGING
+from resilience_patterns_observability.observability.sampling import (
+    SAMPLING, TailSampler, trace_sampled)
 from resilience_patterns_observability.observability.tracing import TraceSpan
 
 logger = logging.getLogger(__name__)
@@ -15,11 +19,21 @@ logger = logging.getLogger(__name__)
 class InMemoryTraceSpan(TraceSpan):
     """
     In-memory trace span for local tracing.
+    start_time/end_time are wall time for export; the duration is
+    measured on the performance counter.
+    Span events are logged at DEBUG only when enabled with
+    configure_event_logging, and errors without a traceback unless asked.
+    A span of a trace that is not head-sampled records nothing; the spans
+    of a sampled one go to the configured TailSampler.
     """
 
     def __init__(self, name: str, trace_id: str | None = None,
-                 parent_span_id: str | None = None) -> None:
+                 parent_span_id: str | None = None,
+                 clock: Clock = SYSTEM_CLOCK) -> None:
         self.name = name
+        self._clock = clock
+        self._started: float | None = None
+        self.duration_ms: float | None = None
         self.trace_id = trace_id or str(uuid.uuid4())
         self.parent_span_id = parent_span_id
         self.span_id = str(uuid.uuid4())
@@ -28,54 +42,74 @@ class InMemoryTraceSpan(TraceSpan):
         self.annotations: List[Dict[str, Any]] = []
         self.error: str | None = None
         self.events: List[Dict[str, Any]] = []
+        self.sampled = trace_sampled(self.trace_id)
+        self._tail: TailSampler | None = None
 
 
     def start(self) -> None:
-        self.start_time = time.time()
-        logger.info(
-            "SPAN start name=%s trace_id=%s span_id=%s",
-            self.name,
-            self.trace_id,
-            self.span_id,
-        )
+        self.start_time = self._clock.wall()
+        self._started = self._clock.perf_counter()
+        if not self.sampled:
+            return
+        self._tail = SAMPLING.tail
+        if self._tail is not None:
+            self._tail.on_start(self)
+        if EVENT_LOGGING.sampled():
+            logger.debug(
+                "SPAN start name=%s trace_id=%s span_id=%s",
+                self.name,
+                self.trace_id,
+                self.span_id,
+            )
 
 
     def annotate(self, key: str, value: Any) -> None:
         event = {
-            "ts":time.time(),
+            "ts":self._clock.wall(),
             "key":key,
             "value":value,
         }
         self.annotations.append(event)
 
-        logger.info(
-            "SPAN annotate trace_id=%s span_id=%s parent_span_id=%s  key=%s value=%s",
-            self.trace_id,
-            self.span_id,
-            self.parent_span_id,
-            key,
-            value,
-        )
+        if self.sampled and EVENT_LOGGING.sampled():
+            logger.debug(
+                "SPAN annotate trace_id=%s span_id=%s parent_span_id=%s  key=%s value=%s",
+                self.trace_id,
+                self.span_id,
+                self.parent_span_id,
+                key,
+                value,
+            )
 
 
     def record_error(self, error: Exception) -> None:
         self.error = repr(error)
-        logger.exception(
-            "SPAN error trace_id=%s span_id=%s",
-            self.trace_id,
-            self.span_id,
-        )
+        if self.sampled and EVENT_LOGGING.sampled():
+            logger.debug(
+                "SPAN error trace_id=%s span_id=%s error=%s",
+                self.trace_id,
+                self.span_id,
+                self.error,
+                exc_info=error if EVENT_LOGGING.tracebacks else None,
+            )
 
 
     def end(self) -> None:
-        self.end_time = time.time()
-        duration_ms = (self.end_time - (
-                self.start_time or self.end_time)) * 1000
+        self.end_time = self._clock.wall()
+        ended = self._clock.perf_counter()
+        duration_ms = (ended - (
+                self._started if self._started is not None else ended)) * 1000
+        self.duration_ms = duration_ms
 
-        logger.info(
-            "SPAN end name=%s trace_id=%s span_id=%s duration_ms=%.2f",
-            self.name,
-            self.trace_id,
-            self.span_id,
-            duration_ms,
-        )
+        if not self.sampled:
+            return
+        if self._tail is not None:
+            self._tail.on_end(self)
+        if EVENT_LOGGING.sampled():
+            logger.debug(
+                "SPAN end name=%s trace_id=%s span_id=%s duration_ms=%.2f",
+                self.name,
+                self.trace_id,
+                self.span_id,
+                duration_ms,
+            )
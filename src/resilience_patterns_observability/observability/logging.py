@@ -0,0 +1,191 @@
+"""
+Observability Logging
+
+Two things keep logging off the request path:
+
+- per-event logs of metrics and spans (every counter, latency, gauge and
+  span start/annotate/end/error) are opt-in and sampled, see
+  configure_event_logging(); they are off by default
+- AsyncLogHandler queues records and hands them in batches to the real
+  handlers on a background writer thread, so a caller never formats a
+  message or waits on stderr. install_async_logging() puts it in front of
+  a logger's existing handlers.
+"""
+import atexit
+import logging
+import random
+import threading
+from collections import deque
+from typing import Any, Deque, List, Optional
+
+
+class EventLogConfig:
+    """
+    Settings for per-event debug logging of metrics and spans
+    """
+    __slots__ = ("enabled", "sample_rate", "tracebacks")
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.sample_rate = 1.0
+        self.tracebacks = False
+
+    def sampled(self) -> bool:
+        """
+        Whether this event is logged; a single attribute read while
+        disabled
+        """
+        return self.enabled and (self.sample_rate >= 1.0
+                                 or random.random() < self.sample_rate)
+
+
+EVENT_LOGGING = EventLogConfig()
+
+
+def configure_event_logging(enabled: bool, sample_rate: float = 1.0,
+                            tracebacks: bool = False) -> None:
+    """
+    :param enabled: log metric and span events at DEBUG
+    :param sample_rate: fraction of events logged, 0-1
+    :param tracebacks: include the traceback when a span records an error
+    """
+    if not 0.0 <= sample_rate <= 1.0:
+        raise ValueError("[LOGGING] sample_rate must be within 0-1")
+    EVENT_LOGGING.sample_rate = sample_rate
+    EVENT_LOGGING.tracebacks = tracebacks
+    EVENT_LOGGING.enabled = enabled
+
+
+class AsyncLogHandler(logging.Handler):
+    """
+    Queue-backed handler with a background writer.
+
+    emit() only appends the record to a bounded queue; the writer wakes
+    once batch_size records are queued or every flush_interval seconds,
+    passes the batch to the target handlers and flushes once per batch.
+    A plain StreamHandler target gets the whole batch in one write. When
+    the queue is full the record is dropped and counted instead of
+    blocking the caller, and the writer reports the drops with a warning.
+
+    Messages are formatted on the writer thread, so arguments passed to a
+    log call must not be mutated afterwards.
+    """
+
+    def __init__(self, targets: List[logging.Handler],
+                 queue_size: int = 10_000, batch_size: int = 256,
+                 flush_interval: float = 0.05) -> None:
+        super().__init__()
+        if queue_size <= 0 or batch_size <= 0 or flush_interval <= 0:
+            raise ValueError("[LOGGING] queue_size, batch_size and "
+                             "flush_interval must be > 0")
+        self.targets = list(targets)
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._records: Deque[logging.LogRecord] = deque()
+        self._wakeup = threading.Event()
+        self._stopped = False
+        self.enqueued = 0
+        self.dropped = 0
+        self.written = 0
+        self.batches = 0
+        self._reported_drops = 0
+        self._writer = threading.Thread(target=self._run,
+                                        name="log-writer", daemon=True)
+        self._writer.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # called under the handler lock, so the counters need no other
+        if len(self._records) >= self.queue_size:
+            self.dropped += 1
+            return
+        self._records.append(record)
+        self.enqueued += 1
+        if len(self._records) == self.batch_size:
+            self._wakeup.set()
+
+    def _run(self) -> None:
+        while True:
+            if len(self._records) < self.batch_size and not self._stopped:
+                self._wakeup.wait(self.flush_interval)
+                self._wakeup.clear()
+            stopped = self._stopped
+            while self._records:
+                batch: List[logging.LogRecord] = []
+                while self._records and len(batch) < self.batch_size:
+                    batch.append(self._records.popleft())
+                self._write(batch)
+            if stopped:
+                return
+
+    def _write(self, records: List[logging.LogRecord]) -> None:
+        dropped = self.dropped
+        if dropped != self._reported_drops:
+            records.append(logging.makeLogRecord({
+                "name": __name__, "levelno": logging.WARNING,
+                "levelname": "WARNING",
+                "msg": "[LOGGING] dropped %d log records, queue full",
+                "args": (dropped - self._reported_drops,)}))
+            self._reported_drops = dropped
+        for target in self.targets:
+            try:
+                if isinstance(target, logging.StreamHandler) and \
+                        type(target).emit is logging.StreamHandler.emit:
+                    self._write_stream(target, records)
+                else:
+                    for record in records:
+                        if record.levelno >= target.level:
+                            target.handle(record)
+                    target.flush()
+            except Exception:
+                self.handleError(records[0])
+        self.written += len(records)
+        self.batches += 1
+
+    @staticmethod
+    def _write_stream(target: "logging.StreamHandler[Any]",
+                      records: List[logging.LogRecord]) -> None:
+        text = "".join(target.format(record) + target.terminator
+                       for record in records
+                       if record.levelno >= target.level
+                       and target.filter(record))
+        if text:
+            target.acquire()
+            try:
+                target.stream.write(text)
+                target.flush()
+            finally:
+                target.release()
+
+    def close(self) -> None:
+        """
+        Write what is queued and stop the writer
+        """
+        self._stopped = True
+        self._wakeup.set()
+        if self._writer.is_alive():
+            self._writer.join()
+        super().close()
+
+
+def install_async_logging(logger: Optional[logging.Logger] = None,
+                          queue_size: int = 10_000,
+                          batch_size: int = 256,
+                          flush_interval: float = 0.05) -> AsyncLogHandler:
+    """
+    Move the handlers of logger (root by default) behind one
+    AsyncLogHandler; the queue is drained at interpreter exit
+
+    :return: the installed handler
+    """
+    logger = logger or logging.getLogger()
+    targets = [handler for handler in logger.handlers
+               if not isinstance(handler, AsyncLogHandler)]
+    async_handler = AsyncLogHandler(targets, queue_size=queue_size,
+                                    batch_size=batch_size,
+                                    flush_interval=flush_interval)
+    for handler in targets:
+        logger.removeHandler(handler)
+    logger.addHandler(async_handler)
+    atexit.register(async_handler.close)
+    return async_handler
@@ -0,0 +1,50 @@
+"""
+No-op tracing and metrics, for executors built with observability off
+"""
+from typing import Any, Dict, Optional
+
+from resilience_patterns_observability.observability.metrics import \
+    MetricsCollector
+from resilience_patterns_observability.observability.tracing import TraceSpan
+
+
+class NoopTraceSpan(TraceSpan):
+    """
+    Span that records nothing; NOOP_SPAN is shared by every call
+    """
+    trace_id: Optional[str] = None
+    span_id: Optional[str] = None
+
+    def start(self) -> None:
+        pass
+
+    def annotate(self, key: str, value: Any) -> None:
+        pass
+
+    def record_error(self, error: Exception) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+
+class NoopMetricsCollector(MetricsCollector):
+    """
+    Collector that drops every measurement
+    """
+
+    def inc_counter(self, name: str, value: int = 1,
+                    tags: Optional[Dict[str, str]] = None) -> None:
+        pass
+
+    def observe_latency(self, name: str, duration_ms: float,
+                        tags: Optional[Dict[str, str]] = None) -> None:
+        pass
+
+    def set_gauge(self, name: str, value: float,
+                  tags: Optional[Dict[str, str]] = None) -> None:
+        pass
+
+
+NOOP_SPAN = NoopTraceSpan()
+NOOP_METRICS = NoopMetricsCollector()
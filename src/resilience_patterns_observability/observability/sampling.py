@@ -0,0 +1,152 @@
+"""
+Trace sampling
+
+Head sampling decides when a trace starts whether its spans are recorded
+at all. The decision is a hash of the trace id, so every span that shares
+current_trace_id (retry attempts, nested calls, other services given the
+same id) makes the same decision without passing a flag around.
+
+Tail sampling buffers the spans of each head-sampled trace until its last
+open span ends, then keeps the trace only if a span recorded an error or
+the trace took at least latency_threshold_ms. Buffered traces, spans per
+trace and kept traces are all capped, so memory stays bounded.
+"""
+import threading
+import zlib
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, List, Optional
+
+
+def head_sampled(trace_id: str, rate: float) -> bool:
+    """
+    :param trace_id:
+    :param rate: share of traces sampled, 0-1
+    :return: the same answer for the same trace id, in any process
+    """
+    if rate >= 1.0:
+        return True
+    if rate <= 0.0:
+        return False
+    return zlib.crc32(trace_id.encode()) < rate * 2 ** 32
+
+
+class _TraceBuffer:
+    __slots__ = ("spans", "open_spans", "errored", "duration_ms")
+
+    def __init__(self) -> None:
+        self.spans: List[Any] = []
+        self.open_spans = 0
+        self.errored = False
+        self.duration_ms = 0.0
+
+
+class TailSampler:
+    """
+    Keeps errored and slow traces out of the head-sampled ones
+    """
+
+    def __init__(self, latency_threshold_ms: float,
+                 max_traces: int = 1_000,
+                 max_spans_per_trace: int = 256,
+                 max_kept_traces: int = 100,
+                 exporter: Optional[Callable[[List[Any]], None]] = None
+                 ) -> None:
+        """
+        :param latency_threshold_ms: traces at least this slow are kept
+        :param max_traces: traces buffered at once; the oldest is dropped
+            to make room
+        :param max_spans_per_trace: later spans of a trace are not
+            buffered, but still count towards its error and latency
+        :param max_kept_traces: most recent kept traces held in `kept`
+        :param exporter: called with the spans of every kept trace
+        """
+        if max_traces <= 0 or max_spans_per_trace <= 0 or \
+                max_kept_traces <= 0:
+            raise ValueError("[SAMPLING] max_traces, max_spans_per_trace "
+                             "and max_kept_traces must be > 0")
+        self.latency_threshold_ms = latency_threshold_ms
+        self.max_traces = max_traces
+        self.max_spans_per_trace = max_spans_per_trace
+        self.exporter = exporter
+        self.kept: Deque[List[Any]] = deque(maxlen=max_kept_traces)
+        self.traces_kept = 0
+        self.traces_dropped = 0
+        self.traces_evicted = 0
+        self.spans_dropped = 0
+        self._buffers: "OrderedDict[str, _TraceBuffer]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def on_start(self, span: Any) -> None:
+        with self._lock:
+            buffer = self._buffers.get(span.trace_id)
+            if buffer is None:
+                if len(self._buffers) >= self.max_traces:
+                    self._buffers.popitem(last=False)
+                    self.traces_evicted += 1
+                buffer = self._buffers[span.trace_id] = _TraceBuffer()
+            buffer.open_spans += 1
+
+    def on_end(self, span: Any) -> None:
+        with self._lock:
+            buffer = self._buffers.get(span.trace_id)
+            if buffer is None:
+                # evicted while open
+                self.spans_dropped += 1
+                return
+            if len(buffer.spans) < self.max_spans_per_trace:
+                buffer.spans.append(span)
+            else:
+                self.spans_dropped += 1
+            buffer.errored = buffer.errored or span.error is not None
+            buffer.duration_ms = max(buffer.duration_ms,
+                                     span.duration_ms or 0.0)
+            buffer.open_spans -= 1
+            if buffer.open_spans > 0:
+                return
+            del self._buffers[span.trace_id]
+            if not buffer.errored and \
+                    buffer.duration_ms < self.latency_threshold_ms:
+                self.traces_dropped += 1
+                return
+            self.traces_kept += 1
+            self.kept.append(buffer.spans)
+
+        if self.exporter is not None:
+            self.exporter(buffer.spans)
+
+    @property
+    def buffered_traces(self) -> int:
+        return len(self._buffers)
+
+
+class SamplingConfig:
+    """
+    Sampling applied by InMemoryTraceSpan and the executor
+    """
+    __slots__ = ("head_rate", "tail")
+
+    def __init__(self) -> None:
+        self.head_rate = 1.0
+        self.tail: Optional[TailSampler] = None
+
+
+SAMPLING = SamplingConfig()
+
+
+def configure_sampling(head_rate: float = 1.0,
+                       tail: Optional[TailSampler] = None) -> None:
+    """
+    :param head_rate: share of traces recorded, 0-1
+    :param tail: keep only errored or slow traces of the recorded ones
+    """
+    if not 0.0 <= head_rate <= 1.0:
+        raise ValueError("[SAMPLING] head_rate must be within 0-1")
+    SAMPLING.head_rate = head_rate
+    SAMPLING.tail = tail
+
+
+def trace_sampled(trace_id: str) -> bool:
+    """
+    Head sampling decision for the configured rate
+    """
+    return head_sampled(trace_id, SAMPLING.head_rate)
@@ -0,0 +1,136 @@
+"""
+Per-thread metric shards
+
+A series handle keeps one shard per recording thread. Only that thread
+writes it, so recording takes no lock and threads never contend on the
+same memory; readers fold the shards together. Shards of finished threads
+are folded into a retired shard whenever a new thread registers one, so
+memory stays bounded by the live threads even if nothing ever reads.
+
+resilience_full_impl.observability.thread_shards is the same base for that
+package; the packages never import each other.
+"""
+import threading
+from abc import ABC, abstractmethod
+from typing import Generic, List, Tuple, TypeVar
+
+from resilience_patterns_observability.observability.histogram import \
+    LogLinearHistogram
+
+S = TypeVar("S")
+
+
+class ThreadShards(ABC, Generic[S]):
+    """
+    Base of the series handles
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._shards: List[Tuple[threading.Thread, S]] = []
+        self._retired = self._new_shard()
+        self._shards_lock = threading.Lock()
+
+    @abstractmethod
+    def _new_shard(self) -> S:
+        """
+        Empty shard
+        """
+
+    @abstractmethod
+    def _fold(self, into: S, shard: S) -> None:
+        """
+        Add shard into `into`
+        """
+
+    def _local_shard(self) -> S:
+        """
+        Shard of the calling thread, created on its first record
+        """
+        shard = self._new_shard()
+        self._local.shard = shard
+        with self._shards_lock:
+            self._retire_dead()
+            self._shards.append((threading.current_thread(), shard))
+        return shard
+
+    def _retire_dead(self) -> None:
+        """
+        Fold the shards of finished threads into the retired shard and
+        drop them; caller holds _shards_lock
+        """
+        live = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                live.append((thread, shard))
+            else:
+                self._fold(self._retired, shard)
+        self._shards = live
+
+    def _collect(self, into: S) -> S:
+        """
+        Fold every shard into `into`, a fresh shard
+        """
+        with self._shards_lock:
+            self._retire_dead()
+            self._fold(into, self._retired)
+            for _, shard in self._shards:
+                self._fold(into, shard)
+        return into
+
+
+class CounterHandle(ThreadShards[List[int]]):
+    """
+    Pre-bound counter series
+    """
+
+    def _new_shard(self) -> List[int]:
+        return [0]
+
+    def _fold(self, into: List[int], shard: List[int]) -> None:
+        into[0] += shard[0]
+
+    def inc(self, value: int = 1) -> None:
+        try:
+            self._local.shard[0] += value
+        except AttributeError:
+            self._local_shard()[0] += value
+
+    def value(self) -> int:
+        return self._collect([0])[0]
+
+
+class LatencyHandle(ThreadShards[LogLinearHistogram]):
+    """
+    Pre-bound latency series, one bounded histogram per thread
+    """
+
+    def _new_shard(self) -> LogLinearHistogram:
+        return LogLinearHistogram()
+
+    def _fold(self, into: LogLinearHistogram,
+              shard: LogLinearHistogram) -> None:
+        into.merge(shard)
+
+    def observe(self, duration_ms: float) -> None:
+        try:
+            shard: LogLinearHistogram = self._local.shard
+        except AttributeError:
+            shard = self._local_shard()
+        shard.record(duration_ms)
+
+    def snapshot(self) -> LogLinearHistogram:
+        return self._collect(LogLinearHistogram())
+
+
+class GaugeHandle:
+    """
+    Pre-bound gauge series; the last write wins
+    """
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
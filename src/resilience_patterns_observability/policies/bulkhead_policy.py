@@ -1,15 +1,28 @@
 """
 class that defines bulkhead policy
 """
+from typing import Optional
+
+AIMD = "AIMD"
+GRADIENT = "GRADIENT"
 
 
 class BulkheadPolicy:
     """
-    @param: max_concurrent_calls:int
+    @param: max_concurrent_calls:int - fixed limit, or upper bound of the
+    adaptive limit
     @param: acquire_timeout: int
+    @param: adaptive_limit: Optional[str] - AIMD or GRADIENT
+    @param: min_concurrent_calls: int - lower bound of the adaptive limit
+    @param: initial_concurrent_calls: Optional[int] - starting adaptive
+    limit, defaults to half of max_concurrent_calls
     """
 
     def __init__(self, max_concurrent_calls: int = 5, acquire_timeout: int =
-    0) -> None:
+    0, adaptive_limit: Optional[str] = None, min_concurrent_calls: int = 1,
+                 initial_concurrent_calls: Optional[int] = None) -> None:
         self.max_concurrent_calls = max_concurrent_calls
         self.acquire_timeout = acquire_timeout
+        self.adaptive_limit = adaptive_limit
+        self.min_concurrent_calls = min_concurrent_calls
+        self.initial_concurrent_calls = initial_concurrent_calls
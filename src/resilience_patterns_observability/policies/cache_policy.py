@@ -0,0 +1,32 @@
+"""
+class that defines the result cache policy
+"""
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class CachePolicy:
+    """
+    ttl_seconds: float - how long a result is served as fresh
+    max_entries: int - LRU bound on cached results
+    stale_ttl_seconds: float - how long after expiry a result may still be
+    served stale (stale-if-error / stale-while-revalidate)
+    stale_while_revalidate: bool - serve a stale result at once and refresh
+    it in the background instead of calling the downstream inline
+    key_builder: callable(func, args, kwargs) -> hashable cache key
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 1024,
+                 stale_ttl_seconds: float = 0.0,
+                 stale_while_revalidate: bool = False,
+                 key_builder: Optional[Callable[
+                     [Callable[..., Any], Tuple[Any, ...], Dict[str, Any]],
+                     Hashable]] = None) -> None:
+        if ttl_seconds <= 0:
+            raise ValueError("[CACHE] ttl_seconds must be positive")
+        if max_entries <= 0:
+            raise ValueError("[CACHE] max_entries must be positive")
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.stale_ttl_seconds = stale_ttl_seconds
+        self.stale_while_revalidate = stale_while_revalidate
+        self.key_builder = key_builder
@@ -8,9 +8,20 @@ class CircuitBreakerPolicy:
     Class that holds the Circuit Breaker Policy parameters
     failure_threshold: int
     recovery_threshold: int
+    half_open_max_calls: int - trial calls let through after
+    recovery_timeout, other callers are rejected
+    half_open_success_threshold: int - trial successes that close the
+    circuit, defaults to half_open_max_calls
+    half_open_failure_threshold: int - trial failures that re-open it
     """
 
     def __init__(self, failure_threshold: int = 3, recovery_timeout: int =
-    10) -> None:
+    10, half_open_max_calls: int = 1,
+                 half_open_success_threshold: int | None = None,
+                 half_open_failure_threshold: int = 1) -> None:
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.half_open_success_threshold = (half_open_success_threshold
+                                            or half_open_max_calls)
+        self.half_open_failure_threshold = half_open_failure_threshold
@@ -8,10 +8,15 @@ class CircuitBreakerState:
     state : "CLOSED", "HALF-OPEN", "OPEN"
     failure_count-> int : Counter to track how many times the downstream api
     attempt failed
-    last_failure_time -> datetime
+    last_failure_time -> float : monotonic seconds of the last failure
+    half_open_calls -> int : trial permits handed out since HALF_OPEN
+    half_open_successes / half_open_failures -> int : trial outcomes
     """
 
     def __init__(self) -> None:
         self.state = "CLOSED"
         self.failure_count = 0
         self.last_failure_time = None
+        self.half_open_calls = 0
+        self.half_open_successes = 0
+        self.half_open_failures = 0
@@ -3,47 +3,90 @@ In-memory metrics
 """
 import logging
 import threading
-from collections import defaultdict
-from typing import Dict, Tuple, Optional
+from typing import Any, Callable, Dict, Tuple, Optional, TypeVar
 
+from resilience_patterns_observability.observability.histogram import \
+    LogLinearHistogram
+from resilience_patterns_observability.observability.logging import \
+    EVENT_LOGGING
 from resilience_patterns_observability.observability.metrics import \
     MetricsCollector
+from resilience_patterns_observability.observability.thread_shards import \
+    CounterHandle, GaugeHandle, LatencyHandle
 
 logger = logging.getLogger(__name__)
 
+H = TypeVar("H")
+SeriesKey = Tuple[str, frozenset]
+
 
 class InMemoryMetricsCollector(MetricsCollector):
     """
     In-memory metrics store for local dev and testing
+
+    Latencies go into a fixed-memory LogLinearHistogram per series, so a
+    long-running process does not grow with the number of samples.
+
+    Series resolve once to handles (counter(), latency(), gauge()) that
+    record into per-thread shards without a lock; the values are
+    aggregated on read.
+
+    Per-event logging is off unless enabled with configure_event_logging.
     """
 
     def __init__(self) -> None:
         self._lock = threading.Lock()
-        self._counters: Dict[Tuple[str, frozenset], int] = defaultdict(int)
-        self._latencies: Dict[
-            Tuple[str, frozenset], list[float]] = defaultdict(list)
-        self._gauges: Dict[Tuple[str, frozenset], float] = {}
+        self._counter_series: Dict[SeriesKey, CounterHandle] = {}
+        self._latency_series: Dict[SeriesKey, LatencyHandle] = {}
+        self._gauge_series: Dict[SeriesKey, GaugeHandle] = {}
+        # (table id, name, *tags.items()) as passed -> handle
+        self._handles: Dict[Tuple[Any, ...], Any] = {}
 
     def _key(self, name: str, tags: Optional[Dict[str, str]]) -> Tuple[str,
     frozenset]:
         return name, frozenset((tags or {}).items())
 
+    def _bind(self, series: Dict[SeriesKey, H], name: str,
+              tags: Optional[Dict[str, str]], factory: Callable[[], H]) -> H:
+        handle_key = (id(series), name, *tags.items()) if tags \
+            else (id(series), name)
+        handle: Optional[H] = self._handles.get(handle_key)
+        if handle is None:
+            key = self._key(name, tags)
+            with self._lock:
+                handle = series.get(key)
+                if handle is None:
+                    handle = series[key] = factory()
+                self._handles[handle_key] = handle
+        return handle
+
+    def counter(self, name: str,
+                tags: Optional[Dict[str, str]] = None) -> CounterHandle:
+        return self._bind(self._counter_series, name, tags, CounterHandle)
+
+    def latency(self, name: str,
+                tags: Optional[Dict[str, str]] = None) -> LatencyHandle:
+        return self._bind(self._latency_series, name, tags, LatencyHandle)
+
+    def gauge(self, name: str,
+              tags: Optional[Dict[str, str]] = None) -> GaugeHandle:
+        return self._bind(self._gauge_series, name, tags, GaugeHandle)
+
     def inc_counter(
             self,
             name: str,
             value: int = 1,
             tags: Optional[Dict[str, str]] = None,
     ) -> None:
-        key = self._key(name, tags)
-        with self._lock:
-            self._counters[key] = self._counters.get(key, 0) + value
+        self.counter(name, tags).inc(value)
 
-        logger.info(
-            "METRIC counter=%s value=%s tags=%s",
-            name,
-            value,
-            tags,
-        )
+        if EVENT_LOGGING.sampled():
+            logger.debug(
+                "METRIC counter=%s value=%s tags=%s",
+                name,
+                value,
+                tags,
+            )
 
     def observe_latency(
             self,
@@ -51,16 +94,15 @@ class InMemoryMetricsCollector(MetricsCollector):
             duration_ms: float,
             tags: Optional[Dict[str, str]] = None,
     ) -> None:
-        key = self._key(name, tags)
-        with self._lock:
-            self._latencies[key].append(duration_ms)
+        self.latency(name, tags).observe(duration_ms)
 
-        logger.info(
-            "METRIC latency=%s duration_ms=%.2f tags=%s",
-            name,
-            duration_ms,
-            tags,
-        )
+        if EVENT_LOGGING.sampled():
+            logger.debug(
+                "METRIC latency=%s duration_ms=%.2f tags=%s",
+                name,
+                duration_ms,
+                tags,
+            )
 
     def set_gauge(
             self,
@@ -68,13 +110,49 @@ class InMemoryMetricsCollector(MetricsCollector):
             value: float,
             tags: Optional[Dict[str, str]] = None,
     ) -> None:
-        key = self._key(name, tags)
+        self.gauge(name, tags).value = value
+
+        if EVENT_LOGGING.sampled():
+            logger.debug(
+                "METRIC gauge=%s value=%.2f tags=%s",
+                name,
+                value,
+                tags,
+            )
+
+    @property
+    def _counters(self) -> Dict[SeriesKey, int]:
+        with self._lock:
+            series = list(self._counter_series.items())
+        return {key: counter.value() for key, counter in series}
+
+    @property
+    def _gauges(self) -> Dict[SeriesKey, float]:
         with self._lock:
-            self._gauges[key] = value
-
-        logger.info(
-            "METRIC gauge=%s value=%.2f tags=%s",
-            name,
-            value,
-            tags,
-        )
+            series = list(self._gauge_series.items())
+        return {key: gauge.value for key, gauge in series}
+
+    def latency_snapshot(
+            self,
+            name: str,
+            tags: Optional[Dict[str, str]] = None,
+    ) -> Optional[LogLinearHistogram]:
+        """
+        Copy of a latency series merged over every thread, safe to merge
+        or query further
+        :return: None when nothing was observed
+        """
+        handle = self._latency_series.get(self._key(name, tags))
+        return handle.snapshot() if handle is not None else None
+
+    def latency_percentiles(
+            self,
+            name: str,
+            tags: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Optional[float]]:
+        """
+        p50/p90/p99/p999 of a latency series, empty when nothing was
+        observed
+        """
+        snapshot = self.latency_snapshot(name, tags)
+        return snapshot.percentiles() if snapshot is not None else {}
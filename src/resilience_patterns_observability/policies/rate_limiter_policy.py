@@ -0,0 +1,30 @@
+"""
+class that defines the outgoing rate limit policy
+"""
+
+TOKEN_BUCKET = "TOKEN_BUCKET"
+GCRA = "GCRA"
+
+
+class RateLimiterPolicy:
+    """
+    rate_per_second: float - sustained permits per second
+    burst: int - permits that may be taken at once after idling
+    algorithm: str - TOKEN_BUCKET or GCRA
+    max_wait_seconds: float - how long a caller may block for a permit;
+    0 fails fast
+    """
+
+    def __init__(self, rate_per_second: float, burst: int = 1,
+                 algorithm: str = TOKEN_BUCKET,
+                 max_wait_seconds: float = 0.0) -> None:
+        if rate_per_second <= 0:
+            raise ValueError("[RL] rate_per_second must be positive")
+        if burst < 1:
+            raise ValueError("[RL] burst must be at least 1")
+        if algorithm not in (TOKEN_BUCKET, GCRA):
+            raise ValueError(f"[RL] unknown algorithm {algorithm}")
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.algorithm = algorithm
+        self.max_wait_seconds = max_wait_seconds
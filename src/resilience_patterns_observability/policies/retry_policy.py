@@ -2,9 +2,13 @@
 define retry policy
 @param: max_retries: int
 @param: delay_seconds: int
+@param: backoff_multiplier: float
+@param: max_delay_seconds: float | None
+@param: jitter: str | None
 @return:
 """
-from typing import Any
+import random
+from typing import Any, Callable, Optional
 
 from resilience_patterns_observability.observability.context import \
     current_span
@@ -38,11 +42,55 @@ def after_retry_attempt(span: current_span) -> None:
         span.end()
 
 
+FULL_JITTER = "FULL"
+EQUAL_JITTER = "EQUAL"
+DECORRELATED_JITTER = "DECORRELATED"
+
+
 class RetryPolicy:
     """
     class Retry policy
+
+    The delay before retry n is delay_seconds * backoff_multiplier ** (n-1),
+    capped at max_delay_seconds and spread by jitter (FULL, EQUAL or
+    DECORRELATED) so concurrent callers do not retry in lockstep.
     """
 
-    def __init__(self, max_retries: int, delay_seconds: float) -> None:
+    def __init__(self, max_retries: int, delay_seconds: float,
+                 backoff_multiplier: float = 1.0,
+                 max_delay_seconds: Optional[float] = None,
+                 jitter: Optional[str] = None,
+                 uniform: Callable[[float, float], float] = random.uniform
+                 ) -> None:
+        if jitter not in (None, FULL_JITTER, EQUAL_JITTER,
+                          DECORRELATED_JITTER):
+            raise ValueError(f"[RETRY] unknown jitter {jitter}")
         self.max_retries = max_retries
         self.delay_seconds = delay_seconds
+        self.backoff_multiplier = backoff_multiplier
+        self.max_delay_seconds = max_delay_seconds
+        self.jitter = jitter
+        self._uniform = uniform
+
+    def next_delay(self, attempt: int,
+                   previous_delay: Optional[float] = None) -> float:
+        """
+        :param attempt: attempt that just failed, from 1
+        :param previous_delay: last delay of this call (DECORRELATED)
+        :return: seconds to wait before the next attempt
+        """
+        if self.jitter == DECORRELATED_JITTER:
+            low = self.delay_seconds
+            delay = self._uniform(low, max(low, 3 * (previous_delay or low)))
+        else:
+            delay = self.delay_seconds * self.backoff_multiplier ** (
+                attempt - 1)
+            if self.max_delay_seconds is not None:
+                delay = min(delay, self.max_delay_seconds)
+            if self.jitter == FULL_JITTER:
+                delay = self._uniform(0.0, delay)
+            elif self.jitter == EQUAL_JITTER:
+                delay = delay / 2 + self._uniform(0.0, delay / 2)
+        if self.max_delay_seconds is not None:
+            delay = min(delay, self.max_delay_seconds)
+        return delay
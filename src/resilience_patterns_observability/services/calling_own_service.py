@@ -9,7 +9,9 @@ import requests
 from flask import Flask, jsonify
 
 from resilience_patterns_observability.core.resilience_executor import resilient
+from resilience_patterns_observability.observability.logging import install_async_logging
 from resilience_patterns_observability.policies.bulkhead_policy import BulkheadPolicy
+from resilience_patterns_observability.policies.cache_policy import CachePolicy
 from resilience_patterns_observability.policies.cb_policy import CircuitBreakerPolicy
 from resilience_patterns_observability.policies.retry_policy import RetryPolicy
 from resilience_patterns_observability.policies.timeout_policy import TimeoutPolicy
@@ -17,6 +19,7 @@ from resilience_patterns_observability.policies.timeout_policy import TimeoutPol
 app = Flask(__name__)
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)s | %(message)s")
+install_async_logging()
 
 
 @resilient(
@@ -24,6 +27,7 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)s | %(
     CircuitBreakerPolicy(failure_threshold=3, recovery_timeout=10),
     BulkheadPolicy(max_concurrent_calls=2, acquire_timeout=5),
     TimeoutPolicy(2),
+    CachePolicy(ttl_seconds=5, stale_ttl_seconds=60),
 )
 def call_downstream_service_b() -> Any:
     """
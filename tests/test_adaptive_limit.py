@@ -0,0 +1,151 @@
+import pytest
+
+from resilience_full_impl.executor.adaptive_limit import (AIMDLimit,
+                                                         GradientLimit)
+from resilience_full_impl.executor.bulkhead import Bulkhead
+from resilience_full_impl.executor.circuit_breaker import \
+    CircuitBreakerException
+from resilience_full_impl.executor.resilience_executor import \
+    ResilienceExecutor
+from resilience_full_impl.observability.metrics import MetricsCollector
+from resilience_full_impl.policy.bulkhead_policy import AIMD, BulkheadPolicy
+from resilience_full_impl.policy.cb_policy import CircuitBreakerPolicy
+from resilience_full_impl.policy.retry_policy import RetryPolicy
+from resilience_full_impl.policy.timeout_policy import TimeoutPolicy
+from resilience_patterns_observability.core.bulkhead import \
+    Bulkhead as ObsBulkhead
+from resilience_patterns_observability.policies.bulkhead_policy import (
+    GRADIENT, BulkheadPolicy as ObsBulkheadPolicy)
+
+
+def test_aimd_grows_while_latency_holds_and_backs_off_on_errors():
+    """
+       GIVEN an AIMD limit between 2 and 20 starting at 10
+       WHEN saturated calls keep a steady latency, then errors arrive
+       THEN the limit climbs to the max, then drops multiplicatively
+    """
+    limit = AIMDLimit(min_limit=2, max_limit=20, initial_limit=10)
+
+    for _ in range(50):
+        limit.on_sample(0.01, succeeded=True, in_flight=limit.limit)
+    assert limit.limit == 20
+
+    limit.on_sample(0.01, succeeded=False, in_flight=20)
+    assert limit.limit == 18
+
+    for _ in range(50):
+        limit.on_sample(0.01, succeeded=False, in_flight=20)
+    assert limit.limit == 2
+
+
+def test_aimd_backs_off_when_latency_exceeds_baseline():
+    """
+       GIVEN a baseline latency of 10ms
+       WHEN a call takes 100ms
+       THEN the limit is cut
+    """
+    limit = AIMDLimit(min_limit=1, max_limit=50, initial_limit=20)
+    limit.on_sample(0.01, succeeded=True, in_flight=20)
+
+    assert limit.on_sample(0.1, succeeded=True, in_flight=20) < 21
+
+
+def test_gradient_shrinks_as_latency_climbs():
+    """
+       GIVEN a gradient limit with a 10ms long-term latency
+       WHEN short-term latency jumps to 100ms
+       THEN the limit falls towards the minimum
+    """
+    limit = GradientLimit(min_limit=1, max_limit=100, initial_limit=50)
+    for _ in range(100):
+        limit.on_sample(0.01, succeeded=True, in_flight=50)
+    steady = limit.limit
+
+    for _ in range(50):
+        limit.on_sample(0.1, succeeded=True, in_flight=limit.limit)
+
+    assert limit.limit < steady
+
+
+def test_bulkhead_uses_and_publishes_adaptive_limit():
+    """
+       GIVEN an AIMD bulkhead bounded to [1, 4] starting at 1
+       WHEN the only slot is taken
+       THEN a second caller is rejected, and a healthy attempt raises the
+            limit gauge
+    """
+    metrics = MetricsCollector()
+    bulkhead = Bulkhead(BulkheadPolicy(max_concurrent_calls=4,
+                                       acquire_timeout=0,
+                                       adaptive_limit=AIMD,
+                                       initial_concurrent_calls=1),
+                        metrics=metrics)
+
+    assert bulkhead.try_acquire()
+    assert not bulkhead.try_acquire()
+
+    bulkhead.record_attempt(0.01, succeeded=True)
+    bulkhead.release()
+
+    assert bulkhead.limit == 2
+    assert metrics._gauges[("bulkhead_concurrency_limit",
+                            (("bulkhead", "default"),))] == 2
+
+
+def test_observability_bulkhead_respects_min_bound():
+    """
+       GIVEN an observability GRADIENT bulkhead between 3 and 20
+       WHEN every call fails
+       THEN the limit shrinks but never drops below 3
+    """
+    bulkhead = ObsBulkhead(ObsBulkheadPolicy(max_concurrent_calls=20,
+                                             adaptive_limit=GRADIENT,
+                                             min_concurrent_calls=3))
+    for _ in range(200):
+        assert bulkhead.acquire(timeout=0)
+        bulkhead.record_attempt(0.01, succeeded=False)
+        bulkhead.release()
+
+    assert 3 <= bulkhead.limit < 10
+
+
+def test_limit_samples_attempt_rtt_and_skips_open_circuit():
+    """
+       GIVEN an executor with an AIMD bulkhead and 50ms retry backoff
+       WHEN a call fails once and then succeeds quickly, and another is
+            rejected by the open circuit
+       THEN the limit sees the two fast attempts, never the backoff or the
+            rejected call
+    """
+    executor = ResilienceExecutor(
+        retry_policy=RetryPolicy(max_attempts=2, retry_interval_ms=50,
+                                 exponential=False),
+        cb_policy=CircuitBreakerPolicy(failure_threshold=2,
+                                       recovery_timeout=60),
+        bulk_head_policy=BulkheadPolicy(max_concurrent_calls=4,
+                                        acquire_timeout=0,
+                                        adaptive_limit=AIMD))
+    samples = []
+    limiter = executor._bulkhead._limiter
+    on_sample = limiter.on_sample
+    limiter.on_sample = lambda rtt, succeeded, in_flight: (
+        samples.append((rtt, succeeded)) or on_sample(rtt, succeeded,
+                                                      in_flight))
+    calls = []
+
+    def flaky(token):
+        calls.append(token)
+        if len(calls) == 1:
+            raise ConnectionError("reset")
+        return "ok"
+
+    assert executor.execute(flaky, TimeoutPolicy(timeout_seconds=1),
+                            "svc") == "ok"
+    for _ in range(2):
+        executor._cb_obj.after_failure(ConnectionError("reset"))
+    with pytest.raises(CircuitBreakerException):
+        executor.execute(flaky, TimeoutPolicy(timeout_seconds=1), "svc")
+
+    assert [succeeded for _, succeeded in samples] == [False, True]
+    assert all(rtt < 0.05 for rtt, _ in samples)
+    executor.shutdown()
@@ -0,0 +1,109 @@
+import io
+import logging
+
+from resilience_patterns_observability.observability.inmemory_tracing import \
+    InMemoryTraceSpan
+from resilience_patterns_observability.observability.logging import (
+    AsyncLogHandler, configure_event_logging)
+from resilience_patterns_observability.policies.inmemory_metrics import \
+    InMemoryMetricsCollector
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def _logger(name, handler):
+    logger = logging.getLogger(name)
+    logger.handlers[:] = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    return logger
+
+
+def test_async_handler_writes_batches_in_order():
+    """
+       GIVEN an AsyncLogHandler in front of a StreamHandler
+       WHEN 1000 records are logged and the handler is closed
+       THEN every line is written in order, in batches
+    """
+    stream = io.StringIO()
+    target = logging.StreamHandler(stream)
+    target.setFormatter(logging.Formatter("%(message)s"))
+    handler = AsyncLogHandler([target], batch_size=100)
+    logger = _logger("test_async_logging.order", handler)
+
+    for i in range(1000):
+        logger.info("line %d", i)
+    handler.close()
+
+    assert stream.getvalue().splitlines() == [f"line {i}"
+                                              for i in range(1000)]
+    assert handler.written == 1000
+    assert 10 <= handler.batches < 1000
+
+
+def test_full_queue_drops_and_reports():
+    """
+       GIVEN a queue of 2 records whose writer is not due yet
+       WHEN 5 records are logged
+       THEN 3 are dropped without blocking and the drop is reported
+    """
+    target = _ListHandler()
+    handler = AsyncLogHandler([target], queue_size=2, batch_size=10,
+                              flush_interval=60)
+    logger = _logger("test_async_logging.drops", handler)
+
+    for i in range(5):
+        logger.info("line %d", i)
+    handler.close()
+
+    assert handler.dropped == 3
+    assert [record.getMessage() for record in target.records] == [
+        "line 0", "line 1", "[LOGGING] dropped 3 log records, queue full"]
+
+
+def test_event_logging_is_opt_in_and_sampled():
+    """
+       GIVEN the metrics and span loggers at DEBUG
+       WHEN events are recorded with event logging off, sampled at 0 and
+            enabled
+       THEN only the enabled run logs, and errors carry no traceback
+            unless asked
+    """
+    records = _ListHandler()
+    for name in ("resilience_patterns_observability.policies."
+                 "inmemory_metrics",
+                 "resilience_patterns_observability.observability."
+                 "inmemory_tracing"):
+        _logger(name, records)
+    metrics = InMemoryMetricsCollector()
+
+    def record_events():
+        metrics.inc_counter("request_total")
+        span = InMemoryTraceSpan("request")
+        span.start()
+        span.record_error(ValueError("boom"))
+        span.end()
+
+    try:
+        record_events()
+        configure_event_logging(True, sample_rate=0.0)
+        record_events()
+        assert records.records == []
+
+        configure_event_logging(True)
+        record_events()
+        assert len(records.records) == 4
+        assert all(record.exc_info is None for record in records.records)
+
+        configure_event_logging(True, tracebacks=True)
+        record_events()
+        assert records.records[-2].exc_info is not None
+    finally:
+        configure_event_logging(False)
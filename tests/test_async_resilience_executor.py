@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+
+from resilience_full_impl.cancellation.cancellation_token import \
+    CancellationToken
+from resilience_full_impl.cancellation.exceptions import CancelledException
+from resilience_full_impl.executor.async_resilience_executor import (
+    AsyncResilienceExecutor, resilient)
+from resilience_full_impl.executor.bulkhead import BulkheadRejectedException
+from resilience_full_impl.executor.resilience_executor import \
+    TimeoutException
+from resilience_full_impl.policy.bulkhead_policy import BulkheadPolicy
+from resilience_full_impl.policy.cb_policy import CircuitBreakerPolicy
+from resilience_full_impl.policy.retry_policy import RetryPolicy
+from resilience_full_impl.policy.timeout_policy import TimeoutPolicy
+
+
+def _executor(max_attempts=1, max_concurrent_calls=10):
+    return AsyncResilienceExecutor(
+        retry_policy=RetryPolicy(max_attempts=max_attempts,
+                                 retry_interval_ms=1, exponential=True),
+        cb_policy=CircuitBreakerPolicy(failure_threshold=5,
+                                       recovery_timeout=5),
+        bulk_head_policy=BulkheadPolicy(
+            max_concurrent_calls=max_concurrent_calls, acquire_timeout=0))
+
+
+def test_async_retry_until_success():
+    """
+       GIVEN a coroutine that fails twice
+       WHEN it runs with max_attempts = 3
+       THEN the third attempt's result is returned
+    """
+    calls = []
+
+    async def flaky(token: CancellationToken) -> str:
+        calls.append(1)
+        if len(calls) < 3:
+            raise ConnectionError("boom")
+        return "ok"
+
+    result = asyncio.run(_executor(max_attempts=3).execute(
+        flaky, TimeoutPolicy(timeout_seconds=1), dependency_name="svc"))
+
+    assert result == "ok"
+    assert len(calls) == 3
+
+
+def test_async_timeout_cancels_task_and_token():
+    """
+       GIVEN a coroutine slower than the timeout
+       WHEN it is executed
+       THEN TimeoutException is raised, the task is cancelled and the token
+            is cancelled
+    """
+    seen = {}
+
+    async def slow(token: CancellationToken) -> str:
+        seen["token"] = token
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            seen["cancelled"] = True
+            raise
+        return "late"
+
+    with pytest.raises(TimeoutException):
+        asyncio.run(_executor().execute(
+            slow, TimeoutPolicy(timeout_seconds=0.05),
+            dependency_name="svc"))
+
+    assert seen["cancelled"]
+    assert seen["token"].is_cancelled()
+
+
+def test_async_token_cancel_cancels_task():
+    """
+       GIVEN a running attempt
+       WHEN its CancellationToken is cancelled
+       THEN the attempt task is cancelled and CancelledException is raised
+    """
+    async def cancels_itself(token: CancellationToken) -> str:
+        token.cancel()
+        await asyncio.sleep(5)
+        return "late"
+
+    with pytest.raises(CancelledException):
+        asyncio.run(_executor().execute(
+            cancels_itself, TimeoutPolicy(timeout_seconds=2),
+            dependency_name="svc"))
+
+
+def test_async_bulkhead_rejects_beyond_limit():
+    """
+       GIVEN an async bulkhead of 2
+       WHEN 3 calls are in flight together
+       THEN exactly one is rejected
+    """
+    @resilient(RetryPolicy(max_attempts=1, retry_interval_ms=1,
+                           exponential=False),
+               CircuitBreakerPolicy(failure_threshold=5, recovery_timeout=5),
+               BulkheadPolicy(max_concurrent_calls=2, acquire_timeout=0),
+               TimeoutPolicy(timeout_seconds=1))
+    async def call(token: CancellationToken, value: int) -> int:
+        await asyncio.sleep(0.05)
+        return value
+
+    async def main():
+        return await asyncio.gather(*(call(i) for i in range(3)),
+                                    return_exceptions=True)
+
+    results = asyncio.run(main())
+
+    assert sorted(r for r in results if isinstance(r, int)) == [0, 1]
+    assert sum(isinstance(r, BulkheadRejectedException)
+               for r in results) == 1
@@ -0,0 +1,160 @@
+import threading
+import time
+
+import pytest
+
+from resilience_full_impl.cancellation.cancellation_token import \
+    CancellationToken
+from resilience_full_impl.executor.attempt_pool import (
+    AttemptPool, AttemptPoolExhaustedException)
+from resilience_full_impl.executor.resilience_executor import (
+    ResilienceExecutor, TimeoutException)
+from resilience_full_impl.observability.metrics import MetricsCollector
+from resilience_full_impl.policy.bulkhead_policy import BulkheadPolicy
+from resilience_full_impl.policy.cb_policy import CircuitBreakerPolicy
+from resilience_full_impl.policy.retry_policy import RetryPolicy
+from resilience_full_impl.policy.timeout_policy import TimeoutPolicy
+
+
+def test_pool_reuses_workers_and_returns_results():
+    """
+       GIVEN a pool with one live worker
+       WHEN several attempts are submitted one after another
+       THEN every result comes back through its future on the same thread
+    """
+    pool = AttemptPool(max_workers=1, max_abandoned=1,
+                       metrics=MetricsCollector())
+    thread_names = set()
+
+    def work(value):
+        thread_names.add(threading.current_thread().name)
+        return value * 2
+
+    results = [pool.submit(work, i).result(timeout=1) for i in range(5)]
+
+    assert results == [0, 2, 4, 6, 8]
+    assert len(thread_names) == 1
+    pool.shutdown()
+
+
+def test_pool_bounds_abandoned_attempts():
+    """
+       GIVEN a pool that tolerates one abandoned attempt
+       WHEN a running attempt is abandoned
+       THEN new attempts are rejected until the abandoned one returns
+    """
+    metrics = MetricsCollector()
+    pool = AttemptPool(max_workers=1, max_abandoned=1, metrics=metrics)
+    release = threading.Event()
+
+    future = pool.submit(release.wait)
+    time.sleep(0.05)
+    pool.abandon(future)
+
+    assert pool.abandoned_count == 1
+    with pytest.raises(AttemptPoolExhaustedException):
+        pool.submit(lambda: None)
+
+    release.set()
+    future.result(timeout=1)
+
+    assert pool.abandoned_count == 0
+    assert pool.submit(lambda: "ok").result(timeout=1) == "ok"
+    assert metrics._gauges[("attempt_pool_abandoned_workers",
+                            (("pool", "attempt"),))] == 0
+    pool.shutdown()
+
+
+def test_pool_runs_daemon_workers_and_cancels_queued_on_shutdown():
+    """
+       GIVEN a pool of at most 2 workers, both held by hung attempts
+       WHEN a third attempt is queued and the pool shuts down without waiting
+       THEN the workers are daemon threads and the queued attempt is
+            cancelled
+    """
+    pool = AttemptPool(max_workers=1, max_abandoned=1,
+                       metrics=MetricsCollector())
+    release = threading.Event()
+    started = threading.Semaphore(0)
+    workers = []
+
+    def hang():
+        workers.append(threading.current_thread())
+        started.release()
+        release.wait()
+
+    running = [pool.submit(hang), pool.submit(hang)]
+    assert started.acquire(timeout=1) and started.acquire(timeout=1)
+    queued = pool.submit(lambda: "late")
+    pool.shutdown()
+
+    assert queued.cancelled()
+    with pytest.raises(RuntimeError):
+        pool.submit(lambda: None)
+    release.set()
+    for future in running:
+        future.result(timeout=1)
+    assert len(workers) == 2
+    assert all(worker.daemon for worker in workers)
+
+
+def test_executor_times_out_and_cancels_token():
+    """
+       GIVEN an executor with a 0.1s timeout
+       WHEN the attempt outlives the timeout
+       THEN TimeoutException is raised and the attempt's token is cancelled
+    """
+    executor = ResilienceExecutor(
+        retry_policy=RetryPolicy(max_attempts=1, retry_interval_ms=1,
+                                 exponential=False),
+        cb_policy=CircuitBreakerPolicy(failure_threshold=5,
+                                       recovery_timeout=5),
+        bulk_head_policy=BulkheadPolicy(max_concurrent_calls=1,
+                                        acquire_timeout=0))
+    seen_tokens = []
+
+    def slow(token: CancellationToken) -> str:
+        seen_tokens.append(token)
+        while not token.is_cancelled():
+            time.sleep(0.01)
+        return "late"
+
+    with pytest.raises(TimeoutException):
+        executor.execute(slow, TimeoutPolicy(timeout_seconds=0.1),
+                         dependency_name="test_api")
+
+    assert seen_tokens[0].is_cancelled()
+    executor.shutdown()
+
+
+def test_pool_rejection_is_not_a_dependency_failure():
+    """
+       GIVEN an executor tolerating one abandoned attempt and a circuit
+             that opens after 2 failures
+       WHEN one call times out and leaves its attempt running, and the next
+            is rejected by the attempt pool
+       THEN the rejection is raised but the circuit counts one failure
+    """
+    executor = ResilienceExecutor(
+        retry_policy=RetryPolicy(max_attempts=1, retry_interval_ms=1,
+                                 exponential=False),
+        cb_policy=CircuitBreakerPolicy(failure_threshold=2,
+                                       recovery_timeout=5),
+        bulk_head_policy=BulkheadPolicy(max_concurrent_calls=2,
+                                        acquire_timeout=0),
+        max_abandoned_attempts=1)
+    release = threading.Event()
+
+    try:
+        with pytest.raises(TimeoutException):
+            executor.execute(lambda token: release.wait(),
+                             TimeoutPolicy(timeout_seconds=0.05), "svc")
+        with pytest.raises(AttemptPoolExhaustedException):
+            executor.execute(lambda token: "ok",
+                             TimeoutPolicy(timeout_seconds=1), "svc")
+    finally:
+        release.set()
+
+    assert executor._cb_obj._failure_count == 1
+    assert executor._cb_obj._state == executor._cb_obj.CLOSED
+    executor.shutdown()
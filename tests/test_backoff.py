@@ -0,0 +1,92 @@
+import pytest
+
+from resilience_full_impl.executor.backoff import Backoff, \
+    retry_after_seconds
+from resilience_full_impl.policy.retry_policy import (DECORRELATED_JITTER,
+                                                      EQUAL_JITTER,
+                                                      FULL_JITTER,
+                                                      RetryPolicy)
+from resilience_patterns_observability.policies.retry_policy import \
+    RetryPolicy as ObsRetryPolicy
+
+
+def _upper(low, high):
+    return high
+
+
+def _policy(**overrides):
+    return RetryPolicy(**{"max_attempts": 5, "retry_interval_ms": 100,
+                          "exponential": True, **overrides})
+
+
+def test_exponential_backoff_is_capped():
+    """
+       GIVEN 100ms exponential backoff capped at 300ms without jitter
+       WHEN attempts 1 to 3 fail
+       THEN the delays are 100ms, 200ms, then 300ms
+    """
+    backoff = Backoff(_policy(max_retry_interval_ms=300))
+
+    assert [backoff.delay_seconds(attempt) for attempt in (1, 2, 3)] == \
+        [0.1, 0.2, 0.3]
+
+
+@pytest.mark.parametrize("jitter, lowest, highest", [
+    (FULL_JITTER, 0.0, 0.4),
+    (EQUAL_JITTER, 0.2, 0.4),
+])
+def test_jitter_spreads_within_bounds(jitter, lowest, highest):
+    """
+       GIVEN FULL or EQUAL jitter on 100ms exponential backoff
+       WHEN attempt 3 fails
+       THEN the delay is drawn between the jitter's bounds around 400ms
+    """
+    assert Backoff(_policy(jitter=jitter),
+                   uniform=lambda low, high: low).delay_seconds(3) == lowest
+    assert Backoff(_policy(jitter=jitter),
+                   uniform=_upper).delay_seconds(3) == highest
+
+
+def test_decorrelated_jitter_grows_from_previous_delay():
+    """
+       GIVEN decorrelated jitter capped at 1s
+       WHEN the previous delay was 200ms, then 500ms
+       THEN the next delay is at most 600ms, then the cap
+    """
+    backoff = Backoff(_policy(jitter=DECORRELATED_JITTER,
+                              max_retry_interval_ms=1000), uniform=_upper)
+
+    assert backoff.delay_seconds(2, previous_delay_seconds=0.2) == \
+        pytest.approx(0.6)
+    assert backoff.delay_seconds(3, previous_delay_seconds=0.5) == 1.0
+
+
+def test_retry_after_raises_the_delay():
+    """
+       GIVEN respect_retry_after and an error from a 429 response
+       WHEN its Retry-After header asks for 2 seconds
+       THEN the backoff waits 2 seconds
+    """
+    class Response:
+        headers = {"Retry-After": "2"}
+
+    class TooManyRequests(Exception):
+        response = Response()
+
+    backoff = Backoff(_policy(respect_retry_after=True))
+
+    assert retry_after_seconds(TooManyRequests()) == 2.0
+    assert backoff.delay_seconds(1, ex=TooManyRequests()) == 2.0
+    assert Backoff(_policy()).delay_seconds(1, ex=TooManyRequests()) == 0.1
+
+
+def test_observability_retry_policy_backoff():
+    """
+       GIVEN an observability RetryPolicy doubling 1s delays, capped at 3s
+       WHEN retries follow each other
+       THEN the delays are 1s, 2s, then 3s
+    """
+    policy = ObsRetryPolicy(max_retries=4, delay_seconds=1,
+                            backoff_multiplier=2, max_delay_seconds=3)
+
+    assert [policy.next_delay(attempt) for attempt in (1, 2, 3)] == [1, 2, 3]
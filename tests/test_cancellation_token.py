@@ -0,0 +1,66 @@
+import threading
+import time
+
+from resilience_full_impl.cancellation.cancellation_token import \
+    CancellationToken
+
+
+def test_callbacks_run_once_on_cancel_and_at_once_when_late():
+    """
+       GIVEN a callback registered before and one after cancellation
+       WHEN the token is cancelled twice
+       THEN each callback runs exactly once
+    """
+    token = CancellationToken()
+    calls = []
+    token.register_callback(lambda: calls.append("early"))
+    unregistered = token.register_callback(lambda: calls.append("removed"))
+    unregistered()
+
+    token.cancel()
+    token.cancel()
+    token.register_callback(lambda: calls.append("late"))
+
+    assert calls == ["early", "late"]
+
+
+def test_wait_wakes_on_cancel_and_on_deadline():
+    """
+       GIVEN a waiter on a token cancelled from another thread after 50ms,
+             and a token with a 50ms deadline
+       WHEN both wait up to 5 seconds
+       THEN both return True well before the timeout
+    """
+    token = CancellationToken()
+    threading.Timer(0.05, token.cancel).start()
+    fired = []
+    expiring = CancellationToken(deadline_seconds=0.05)
+    expiring.register_callback(lambda: fired.append(True))
+
+    started = time.monotonic()
+    assert token.wait(5)
+    assert expiring.wait(5)
+
+    assert time.monotonic() - started < 1
+    assert fired == [True]
+    assert not CancellationToken().wait(0.01)
+
+
+def test_cancelling_parent_cancels_children():
+    """
+       GIVEN a request token with a 1s deadline and two attempt children
+       WHEN the request is cancelled
+       THEN every child is cancelled, and a child never outlives the
+            parent deadline
+    """
+    parent = CancellationToken(deadline_seconds=1)
+    first = parent.child()
+    second = parent.child(deadline_seconds=30)
+
+    assert second.remaining_seconds() <= 1
+    first.cancel()
+    assert not parent.is_cancelled()
+
+    parent.cancel()
+    assert second.is_cancelled()
+    assert parent._callbacks == {}
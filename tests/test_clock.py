@@ -0,0 +1,75 @@
+import time
+
+import pytest
+
+from resilience_full_impl.cancellation.cancellation_token import \
+    CancellationToken
+from resilience_full_impl.clock import VirtualClock
+from resilience_full_impl.executor.circuit_breaker import (
+    CircuitBreaker, CircuitBreakerException)
+from resilience_full_impl.observability.tracing import TraceSpan
+from resilience_full_impl.policy.cb_policy import CircuitBreakerPolicy
+from resilience_patterns_observability.clock import \
+    VirtualClock as ObsVirtualClock
+from resilience_patterns_observability.observability.inmemory_tracing import \
+    InMemoryTraceSpan
+
+
+def test_wall_clock_step_does_not_expire_deadline(monkeypatch):
+    """
+       GIVEN a token with a 10s deadline
+       WHEN the wall clock jumps an hour ahead
+       THEN the token is not cancelled
+    """
+    token = CancellationToken(deadline_seconds=10)
+    real_time = time.time
+    monkeypatch.setattr(time, "time", lambda: real_time() + 3600)
+
+    assert not token.is_cancelled()
+    assert token.remaining_seconds() > 9
+
+
+def test_virtual_clock_drives_deadline_and_recovery():
+    """
+       GIVEN a virtual clock, a 5s token and an open circuit with 30s
+             recovery
+       WHEN virtual time advances
+       THEN the token expires and the circuit half-opens without waiting
+    """
+    clock = VirtualClock(start_seconds=100)
+    token = CancellationToken(deadline_seconds=5, clock=clock)
+    cb = CircuitBreaker(CircuitBreakerPolicy(failure_threshold=1,
+                                             recovery_timeout=30),
+                        clock=clock)
+    cb.after_failure(ConnectionError("down"))
+
+    clock.advance(5)
+    assert token.is_cancelled()
+    with pytest.raises(CircuitBreakerException):
+        cb.before_execution()
+
+    clock.sleep(25)
+    cb.before_execution()
+    assert cb._state == CircuitBreaker.HALF_OPEN
+
+
+def test_span_durations_follow_the_clock_not_wall_time():
+    """
+       GIVEN spans of both packages on virtual clocks
+       WHEN 250ms of virtual time pass
+       THEN each duration is 250ms and start times are wall time
+    """
+    clock = VirtualClock(wall_origin=1_700_000_000)
+    span = TraceSpan("call", clock=clock)
+    clock.advance(0.25)
+    span.end_span()
+
+    obs_clock = ObsVirtualClock(wall_origin=1_700_000_000)
+    obs_span = InMemoryTraceSpan("call", clock=obs_clock)
+    obs_span.start()
+    obs_clock.advance(0.25)
+    obs_span.end()
+
+    assert span.duration_ms == pytest.approx(250)
+    assert obs_span.duration_ms == pytest.approx(250)
+    assert span.start_time == obs_span.start_time == 1_700_000_000
@@ -0,0 +1,61 @@
+import pytest
+
+from resilience_full_impl.config.loader import ResilienceConfigLoader
+from resilience_full_impl.policy.retry_policy import FULL_JITTER
+
+
+def _load(tmp_path, retry_lines):
+    config = tmp_path / "resilience.yaml"
+    config.write_text("resilience:\n"
+                      "  retry:\n"
+                      "    max_attempts: 3\n"
+                      "    retry_interval_ms: 5\n"
+                      "    exponential: true\n"
+                      + "".join(f"    {line}\n" for line in retry_lines)
+                      + "  timeout:\n"
+                      "    timeout_seconds: 5\n")
+    return ResilienceConfigLoader().load_config(str(config))
+
+
+def test_loads_jitter_cap_and_retry_after(tmp_path):
+    """
+       GIVEN a retry config with FULL jitter, a cap and respect_retry_after
+       WHEN it is loaded
+       THEN the policy carries all three
+    """
+    retry = _load(tmp_path, ["jitter: FULL", "max_retry_interval_ms: 1000",
+                             "respect_retry_after: true"])["retry"]
+
+    assert retry.jitter == FULL_JITTER
+    assert retry.max_retry_interval_ms == 1000
+    assert retry.respect_retry_after is True
+
+
+def test_rejects_unknown_jitter(tmp_path):
+    """
+       GIVEN a retry config with an unknown jitter
+       WHEN it is loaded
+       THEN a ValueError names the accepted values
+    """
+    with pytest.raises(ValueError, match="jitter"):
+        _load(tmp_path, ["jitter: SOMETIMES"])
+
+
+def test_rejects_non_positive_max_retry_interval(tmp_path):
+    """
+       GIVEN a retry config capping the backoff at 0ms
+       WHEN it is loaded
+       THEN a ValueError is raised
+    """
+    with pytest.raises(ValueError, match="max_retry_interval_ms"):
+        _load(tmp_path, ["max_retry_interval_ms: 0"])
+
+
+def test_rejects_non_boolean_respect_retry_after(tmp_path):
+    """
+       GIVEN a retry config with respect_retry_after set to a string
+       WHEN it is loaded
+       THEN a ValueError is raised
+    """
+    with pytest.raises(ValueError, match="respect_retry_after"):
+        _load(tmp_path, ["respect_retry_after: sometimes"])
@@ -0,0 +1,99 @@
+import time
+
+import pytest
+
+from resilience_full_impl.executor.resilience_executor import (
+    ResilienceExecutor, TimeoutException)
+from resilience_full_impl.policy.bulkhead_policy import BulkheadPolicy
+from resilience_full_impl.policy.cb_policy import CircuitBreakerPolicy
+from resilience_full_impl.policy.retry_policy import RetryPolicy
+from resilience_full_impl.policy.timeout_policy import TimeoutPolicy
+
+
+def _executor(retry_interval_ms):
+    return ResilienceExecutor(
+        retry_policy=RetryPolicy(max_attempts=3,
+                                 retry_interval_ms=retry_interval_ms,
+                                 exponential=False),
+        cb_policy=CircuitBreakerPolicy(failure_threshold=10,
+                                       recovery_timeout=5),
+        bulk_head_policy=BulkheadPolicy(max_concurrent_calls=2,
+                                        acquire_timeout=0))
+
+
+def _skipped(executor, reason):
+    return executor._metrics._counters[
+        ("retry_deadline_skipped_total",
+         (("dependency_name", "svc"), ("reason", reason)))]
+
+
+def test_retry_skipped_when_backoff_outlives_deadline():
+    """
+       GIVEN a 300ms deadline and a 500ms backoff
+       WHEN the first attempt fails
+       THEN the last error is raised at once instead of sleeping
+    """
+    executor = _executor(retry_interval_ms=500)
+    calls = []
+
+    def call(token):
+        calls.append(token)
+        raise ConnectionError("down")
+
+    started = time.monotonic()
+    with pytest.raises(ConnectionError):
+        executor.execute(call, TimeoutPolicy(timeout_seconds=0.3),
+                         dependency_name="svc")
+
+    assert len(calls) == 1
+    assert time.monotonic() - started < 0.2
+    assert _skipped(executor, "backoff") == 1
+    executor.shutdown()
+
+
+def test_retry_skipped_when_typical_attempt_cannot_finish():
+    """
+       GIVEN attempts to svc typically take 500ms and a 300ms deadline
+       WHEN the first attempt fails
+       THEN no retry is started
+    """
+    executor = _executor(retry_interval_ms=1)
+    for _ in range(20):
+        executor._attempt_latencies.for_dependency("svc").observe(0.5)
+
+    def call(token):
+        raise ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        executor.execute(call, TimeoutPolicy(timeout_seconds=0.3),
+                         dependency_name="svc")
+
+    assert _skipped(executor, "latency") == 1
+    executor.shutdown()
+
+
+def test_retry_timeout_is_clamped_to_remaining_budget():
+    """
+       GIVEN a 400ms deadline and a first attempt failing after 200ms
+       WHEN the retry hangs
+       THEN it sees the reduced budget and times out at the deadline,
+            not 400ms after it started
+    """
+    executor = _executor(retry_interval_ms=1)
+    remaining = []
+
+    def call(token):
+        remaining.append(token.remaining_seconds())
+        if len(remaining) == 1:
+            time.sleep(0.2)
+            raise ConnectionError("down")
+        time.sleep(1)
+
+    started = time.monotonic()
+    with pytest.raises(TimeoutException):
+        executor.execute(call, TimeoutPolicy(timeout_seconds=0.4),
+                         dependency_name="svc")
+
+    assert time.monotonic() - started < 0.55
+    assert remaining[1] < 0.25
+    executor.shutdown()
@@ -0,0 +1,130 @@
+import pytest
+
+from resilience_full_impl.executor.circuit_breaker import (
+    CircuitBreaker, CircuitBreakerException)
+from resilience_full_impl.policy.cb_policy import CircuitBreakerPolicy
+from resilience_patterns_observability.clock import VirtualClock
+from resilience_patterns_observability.core.execution_context import \
+    ExecutionContext
+from resilience_patterns_observability.core.resilience_executor import \
+    ResilienceExecutor
+from resilience_patterns_observability.policies.bulkhead_policy import \
+    BulkheadPolicy
+from resilience_patterns_observability.policies.cb_policy import \
+    CircuitBreakerPolicy as ObsCircuitBreakerPolicy
+from resilience_patterns_observability.policies.retry_policy import \
+    RetryPolicy
+from resilience_patterns_observability.policies.timeout_policy import \
+    TimeoutPolicy
+
+
+def _tripped_breaker(**half_open):
+    cb = CircuitBreaker(CircuitBreakerPolicy(
+        failure_threshold=1, recovery_timeout=0, **half_open))
+    cb.after_failure(RuntimeError("down"))
+    return cb
+
+
+def test_half_open_rejects_callers_beyond_permits():
+    """
+       GIVEN 2 half-open trial permits
+       WHEN 3 callers arrive after recovery_timeout
+       THEN the third is rejected without waiting
+    """
+    cb = _tripped_breaker(permitted_calls_in_half_open=2)
+
+    cb.before_execution()
+    cb.before_execution()
+    with pytest.raises(CircuitBreakerException):
+        cb.before_execution()
+
+
+def test_half_open_closes_on_success_quorum():
+    """
+       GIVEN 3 permits with a success quorum of 2
+       WHEN 2 trials succeed
+       THEN the circuit closes and lets everyone through
+    """
+    cb = _tripped_breaker(permitted_calls_in_half_open=3,
+                          half_open_success_threshold=2)
+
+    cb.before_execution()
+    cb.before_execution()
+    cb.after_success()
+    cb.after_success()
+
+    assert cb._state == CircuitBreaker.CLOSED
+    for _ in range(5):
+        cb.before_execution()
+
+
+def test_half_open_reopens_on_failure_quorum():
+    """
+       GIVEN 3 permits and a failure quorum of 1
+       WHEN one trial fails
+       THEN the circuit re-opens
+    """
+    cb = _tripped_breaker(permitted_calls_in_half_open=3)
+
+    cb.before_execution()
+    cb.after_success()
+    cb.before_execution()
+    cb.after_failure(RuntimeError("still down"))
+
+    assert cb._state == CircuitBreaker.OPEN
+
+
+def test_observability_executor_limits_half_open_trials():
+    """
+       GIVEN the observability executor with 1 half-open permit
+       WHEN the circuit is HALF_OPEN
+       THEN only the first check passes until the trial reports back
+    """
+    executor = ResilienceExecutor(
+        RetryPolicy(max_retries=1, delay_seconds=0),
+        ObsCircuitBreakerPolicy(failure_threshold=1, recovery_timeout=0,
+                                half_open_max_calls=1),
+        BulkheadPolicy(max_concurrent_calls=5, acquire_timeout=1),
+        TimeoutPolicy(1),
+    )
+    executor._on_failure(ExecutionContext(), RuntimeError("down"))
+
+    assert executor._is_circuit_open() is False
+    assert executor._is_circuit_open() is True
+
+    executor._on_success(ExecutionContext())
+    assert executor.cb_state.state == "CLOSED"
+    executor.timeout_executor.close()
+
+
+def test_observability_executor_takes_a_permit_per_attempt():
+    """
+       GIVEN 2 half-open permits, a failure quorum of 2 and 3 attempts
+       WHEN a call keeps failing while HALF_OPEN
+       THEN each attempt takes a permit, and the attempt after the circuit
+            re-opens fails fast instead of reaching the dependency
+    """
+    clock = VirtualClock()
+    executor = ResilienceExecutor(
+        RetryPolicy(max_retries=3, delay_seconds=0),
+        ObsCircuitBreakerPolicy(failure_threshold=1, recovery_timeout=5,
+                                half_open_max_calls=2,
+                                half_open_failure_threshold=2),
+        BulkheadPolicy(max_concurrent_calls=5, acquire_timeout=1),
+        TimeoutPolicy(1),
+        clock=clock,
+    )
+    executor._on_failure(ExecutionContext(), RuntimeError("down"))
+    clock.advance(5)
+    calls = []
+
+    def down():
+        calls.append(1)
+        raise ConnectionError("still down")
+
+    with pytest.raises(RuntimeError, match="Circuit is OPEN"):
+        executor.execute(down)
+
+    assert len(calls) == 2
+    assert executor.cb_state.state == "OPEN"
+    executor.timeout_executor.close()
@@ -0,0 +1,132 @@
+import itertools
+import time
+
+from resilience_full_impl.cancellation.cancellation_token import \
+    CancellationToken
+from resilience_full_impl.executor.resilience_executor import \
+    ResilienceExecutor
+from resilience_full_impl.policy.bulkhead_policy import BulkheadPolicy
+from resilience_full_impl.policy.cb_policy import CircuitBreakerPolicy
+from resilience_full_impl.policy.hedge_policy import HedgePolicy
+from resilience_full_impl.policy.retry_policy import RetryPolicy
+from resilience_full_impl.policy.timeout_policy import TimeoutPolicy
+
+
+def _executor(max_concurrent_calls, hedge_policy):
+    return ResilienceExecutor(
+        retry_policy=RetryPolicy(max_attempts=1, retry_interval_ms=1,
+                                 exponential=False),
+        cb_policy=CircuitBreakerPolicy(failure_threshold=5,
+                                       recovery_timeout=5),
+        bulk_head_policy=BulkheadPolicy(
+            max_concurrent_calls=max_concurrent_calls, acquire_timeout=0),
+        hedge_policy=hedge_policy)
+
+
+def _slow_first_call():
+    calls = itertools.count()
+    tokens = []
+
+    def call(token: CancellationToken) -> str:
+        tokens.append(token)
+        if next(calls) == 0:
+            token.wait()
+            return "primary"
+        return "hedge"
+
+    return call, tokens
+
+
+def test_hedge_wins_and_cancels_slow_primary():
+    """
+       GIVEN a 20ms hedge delay and a primary attempt that hangs
+       WHEN the call executes
+       THEN the hedge result is returned and the primary token is cancelled
+            without counting the primary as abandoned
+    """
+    executor = _executor(2, HedgePolicy(delay_ms=20))
+    call, tokens = _slow_first_call()
+
+    started = time.monotonic()
+    result = executor.execute(call, TimeoutPolicy(timeout_seconds=2),
+                              dependency_name="svc")
+
+    assert result == "hedge"
+    assert time.monotonic() - started < 1
+    assert tokens[0].is_cancelled()
+    assert executor._metrics._counters[
+        ("hedge_wins_total", (("dependency_name", "svc"),))] == 1
+    assert ("attempt_pool_abandoned_total",
+            (("pool", "attempt"),)) not in executor._metrics._counters
+    executor.shutdown()
+
+
+def test_hedge_needs_a_bulkhead_slot():
+    """
+       GIVEN a bulkhead of 1, already held by the request itself
+       WHEN the hedge delay passes
+       THEN no hedge is launched and the rejection is counted
+    """
+    executor = _executor(1, HedgePolicy(delay_ms=20))
+
+    def call(token: CancellationToken) -> str:
+        time.sleep(0.1)
+        return "primary"
+
+    assert executor.execute(call, TimeoutPolicy(timeout_seconds=2),
+                            dependency_name="svc") == "primary"
+    assert executor._metrics._counters[
+        ("hedge_bulkhead_rejections_total",
+         (("dependency_name", "svc"),))] == 1
+    executor.shutdown()
+
+
+def test_adaptive_delay_follows_observed_percentile():
+    """
+       GIVEN an adaptive hedge delay at p95 after 20 samples
+       WHEN fast calls have been observed
+       THEN the delay drops from the configured fallback to their p95
+    """
+    executor = _executor(2, HedgePolicy(delay_ms=500, adaptive=True,
+                                        min_samples=20))
+
+    for _ in range(40):
+        executor.execute(lambda token: "ok",
+                         TimeoutPolicy(timeout_seconds=1),
+                         dependency_name="svc")
+
+    hedge_delay, _ = executor._hedge_state("svc")
+    assert hedge_delay.seconds() < 0.5
+    executor.shutdown()
+
+
+def test_hedge_delay_and_budget_are_per_dependency():
+    """
+       GIVEN an adaptive hedge delay and calls to a fast and a slow
+             dependency through one executor
+       WHEN both have been observed and the slow one spends its budget
+       THEN each has its own delay, and the fast one can still hedge
+    """
+    executor = _executor(2, HedgePolicy(delay_ms=500, adaptive=True,
+                                        min_samples=20))
+
+    def slow(token: CancellationToken) -> str:
+        time.sleep(0.03)
+        return "slow"
+
+    for _ in range(20):
+        executor.execute(lambda token: "fast",
+                         TimeoutPolicy(timeout_seconds=1),
+                         dependency_name="fast")
+        executor.execute(slow, TimeoutPolicy(timeout_seconds=1),
+                         dependency_name="slow")
+
+    fast_delay, fast_budget = executor._hedge_state("fast")
+    slow_delay, slow_budget = executor._hedge_state("slow")
+    assert fast_delay.seconds() < 0.02
+    assert slow_delay.seconds() >= 0.03
+
+    while slow_budget.try_spend():
+        pass
+    assert fast_budget.try_spend()
+    executor.shutdown()
@@ -0,0 +1,98 @@
+import pytest
+
+from resilience_full_impl.executor.bulkhead import BulkheadRejectedException
+from resilience_full_impl.executor.keyed_bulkhead import (HotKeys,
+                                                         KeyedBulkhead)
+from resilience_full_impl.observability.metrics import MetricsCollector
+from resilience_full_impl.policy.keyed_bulkhead_policy import \
+    KeyedBulkheadPolicy
+
+
+def _keyed(**overrides):
+    metrics = MetricsCollector()
+    policy = KeyedBulkheadPolicy(**{"max_concurrent_calls_per_key": 1,
+                                    "max_keys": 2, **overrides})
+    return KeyedBulkhead(policy, metrics=metrics), metrics
+
+
+def test_busy_key_does_not_starve_other_keys():
+    """
+       GIVEN one slot per key, held by tenant-a
+       WHEN tenant-a and tenant-b call
+       THEN only tenant-a is rejected
+    """
+    bulkhead, metrics = _keyed()
+    bulkhead.acquire("svc", "tenant-a")
+
+    with pytest.raises(BulkheadRejectedException):
+        bulkhead.acquire("svc", "tenant-a")
+    bulkhead.acquire("svc", "tenant-b")
+
+    assert metrics._counters[("keyed_bulkhead_rejections_total",
+                              (("dependency_name", "svc"),
+                               ("reason", "key_limit")))] == 1
+
+
+def test_table_evicts_idle_keys_and_never_busy_ones():
+    """
+       GIVEN a table of 2 keys where tenant-a is busy and tenant-b idle
+       WHEN tenant-c arrives, then tenant-d while a and c are busy
+       THEN tenant-b is evicted and the table size published, and
+            tenant-d is rejected as table full
+    """
+    bulkhead, metrics = _keyed()
+    bulkhead.acquire("svc", "tenant-a")
+    bulkhead.acquire("svc", "tenant-b")
+    bulkhead.release("tenant-b")
+
+    bulkhead.acquire("svc", "tenant-c")
+    assert len(bulkhead) == 2
+
+    with pytest.raises(BulkheadRejectedException):
+        bulkhead.acquire("svc", "tenant-d")
+    assert metrics._counters[("keyed_bulkhead_evictions_total",
+                              (("dependency_name", "svc"),
+                               ("reason", "lru")))] == 1
+    assert metrics._gauges[("keyed_bulkhead_keys",
+                            (("dependency_name", "svc"),))] == 2
+
+
+def test_idle_keys_expire_and_hot_keys_are_bounded():
+    """
+       GIVEN an idle eviction of 0 seconds and a top-2 hot key tracker
+       WHEN many keys are called, one of them repeatedly
+       THEN expired keys are dropped and the hottest key ranks first
+    """
+    bulkhead, metrics = _keyed(max_keys=100, idle_eviction_seconds=0,
+                               hot_keys_tracked=2)
+    for index in range(10):
+        for key in ("hot", f"tenant-{index}"):
+            bulkhead.acquire("svc", key)
+            bulkhead.release(key)
+
+    assert len(bulkhead) < 10
+    assert bulkhead.hot_keys(1)[0][0] == "hot"
+
+    bulkhead.publish("svc")
+    assert ("keyed_bulkhead_hot_key_calls",
+            (("dependency_name", "svc"), ("rank", "3"))) \
+        not in metrics._gauges
+
+
+def test_hot_keys_keep_the_heaviest_of_many_keys():
+    """
+       GIVEN a top-10 tracker
+       WHEN 3 heavy keys are interleaved with 2k one-off keys
+       THEN the 3 heavy keys are reported hottest, in order, and the heap
+            stays bounded
+    """
+    hot_keys = HotKeys(10)
+    for index in range(2_000):
+        hot_keys.record(f"tenant-{index}")
+        if index % 2 == 0:
+            for key, weight in (("a", 3), ("b", 2), ("c", 1)):
+                for _ in range(weight):
+                    hot_keys.record(key)
+
+    assert [key for key, _ in hot_keys.top(3)] == ["a", "b", "c"]
+    assert len(hot_keys._heap) <= 20
@@ -0,0 +1,73 @@
+import random
+
+from resilience_patterns_observability.observability.histogram import \
+    LogLinearHistogram
+from resilience_patterns_observability.policies.inmemory_metrics import \
+    InMemoryMetricsCollector
+
+
+def test_percentiles_within_relative_error():
+    """
+       GIVEN 100k latencies spread over 0.1ms - 10s
+       WHEN p50/p90/p99/p999 are read from the histogram
+       THEN each is within the 2**-5 relative error of the exact value
+    """
+    rng = random.Random(7)
+    samples = [10 ** rng.uniform(-1, 4) for _ in range(100_000)]
+    histogram = LogLinearHistogram()
+    for sample in samples:
+        histogram.record(sample)
+
+    ordered = sorted(samples)
+    for percentile in (50.0, 90.0, 99.0, 99.9):
+        exact = ordered[int(round(len(ordered) * percentile / 100)) - 1]
+        assert abs(histogram.percentile(percentile) - exact) <= exact / 32
+    assert histogram.count == len(samples)
+    assert histogram.max == max(samples)
+
+
+def test_memory_is_fixed_and_snapshots_merge():
+    """
+       GIVEN two histograms fed different halves of the samples
+       WHEN one takes a snapshot of the other and merges it
+       THEN the bucket array never grows and the result equals a histogram
+            fed every sample
+    """
+    left, right, whole = (LogLinearHistogram() for _ in range(3))
+    buckets = len(whole.counts)
+    for i in range(1, 20_001):
+        (left if i % 2 else right).record(i / 10)
+        whole.record(i / 10)
+    # far beyond max_value still lands in the top bucket
+    for histogram in (right, whole):
+        histogram.record(10 ** 9)
+
+    merged = left.copy()
+    merged.merge(right.copy())
+
+    assert len(whole.counts) == buckets
+    assert merged.counts == whole.counts
+    assert merged.percentiles() == whole.percentiles()
+    assert merged.max == 10 ** 9
+
+
+def test_collector_keeps_request_latency_in_a_histogram():
+    """
+       GIVEN an InMemoryMetricsCollector
+       WHEN request_latency_ms is observed many times
+       THEN percentiles are served from a bounded histogram per series
+    """
+    metrics = InMemoryMetricsCollector()
+    for ms in range(1, 1001):
+        metrics.observe_latency("request_latency_ms", float(ms),
+                                tags={"dependency": "a"})
+
+    percentiles = metrics.latency_percentiles("request_latency_ms",
+                                              tags={"dependency": "a"})
+
+    assert set(percentiles) == {"p50", "p90", "p99", "p999"}
+    assert abs(percentiles["p99"] - 990) <= 990 / 32
+    assert metrics.latency_snapshot(
+        "request_latency_ms", tags={"dependency": "a"}).count == 1000
+    assert metrics.latency_snapshot("request_latency_ms") is None
+    assert metrics.latency_percentiles("unknown") == {}
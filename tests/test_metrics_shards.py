@@ -0,0 +1,116 @@
+import threading
+
+import pytest
+
+from resilience_full_impl.observability.metrics import MetricsCollector
+from resilience_full_impl.observability.thread_shards import ThreadShards
+from resilience_patterns_observability.observability.thread_shards import \
+    ThreadShards as ObsThreadShards
+from resilience_patterns_observability.policies.inmemory_metrics import \
+    InMemoryMetricsCollector
+
+
+def _run_threads(threads, target):
+    workers = [threading.Thread(target=target) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+def test_thread_shards_are_summed_and_retired_on_read():
+    """
+       GIVEN 16 threads recording a counter and a histogram, through the
+             collector and through a pre-bound handle
+       WHEN the metrics are read after the threads finished
+       THEN nothing is lost and the shards of finished threads are folded
+            away
+    """
+    metrics = MetricsCollector()
+    counter = metrics.counter("calls_total", {"b": "2", "a": "1"})
+
+    def record():
+        for _ in range(1000):
+            metrics.increment("calls_total", {"a": "1", "b": "2"})
+            counter.inc()
+            metrics.observe("latency_seconds", 0.002)
+
+    _run_threads(16, record)
+
+    assert metrics._counters[
+        ("calls_total", (("a", "1"), ("b", "2")))] == 32_000
+    assert metrics._histograms[("latency_seconds", ())].count == 16_000
+    assert counter._shards == []
+    counter.inc()
+    assert counter.value() == 32_001
+
+
+def test_in_memory_collector_aggregates_per_thread_series():
+    """
+       GIVEN an InMemoryMetricsCollector written from 8 threads
+       WHEN counters, latencies and gauges are read
+       THEN they match what every thread recorded
+    """
+    metrics = InMemoryMetricsCollector()
+
+    def record():
+        for ms in range(1, 101):
+            metrics.inc_counter("request_total", tags={"dependency": "a"})
+            metrics.observe_latency("request_latency_ms", float(ms))
+        metrics.set_gauge("in_flight", 3.0)
+
+    _run_threads(8, record)
+
+    assert metrics._counters[
+        ("request_total", frozenset({"dependency": "a"}.items()))] == 800
+    assert metrics.latency_snapshot("request_latency_ms").count == 800
+    assert metrics._gauges[("in_flight", frozenset())] == 3.0
+
+
+def test_thread_shards_base_needs_shard_and_fold():
+    """
+       GIVEN the ThreadShards base of both packages
+       WHEN a subclass leaves out _fold
+       THEN it cannot be instantiated
+    """
+    for base in (ThreadShards, ObsThreadShards):
+        class NoFold(base):
+            def _new_shard(self):
+                return [0]
+
+        with pytest.raises(TypeError):
+            NoFold()
+
+
+def test_short_lived_threads_do_not_accumulate_shards_without_reads():
+    """
+       GIVEN pre-bound counter and latency handles of both packages
+       WHEN 500 short-lived threads each record once, with no reads
+       THEN finished threads' shards are folded away as new threads
+            register, and no recorded value is lost
+    """
+    full_metrics = MetricsCollector()
+    obs_metrics = InMemoryMetricsCollector()
+    handles = [
+        full_metrics.counter("calls_total"),
+        full_metrics.histogram("latency_seconds"),
+        obs_metrics.counter("request_total"),
+        obs_metrics.latency("request_latency_ms"),
+    ]
+    full_counter, full_latency, obs_counter, obs_latency = handles
+
+    def record():
+        full_counter.inc()
+        full_latency.observe(0.002)
+        obs_counter.inc()
+        obs_latency.observe(2.0)
+
+    for _ in range(100):
+        _run_threads(5, record)
+        for handle in handles:
+            assert len(handle._shards) <= 5
+
+    assert full_counter.value() == 500
+    assert obs_counter.value() == 500
+    assert full_latency.snapshot().count == 500
+    assert obs_latency.snapshot().count == 500
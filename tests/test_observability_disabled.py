@@ -0,0 +1,124 @@
+import time
+
+import pytest
+
+from resilience_full_impl.executor.resilience_executor import \
+    ResilienceExecutor
+from resilience_full_impl.observability.metrics import NoopMetricsCollector
+from resilience_full_impl.observability.tracing import NOOP_SPAN, NOOP_TRACER
+from resilience_full_impl.policy.bulkhead_policy import BulkheadPolicy
+from resilience_full_impl.policy.cb_policy import CircuitBreakerPolicy
+from resilience_full_impl.policy.retry_policy import RetryPolicy
+from resilience_full_impl.policy.timeout_policy import TimeoutPolicy
+from resilience_patterns_observability.core.resilience_executor import \
+    ResilienceExecutor as ObservabilityExecutor
+from resilience_patterns_observability.core.timeout_executor import \
+    ExecutionTimeoutError
+from resilience_patterns_observability.observability.context import \
+    current_span
+from resilience_patterns_observability.observability.runtime import metrics
+from resilience_patterns_observability.policies import (
+    bulkhead_policy, cache_policy, cb_policy, retry_policy, timeout_policy)
+
+
+def test_full_impl_executor_with_noop_tracer_and_metrics():
+    """
+       GIVEN an executor built with NoopMetricsCollector and NOOP_TRACER
+       WHEN a call fails once and then succeeds
+       THEN the result is returned, every span is the shared NOOP_SPAN and
+            no series is stored
+    """
+    executor = ResilienceExecutor(
+        retry_policy=RetryPolicy(max_attempts=2, retry_interval_ms=0,
+                                 exponential=False),
+        cb_policy=CircuitBreakerPolicy(failure_threshold=10,
+                                       recovery_timeout=5),
+        bulk_head_policy=BulkheadPolicy(max_concurrent_calls=2,
+                                        acquire_timeout=0),
+        metrics=NoopMetricsCollector(), tracer=NOOP_TRACER)
+    calls = []
+
+    def flaky(token):
+        calls.append(token)
+        if len(calls) == 1:
+            raise ConnectionError("reset")
+        return "ok"
+
+    assert executor.execute(flaky, TimeoutPolicy(timeout_seconds=1),
+                            "svc") == "ok"
+    assert executor._start_span("request", dependency="svc") is NOOP_SPAN
+    assert len(calls) == 2
+    assert executor._metrics._counters == {}
+    executor.shutdown()
+
+
+def test_observability_executor_disabled_records_nothing():
+    """
+       GIVEN an observability executor built with observability=False
+       WHEN a call fails once and then succeeds
+       THEN no span is made current and the global metrics are untouched
+    """
+    executor = ObservabilityExecutor(
+        retry_policy.RetryPolicy(max_retries=2, delay_seconds=0),
+        cb_policy.CircuitBreakerPolicy(failure_threshold=10,
+                                       recovery_timeout=5),
+        bulkhead_policy.BulkheadPolicy(max_concurrent_calls=2,
+                                       acquire_timeout=1),
+        timeout_policy.TimeoutPolicy(1),
+        observability=False)
+    spans = []
+    counters = metrics._counters
+    latency = metrics.latency_snapshot(
+        "request_latency_ms", tags={"executor": "resilience_full_impl"})
+
+    def flaky():
+        spans.append(current_span.get())
+        if len(spans) == 1:
+            raise ConnectionError("reset")
+        return "ok"
+
+    assert executor.execute(flaky) == "ok"
+    assert spans == [None, None]
+    assert metrics._counters == counters
+    after = metrics.latency_snapshot(
+        "request_latency_ms", tags={"executor": "resilience_full_impl"})
+    assert (after.count if after else 0) == (latency.count if latency else 0)
+
+
+def test_observability_executor_disabled_keeps_runtime_collector_empty(
+        monkeypatch):
+    """
+       GIVEN an observability=False executor with an adaptive bulkhead, a
+             one-entry cache and a short timeout
+       WHEN calls time out, succeed and evict cache entries
+       THEN the bulkhead, pool, timeout and cache record nothing into the
+            global runtime collector
+    """
+    recorded = []
+    for method in ("inc_counter", "observe_latency", "set_gauge"):
+        monkeypatch.setattr(metrics, method,
+                            lambda name, *args, **kwargs:
+                            recorded.append(name))
+    executor = ObservabilityExecutor(
+        retry_policy.RetryPolicy(max_retries=1, delay_seconds=0),
+        cb_policy.CircuitBreakerPolicy(failure_threshold=10,
+                                       recovery_timeout=5),
+        bulkhead_policy.BulkheadPolicy(max_concurrent_calls=4,
+                                       acquire_timeout=1,
+                                       adaptive_limit="AIMD"),
+        timeout_policy.TimeoutPolicy(0.05),
+        cache_policy=cache_policy.CachePolicy(ttl_seconds=60,
+                                              max_entries=1),
+        observability=False)
+
+    def call(seconds):
+        time.sleep(seconds)
+        return seconds
+
+    for seconds in (0.0, 0.001, 0.002):
+        assert executor.execute(call, seconds) == seconds
+    with pytest.raises(ExecutionTimeoutError):
+        executor.execute(call, 0.2)
+    executor.timeout_executor.close()
+
+    assert recorded == []
@@ -0,0 +1,54 @@
+import pytest
+
+from resilience_full_impl.executor.bulkhead import (Bulkhead,
+                                                    BulkheadRejectedException)
+from resilience_full_impl.observability.metrics import MetricsCollector
+from resilience_full_impl.policy.bulkhead_policy import (BulkheadPolicy,
+                                                         Priority)
+
+
+def _bulkhead():
+    metrics = MetricsCollector()
+    bulkhead = Bulkhead(BulkheadPolicy(
+        max_concurrent_calls=10, acquire_timeout=0,
+        priority_utilization_limits=(1.0, 1.0, 0.8, 0.5)), metrics=metrics)
+    return bulkhead, metrics
+
+
+def test_low_priority_is_shed_first():
+    """
+       GIVEN LOW may fill 50% and NORMAL 80% of 10 slots
+       WHEN 5 LOW calls are in flight
+       THEN a 6th LOW call is shed but NORMAL calls are still admitted
+    """
+    bulkhead, metrics = _bulkhead()
+    for _ in range(5):
+        bulkhead.acquire("svc", Priority.LOW)
+
+    with pytest.raises(BulkheadRejectedException):
+        bulkhead.acquire("svc", Priority.LOW)
+
+    for _ in range(3):
+        bulkhead.acquire("svc", Priority.NORMAL)
+    assert metrics._counters[("bulkhead_rejections_total",
+                              (("dependency_name", "svc"),
+                               ("priority", "LOW")))] == 1
+
+
+def test_reserved_capacity_is_kept_for_critical_requests():
+    """
+       GIVEN NORMAL work filling its 80% share
+       WHEN NORMAL and CRITICAL requests arrive
+       THEN NORMAL is shed while CRITICAL uses the reserved 20%
+    """
+    bulkhead, _ = _bulkhead()
+    for _ in range(8):
+        bulkhead.acquire("svc", Priority.NORMAL)
+
+    with pytest.raises(BulkheadRejectedException):
+        bulkhead.acquire("svc", Priority.NORMAL)
+
+    bulkhead.acquire("svc", Priority.CRITICAL)
+    bulkhead.acquire("svc", Priority.HIGH)
+    with pytest.raises(BulkheadRejectedException):
+        bulkhead.acquire("svc", Priority.CRITICAL)
@@ -0,0 +1,112 @@
+import threading
+import time
+
+import pytest
+
+from resilience_full_impl.executor.bulkhead import (Bulkhead,
+                                                    BulkheadRejectedException)
+from resilience_full_impl.observability.metrics import MetricsCollector
+from resilience_full_impl.policy.bulkhead_policy import BulkheadPolicy
+
+
+def _bulkhead(max_queue_length, acquire_timeout=1):
+    metrics = MetricsCollector()
+    return Bulkhead(BulkheadPolicy(max_concurrent_calls=1,
+                                   acquire_timeout=acquire_timeout,
+                                   max_queue_length=max_queue_length),
+                    metrics=metrics), metrics
+
+
+def test_queued_caller_gets_slot_on_release():
+    """
+       GIVEN a full bulkhead with room for one waiter
+       WHEN the holder releases within acquire_timeout
+       THEN the waiter acquires instead of being rejected
+    """
+    bulkhead, metrics = _bulkhead(max_queue_length=1)
+    bulkhead.acquire("svc")
+    acquired = threading.Event()
+
+    def waiter():
+        bulkhead.acquire("svc")
+        acquired.set()
+
+    thread = threading.Thread(target=waiter)
+    thread.start()
+    time.sleep(0.05)
+    assert not acquired.is_set()
+
+    bulkhead.release()
+    thread.join(timeout=1)
+
+    assert acquired.is_set()
+    wait_histogram = metrics._histograms[
+        ("bulkhead_queue_wait_seconds", (("dependency_name", "svc"),))]
+    assert wait_histogram.count == 1
+
+
+def test_queue_is_bounded():
+    """
+       GIVEN a queue length of 1 that is already occupied
+       WHEN another caller arrives
+       THEN it is rejected at once
+    """
+    bulkhead, _ = _bulkhead(max_queue_length=1)
+    bulkhead.acquire("svc")
+    queued = threading.Thread(target=bulkhead.acquire, args=("svc",))
+    queued.start()
+    time.sleep(0.05)
+
+    started = time.monotonic()
+    with pytest.raises(BulkheadRejectedException):
+        bulkhead.acquire("svc")
+    assert time.monotonic() - started < 0.5
+
+    bulkhead.release()
+    queued.join(timeout=1)
+
+
+def test_waiter_times_out_at_deadline():
+    """
+       GIVEN acquire_timeout = 1 and a slot that is never released
+       WHEN a caller queues
+       THEN it is rejected after roughly the deadline
+    """
+    bulkhead, _ = _bulkhead(max_queue_length=5, acquire_timeout=1)
+    bulkhead.acquire("svc")
+
+    started = time.monotonic()
+    with pytest.raises(BulkheadRejectedException):
+        bulkhead.acquire("svc")
+
+    assert 0.9 <= time.monotonic() - started < 1.5
+
+
+def test_waiters_are_served_fifo():
+    """
+       GIVEN three queued callers
+       WHEN slots are released one at a time
+       THEN they acquire in arrival order
+    """
+    bulkhead, _ = _bulkhead(max_queue_length=3)
+    bulkhead.acquire("svc")
+    order = []
+
+    def waiter(index):
+        bulkhead.acquire("svc")
+        order.append(index)
+
+    threads = []
+    for index in range(3):
+        thread = threading.Thread(target=waiter, args=(index,))
+        thread.start()
+        threads.append(thread)
+        time.sleep(0.02)
+
+    for _ in range(3):
+        bulkhead.release()
+        time.sleep(0.02)
+    for thread in threads:
+        thread.join(timeout=1)
+
+    assert order == [0, 1, 2]
@@ -0,0 +1,199 @@
+import threading
+import time
+
+import pytest
+
+from resilience_full_impl.cancellation.cancellation_token import \
+    CancellationToken
+from resilience_full_impl.cancellation.exceptions import CancelledException
+
+from resilience_full_impl.executor.rate_limiter import (
+    RateLimiter, RateLimitExceededException)
+from resilience_full_impl.executor.resilience_executor import \
+    ResilienceExecutor
+from resilience_full_impl.observability.metrics import MetricsCollector
+from resilience_full_impl.policy.bulkhead_policy import BulkheadPolicy
+from resilience_full_impl.policy.cb_policy import CircuitBreakerPolicy
+from resilience_full_impl.policy.rate_limiter_policy import (
+    GCRA, TOKEN_BUCKET, RateLimiterPolicy)
+from resilience_full_impl.policy.retry_policy import RetryPolicy
+from resilience_full_impl.policy.timeout_policy import TimeoutPolicy
+from resilience_patterns_observability.clock import VirtualClock
+from resilience_patterns_observability.core import \
+    resilience_executor as obs_executor
+from resilience_patterns_observability.core.rate_limiter import \
+    RateLimitExceededError
+from resilience_patterns_observability.policies import \
+    rate_limiter_policy as obs_rate_limiter_policy
+from resilience_patterns_observability.policies.bulkhead_policy import \
+    BulkheadPolicy as ObsBulkheadPolicy
+from resilience_patterns_observability.policies.cb_policy import \
+    CircuitBreakerPolicy as ObsCircuitBreakerPolicy
+from resilience_patterns_observability.policies.retry_policy import \
+    RetryPolicy as ObsRetryPolicy
+from resilience_patterns_observability.policies.timeout_policy import \
+    TimeoutPolicy as ObsTimeoutPolicy
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.mark.parametrize("algorithm", [TOKEN_BUCKET, GCRA])
+def test_burst_then_sustained_rate(algorithm):
+    """
+       GIVEN 10 permits/s with a burst of 3, failing fast
+       WHEN 4 calls arrive at once and then 100ms passes
+       THEN 3 pass, the 4th is rejected, and one more passes after refill
+    """
+    clock = _FakeClock()
+    limiter = RateLimiter(RateLimiterPolicy(rate_per_second=10, burst=3,
+                                            algorithm=algorithm),
+                          metrics=MetricsCollector(), clock=clock,
+                          sleep=clock.sleep)
+
+    assert [limiter.try_acquire() for _ in range(4)] == [True] * 3 + [False]
+
+    clock.now += 0.1
+    assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+
+
+@pytest.mark.parametrize("algorithm", [TOKEN_BUCKET, GCRA])
+def test_blocking_mode_waits_for_next_permit(algorithm):
+    """
+       GIVEN 10 permits/s, burst 1 and up to 150ms of waiting
+       WHEN two calls arrive at once, then one that waits at most 50ms
+       THEN the second waits 100ms and the third is rejected
+    """
+    clock = _FakeClock()
+    metrics = MetricsCollector()
+    limiter = RateLimiter(RateLimiterPolicy(rate_per_second=10,
+                                            algorithm=algorithm,
+                                            max_wait_seconds=0.15),
+                          metrics=metrics, clock=clock, sleep=clock.sleep)
+
+    limiter.acquire("svc")
+    limiter.acquire("svc")
+    assert clock.now == pytest.approx(0.1)
+
+    with pytest.raises(RateLimitExceededException):
+        limiter.acquire("svc", max_wait_seconds=0.05)
+    assert metrics._counters[("rate_limiter_rejections_total",
+                              (("dependency_name", "svc"),))] == 1
+
+
+def test_retries_take_permits_and_rejection_skips_circuit_breaker():
+    """
+       GIVEN an executor limited to a burst of 2 permits
+       WHEN a failing call retries 3 times
+       THEN the third attempt is rate limited and not counted by the CB
+    """
+    executor = ResilienceExecutor(
+        retry_policy=RetryPolicy(max_attempts=3, retry_interval_ms=1,
+                                 exponential=False),
+        cb_policy=CircuitBreakerPolicy(failure_threshold=5,
+                                       recovery_timeout=5),
+        bulk_head_policy=BulkheadPolicy(max_concurrent_calls=1,
+                                        acquire_timeout=0),
+        rate_limiter_policy=RateLimiterPolicy(rate_per_second=0.1, burst=2))
+
+    def call(token):
+        raise ConnectionError("down")
+
+    with pytest.raises(RateLimitExceededException):
+        executor.execute(call, TimeoutPolicy(timeout_seconds=1),
+                         dependency_name="svc")
+    assert executor._cb_obj._failure_count == 2
+    executor.shutdown()
+
+
+def test_wait_is_capped_by_token_deadline_and_ends_on_cancel():
+    """
+       GIVEN 1 permit/s, burst 1 and up to 5s of waiting
+       WHEN a caller with 50ms left needs the next permit, and another
+            waiting caller's token is cancelled
+       THEN the first is rejected at once and the second wakes with
+            CancelledException instead of sleeping out the wait
+    """
+    limiter = RateLimiter(RateLimiterPolicy(rate_per_second=1,
+                                            max_wait_seconds=5),
+                          metrics=MetricsCollector())
+    limiter.acquire("svc")
+
+    with pytest.raises(RateLimitExceededException):
+        limiter.acquire("svc", token=CancellationToken(deadline_seconds=0.05))
+
+    token = CancellationToken()
+    threading.Timer(0.05, token.cancel).start()
+    started = time.monotonic()
+    with pytest.raises(CancelledException):
+        limiter.acquire("svc", token=token)
+    assert time.monotonic() - started < 0.5
+
+
+def _observability_executor(clock, algorithm, max_retries=1,
+                            max_wait_seconds=0.0):
+    return obs_executor.ResilienceExecutor(
+        ObsRetryPolicy(max_retries=max_retries, delay_seconds=0),
+        ObsCircuitBreakerPolicy(failure_threshold=5, recovery_timeout=5),
+        ObsBulkheadPolicy(max_concurrent_calls=1, acquire_timeout=1),
+        ObsTimeoutPolicy(1),
+        clock=clock,
+        rate_limiter_policy=obs_rate_limiter_policy.RateLimiterPolicy(
+            rate_per_second=10, burst=2, algorithm=algorithm,
+            max_wait_seconds=max_wait_seconds),
+    )
+
+
+@pytest.mark.parametrize("algorithm", [obs_rate_limiter_policy.TOKEN_BUCKET,
+                                       obs_rate_limiter_policy.GCRA])
+def test_observability_executor_limits_the_outgoing_rate(algorithm):
+    """
+       GIVEN the observability executor at 10 permits/s with a burst of 2
+       WHEN three calls arrive at once, failing fast, then 100ms passes
+       THEN the third is rate limited without touching the circuit, and
+            one more call passes after the refill
+    """
+    clock = VirtualClock()
+    executor = _observability_executor(clock, algorithm)
+
+    assert executor.execute(lambda: "ok") == "ok"
+    assert executor.execute(lambda: "ok") == "ok"
+    with pytest.raises(RateLimitExceededError):
+        executor.execute(lambda: "ok")
+    assert executor.cb_state.failure_count == 0
+
+    clock.advance(0.1)
+    assert executor.execute(lambda: "ok") == "ok"
+    executor.timeout_executor.close()
+
+
+def test_observability_executor_retries_wait_for_permits():
+    """
+       GIVEN the observability executor at 10 permits/s, burst 2, willing
+             to wait 1s for a permit
+       WHEN a failing call retries 3 times
+       THEN every attempt takes a permit and the third waits 100ms
+    """
+    clock = VirtualClock()
+    executor = _observability_executor(
+        clock, obs_rate_limiter_policy.TOKEN_BUCKET, max_retries=3,
+        max_wait_seconds=1.0)
+    attempts = []
+
+    def call():
+        attempts.append(clock.monotonic())
+        raise ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        executor.execute(call)
+    assert attempts == [0.0, 0.0, pytest.approx(0.1)]
+    executor.timeout_executor.close()
@@ -0,0 +1,114 @@
+import time
+
+from resilience_patterns_observability.core.resilience_executor import \
+    resilient
+from resilience_patterns_observability.observability.runtime import metrics
+from resilience_patterns_observability.policies.bulkhead_policy import \
+    BulkheadPolicy
+from resilience_patterns_observability.policies.cache_policy import \
+    CachePolicy
+from resilience_patterns_observability.policies.cb_policy import \
+    CircuitBreakerPolicy
+from resilience_patterns_observability.policies.retry_policy import \
+    RetryPolicy
+from resilience_patterns_observability.policies.timeout_policy import \
+    TimeoutPolicy
+
+
+def _policies(cache_policy):
+    return (RetryPolicy(max_retries=1, delay_seconds=0),
+            CircuitBreakerPolicy(failure_threshold=100, recovery_timeout=10),
+            BulkheadPolicy(max_concurrent_calls=2, acquire_timeout=1),
+            TimeoutPolicy(1),
+            cache_policy)
+
+
+def _counter(name, **tags):
+    return metrics._counters.get((name, frozenset(tags.items())), 0)
+
+
+def test_fresh_hit_skips_downstream():
+    """
+       GIVEN a cached read with a 10s TTL
+       WHEN it is called twice with the same argument
+       THEN the downstream is called once and a hit is counted
+    """
+    calls = []
+
+    @resilient(*_policies(CachePolicy(ttl_seconds=10)))
+    def read_fresh(user_id):
+        calls.append(user_id)
+        return f"user-{user_id}"
+
+    assert read_fresh(1) == "user-1"
+    assert read_fresh(1) == "user-1"
+    assert read_fresh(2) == "user-2"
+    assert calls == [1, 2]
+    assert _counter("cache_hit_total", function="test_fresh_hit_skips_"
+                    "downstream.<locals>.read_fresh") == 1
+
+
+def test_stale_served_when_downstream_fails():
+    """
+       GIVEN an expired entry still inside its stale window
+       WHEN the downstream fails
+       THEN the stale result is returned instead of the error
+    """
+    outcomes = ["v1", RuntimeError("down")]
+
+    @resilient(*_policies(CachePolicy(ttl_seconds=0.05,
+                                      stale_ttl_seconds=10)))
+    def read_stale():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    assert read_stale() == "v1"
+    time.sleep(0.1)
+    assert read_stale() == "v1"
+    assert outcomes == []
+
+
+def test_stale_while_revalidate_refreshes_in_background():
+    """
+       GIVEN stale_while_revalidate
+       WHEN an expired entry is read
+       THEN the stale value is returned at once and the next read sees the
+            refreshed value
+    """
+    versions = iter(["v1", "v2"])
+
+    @resilient(*_policies(CachePolicy(ttl_seconds=0.05, stale_ttl_seconds=10,
+                                      stale_while_revalidate=True)))
+    def read_swr():
+        return next(versions)
+
+    assert read_swr() == "v1"
+    time.sleep(0.1)
+    assert read_swr() == "v1"
+    time.sleep(0.2)
+    assert read_swr() == "v2"
+
+
+def test_lru_bound_evicts_least_recent():
+    """
+       GIVEN max_entries = 2
+       WHEN three keys are cached
+       THEN the least recently used key is evicted
+    """
+    calls = []
+
+    @resilient(*_policies(CachePolicy(ttl_seconds=10, max_entries=2)))
+    def read_lru(key):
+        calls.append(key)
+        return key
+
+    read_lru("a")
+    read_lru("b")
+    read_lru("a")
+    read_lru("c")
+    read_lru("a")
+    read_lru("b")
+
+    assert calls == ["a", "b", "c", "b"]
@@ -0,0 +1,63 @@
+import pytest
+
+from resilience_full_impl.executor.resilience_executor import \
+    ResilienceExecutor
+from resilience_full_impl.executor.retry_budget import RetryBudget
+from resilience_full_impl.policy.bulkhead_policy import BulkheadPolicy
+from resilience_full_impl.policy.cb_policy import CircuitBreakerPolicy
+from resilience_full_impl.policy.retry_budget_policy import \
+    RetryBudgetPolicy
+from resilience_full_impl.policy.retry_policy import RetryPolicy
+from resilience_full_impl.policy.timeout_policy import TimeoutPolicy
+
+
+def test_budget_allows_ratio_of_requests_plus_floor():
+    """
+       GIVEN a 10% budget with a floor of 1 retry/s over 2 seconds
+       WHEN 30 requests are recorded
+       THEN 2 + 3 retries are allowed, and the window expiry restores it
+    """
+    now = [0.0]
+    budget = RetryBudget(RetryBudgetPolicy(retry_ratio=0.1,
+                                           min_retries_per_second=1,
+                                           window_seconds=2),
+                         clock=lambda: now[0])
+    for _ in range(30):
+        budget.record_request()
+
+    spent = sum(budget.try_spend() for _ in range(10))
+    assert spent == 5
+
+    now[0] = 5.0
+    assert budget.try_spend()
+
+
+def test_exhausted_budget_fails_fast_with_last_error():
+    """
+       GIVEN a budget with no floor and no ratio
+       WHEN a call fails with 3 attempts configured
+       THEN it is not retried, and the exhaustion is counted
+    """
+    executor = ResilienceExecutor(
+        retry_policy=RetryPolicy(max_attempts=3, retry_interval_ms=1,
+                                 exponential=False),
+        cb_policy=CircuitBreakerPolicy(failure_threshold=10,
+                                       recovery_timeout=5),
+        bulk_head_policy=BulkheadPolicy(max_concurrent_calls=1,
+                                        acquire_timeout=0),
+        retry_budget_policy=RetryBudgetPolicy(retry_ratio=0,
+                                              min_retries_per_second=0))
+    calls = []
+
+    def call(token):
+        calls.append(token)
+        raise ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        executor.execute(call, TimeoutPolicy(timeout_seconds=1),
+                         dependency_name="svc")
+
+    assert len(calls) == 1
+    assert executor._metrics._counters[
+        ("retry_budget_exhausted_total", (("dependency_name", "svc"),))] == 1
+    executor.shutdown()
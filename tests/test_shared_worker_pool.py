@@ -0,0 +1,142 @@
+import threading
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from resilience_patterns_observability.core.resilience_executor import \
+    ResilienceExecutor
+from resilience_patterns_observability.core.shared_worker_pool import \
+    SharedWorkerPool
+from resilience_patterns_observability.core.timeout_executor import (
+    ExecutionTimeoutError, TimeoutExecutor, WorkerShareExhaustedError)
+from resilience_patterns_observability.policies.bulkhead_policy import \
+    BulkheadPolicy
+from resilience_patterns_observability.policies.cb_policy import \
+    CircuitBreakerPolicy
+from resilience_patterns_observability.policies.retry_policy import \
+    RetryPolicy
+from resilience_patterns_observability.policies.timeout_policy import \
+    TimeoutPolicy
+
+
+def test_executor_runs_up_to_bulkhead_limit_concurrently():
+    """
+       GIVEN an executor with max_concurrent_calls = 3
+       WHEN three 0.2s calls are made at the same time
+       THEN they overlap instead of being serialized
+    """
+    executor = ResilienceExecutor(
+        RetryPolicy(max_retries=1, delay_seconds=0),
+        CircuitBreakerPolicy(failure_threshold=5, recovery_timeout=5),
+        BulkheadPolicy(max_concurrent_calls=3, acquire_timeout=1),
+        TimeoutPolicy(2),
+    )
+    threads = [threading.Thread(target=executor.execute,
+                                args=(time.sleep, 0.2)) for _ in range(3)]
+
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert time.monotonic() - started < 0.5
+    executor.timeout_executor.close()
+
+
+def test_timeout_raises_instead_of_returning_none():
+    """
+       GIVEN a 0.05s timeout
+       WHEN the call takes longer
+       THEN ExecutionTimeoutError (a TimeoutError) is raised
+    """
+    pool = SharedWorkerPool()
+    timeout_executor = TimeoutExecutor(TimeoutPolicy(0.05), pool=pool)
+
+    with pytest.raises(TimeoutError) as exc_info:
+        timeout_executor.execute(time.sleep, 0.3)
+
+    assert isinstance(exc_info.value, ExecutionTimeoutError)
+    timeout_executor.close()
+
+
+def test_pool_grows_with_registered_capacity():
+    """
+       GIVEN two executors registering 2 and 3 slots
+       WHEN the pool is inspected
+       THEN its capacity is 5, and 3 after one executor closes
+    """
+    pool = SharedWorkerPool()
+    first = TimeoutExecutor(TimeoutPolicy(1), capacity=2, pool=pool)
+    second = TimeoutExecutor(TimeoutPolicy(1), capacity=3, pool=pool)
+
+    assert pool.capacity == 5
+    assert second.execute(lambda: "ok") == "ok"
+
+    first.close()
+    assert pool.capacity == 3
+    second.close()
+
+
+class _LateFuture(Future):
+    """ completes while result(timeout) is giving up """
+
+    def result(self, timeout=None):
+        if timeout is not None and not self._late_done:
+            self._late_done = True
+            self.set_result("late")
+            raise TimeoutError()
+        return super().result(timeout)
+
+
+class _LatePool(SharedWorkerPool):
+    def submit(self, func, *args, **kwargs):
+        future = _LateFuture()
+        future._late_done = False
+        return future
+
+
+def test_call_finishing_as_the_wait_gives_up_returns_its_result():
+    """
+       GIVEN a call that completes just as the timed wait expires
+       WHEN the timeout executor handles the TimeoutError
+       THEN the late result is returned instead of a timeout
+    """
+    timeout_executor = TimeoutExecutor(TimeoutPolicy(0.05), pool=_LatePool())
+
+    assert timeout_executor.execute(lambda: "unused") == "late"
+    timeout_executor.close()
+
+
+def test_hung_executor_does_not_starve_another():
+    """
+       GIVEN two executors on the shared pool, each limited to 2 calls
+       WHEN executor A's calls hang past their timeout, again and again
+       THEN A rejects calls once its 2 slots are held by timed-out calls,
+            and executor B is still served
+    """
+    def build() -> ResilienceExecutor:
+        return ResilienceExecutor(
+            RetryPolicy(max_retries=1, delay_seconds=0),
+            CircuitBreakerPolicy(failure_threshold=10, recovery_timeout=5),
+            BulkheadPolicy(max_concurrent_calls=2, acquire_timeout=1),
+            TimeoutPolicy(0.1),
+        )
+
+    hung, healthy = build(), build()
+    hang = threading.Event()
+    try:
+        for _ in range(2):
+            with pytest.raises(ExecutionTimeoutError):
+                hung.execute(hang.wait)
+        for _ in range(2):
+            with pytest.raises(WorkerShareExhaustedError):
+                hung.execute(hang.wait)
+
+        assert hung.timeout_executor.abandoned_calls == 2
+        assert healthy.execute(lambda: "ok") == "ok"
+    finally:
+        hang.set()
+        hung.timeout_executor.close()
+        healthy.timeout_executor.close()
@@ -0,0 +1,137 @@
+import threading
+import time
+
+import pytest
+
+from resilience_full_impl.cancellation.cancellation_token import \
+    CancellationToken
+from resilience_full_impl.executor.resilience_executor import (
+    ResilienceExecutor, TimeoutException)
+from resilience_full_impl.executor.single_flight import SingleFlight
+from resilience_full_impl.observability.metrics import MetricsCollector
+from resilience_full_impl.policy.bulkhead_policy import BulkheadPolicy
+from resilience_full_impl.policy.cb_policy import CircuitBreakerPolicy
+from resilience_full_impl.policy.retry_policy import RetryPolicy
+from resilience_full_impl.policy.timeout_policy import TimeoutPolicy
+
+
+def _executor(max_concurrent_calls=1):
+    return ResilienceExecutor(
+        retry_policy=RetryPolicy(max_attempts=1, retry_interval_ms=1,
+                                 exponential=False),
+        cb_policy=CircuitBreakerPolicy(failure_threshold=5,
+                                       recovery_timeout=5),
+        bulk_head_policy=BulkheadPolicy(
+            max_concurrent_calls=max_concurrent_calls, acquire_timeout=0))
+
+
+def _run_concurrently(executor, func, callers):
+    results, errors = [], []
+
+    def call():
+        try:
+            results.append(executor.execute(
+                func, TimeoutPolicy(timeout_seconds=2),
+                dependency_name="cache", coalesce_key="user:42"))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def test_concurrent_identical_calls_share_one_execution():
+    """
+       GIVEN a bulkhead of 1 and 5 concurrent callers with the same key
+       WHEN they execute together
+       THEN the downstream is called once, nobody is rejected by the
+            bulkhead and every caller gets the result
+    """
+    executor = _executor()
+    calls = []
+
+    def load(token: CancellationToken) -> str:
+        calls.append(1)
+        time.sleep(0.2)
+        return "value"
+
+    results, errors = _run_concurrently(executor, load, callers=5)
+
+    assert errors == []
+    assert results == ["value"] * 5
+    assert len(calls) == 1
+    assert executor._metrics._counters[
+        ("single_flight_coalesced_total",
+         (("dependency_name", "cache"),))] == 4
+    executor.shutdown()
+
+
+def test_followers_receive_leader_exception():
+    """
+       GIVEN a shared execution that fails
+       WHEN several callers are coalesced onto it
+       THEN every caller sees the same exception
+    """
+    executor = _executor()
+
+    def load(token: CancellationToken) -> str:
+        time.sleep(0.2)
+        raise ConnectionError("downstream unavailable")
+
+    results, errors = _run_concurrently(executor, load, callers=3)
+
+    assert results == []
+    assert len(errors) == 3
+    assert all(isinstance(e, ConnectionError) for e in errors)
+    executor.shutdown()
+
+
+def test_keys_are_not_cached_after_completion():
+    """
+       GIVEN a finished coalesced call
+       WHEN the same key is executed again
+       THEN the downstream is called again
+    """
+    executor = _executor()
+    calls = []
+
+    def load(token: CancellationToken) -> int:
+        calls.append(1)
+        return len(calls)
+
+    for expected in (1, 2):
+        assert executor.execute(load, TimeoutPolicy(timeout_seconds=1),
+                                dependency_name="cache",
+                                coalesce_key="k") == expected
+    executor.shutdown()
+
+
+def test_follower_times_out_with_timeout_exception():
+    """
+       GIVEN a leader that outlives the follower's 50ms wait
+       WHEN the follower gives up
+       THEN it raises the executor's TimeoutException
+    """
+    single_flight = SingleFlight(metrics=MetricsCollector())
+    started, release = threading.Event(), threading.Event()
+
+    def lead():
+        started.set()
+        release.wait()
+        return "late"
+
+    leader = threading.Thread(
+        target=single_flight.do, args=("key", lead, "svc"))
+    leader.start()
+    started.wait()
+    try:
+        with pytest.raises(TimeoutException):
+            single_flight.do("key", lambda: "unused", "svc",
+                             timeout_seconds=0.05)
+    finally:
+        release.set()
+        leader.join()
@@ -0,0 +1,167 @@
+import threading
+
+import pytest
+
+from resilience_full_impl.executor.circuit_breaker import (
+    CircuitBreaker, CircuitBreakerException)
+from resilience_full_impl.executor.sliding_window import (
+    CountBasedSlidingWindow, TimeBasedSlidingWindow)
+from resilience_full_impl.policy.cb_policy import (COUNT_BASED, TIME_BASED,
+                                                   CircuitBreakerPolicy)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_count_window_evicts_oldest_outcome():
+    """
+       GIVEN a count window of 3
+       WHEN 4 outcomes are recorded
+       THEN only the last 3 are counted
+    """
+    window = CountBasedSlidingWindow(3)
+    window.record(failed=True, slow=True)
+    window.record(failed=False, slow=False)
+    window.record(failed=True, slow=False)
+    snapshot = window.record(failed=False, slow=False)
+
+    assert (snapshot.total_calls, snapshot.failed_calls,
+            snapshot.slow_calls) == (3, 1, 0)
+
+
+def test_time_window_drops_expired_buckets():
+    """
+       GIVEN a 5 second window
+       WHEN failures are older than 5 seconds
+       THEN they no longer count
+    """
+    clock = FakeClock()
+    window = TimeBasedSlidingWindow(5, clock=clock)
+    window.record(failed=True, slow=False)
+    clock.now += 2
+    window.record(failed=False, slow=False)
+
+    assert window.snapshot().total_calls == 2
+
+    clock.now += 4
+    snapshot = window.snapshot()
+    assert (snapshot.total_calls, snapshot.failed_calls) == (1, 0)
+
+    clock.now += 60
+    assert window.snapshot().total_calls == 0
+
+
+def test_failure_rate_trips_only_after_minimum_calls():
+    """
+       GIVEN a count window with 50% failure rate and minimum 4 calls
+       WHEN 2 of the first 3 calls fail
+       THEN the circuit stays closed until the 4th call makes the rate count
+    """
+    cb = CircuitBreaker(CircuitBreakerPolicy(
+        failure_threshold=1, recovery_timeout=60,
+        sliding_window_type=COUNT_BASED, sliding_window_size=10,
+        minimum_number_of_calls=4, failure_rate_threshold=50.0))
+
+    cb.after_failure(RuntimeError("x"))
+    cb.after_failure(RuntimeError("x"))
+    cb.after_success()
+    cb.before_execution()
+
+    cb.after_success()
+    with pytest.raises(CircuitBreakerException):
+        cb.before_execution()
+
+
+def test_scattered_failures_do_not_accumulate():
+    """
+       GIVEN a count window of 10 with 50% failure rate
+       WHEN one failure arrives among every 9 successes for a long time
+       THEN the circuit never opens
+    """
+    cb = CircuitBreaker(CircuitBreakerPolicy(
+        failure_threshold=1, recovery_timeout=60,
+        sliding_window_type=COUNT_BASED, sliding_window_size=10,
+        minimum_number_of_calls=5))
+
+    for i in range(1000):
+        if i % 10 == 0:
+            cb.after_failure(RuntimeError("x"))
+        else:
+            cb.after_success()
+
+    cb.before_execution()
+
+
+def test_slow_call_rate_trips_circuit():
+    """
+       GIVEN slow calls above 1s with a 50% slow-call threshold
+       WHEN successful calls are all slow
+       THEN the circuit opens
+    """
+    cb = CircuitBreaker(CircuitBreakerPolicy(
+        failure_threshold=1, recovery_timeout=60,
+        sliding_window_type=COUNT_BASED, sliding_window_size=4,
+        minimum_number_of_calls=2, slow_call_rate_threshold=50.0,
+        slow_call_duration_threshold=1.0))
+
+    cb.after_success(duration_seconds=2.0)
+    cb.after_success(duration_seconds=2.0)
+
+    with pytest.raises(CircuitBreakerException):
+        cb.before_execution()
+
+
+def _record_concurrently(cb, threads, successes, failures):
+    barrier = threading.Barrier(threads)
+
+    def record():
+        barrier.wait()
+        # successes first, so no thread ever runs above its final
+        # failure rate
+        for index in range(successes + failures):
+            cb.before_execution()
+            if index < successes:
+                cb.after_success()
+            else:
+                cb.after_failure(RuntimeError("down"))
+
+    workers = [threading.Thread(target=record) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+@pytest.mark.parametrize("window_type", [COUNT_BASED, TIME_BASED])
+def test_concurrent_outcomes_are_counted_exactly(window_type):
+    """
+       GIVEN a 50% failure-rate circuit whose window holds every call
+       WHEN 8 threads record 600 successes and 400 failures each through
+            the CLOSED fast path, then 200 more failures each
+       THEN the window counts 8000 calls with 3200 failures and stays
+            CLOSED, and opens exactly when the failure rate reaches 50%
+    """
+    cb = CircuitBreaker(CircuitBreakerPolicy(
+        failure_threshold=1, recovery_timeout=60,
+        sliding_window_type=window_type, sliding_window_size=100_000,
+        minimum_number_of_calls=100))
+
+    _record_concurrently(cb, threads=8, successes=600, failures=400)
+
+    snapshot = cb._window.snapshot()
+    assert (snapshot.total_calls, snapshot.failed_calls) == (8000, 3200)
+    assert cb._state == CircuitBreaker.CLOSED
+
+    _record_concurrently(cb, threads=8, successes=0, failures=199)
+    assert cb._state == CircuitBreaker.CLOSED
+    for _ in range(8):
+        cb.after_failure(RuntimeError("down"))
+
+    snapshot = cb._window.snapshot()
+    assert (snapshot.total_calls, snapshot.failed_calls) == (9600, 4800)
+    assert cb._state == CircuitBreaker.OPEN
@@ -0,0 +1,135 @@
+import asyncio
+import threading
+
+from resilience_full_impl.cancellation.cancellation_token import \
+    CancellationToken
+from resilience_full_impl.clock import VirtualClock
+from resilience_full_impl.executor.async_resilience_executor import \
+    AsyncResilienceExecutor
+from resilience_full_impl.executor.circuit_breaker import CircuitBreaker
+from resilience_full_impl.executor.resilience_executor import \
+    ResilienceExecutor
+from resilience_full_impl.policy.bulkhead_policy import BulkheadPolicy
+from resilience_full_impl.policy.cb_policy import CircuitBreakerPolicy
+from resilience_full_impl.policy.retry_policy import RetryPolicy
+from resilience_full_impl.policy.timeout_policy import TimeoutPolicy
+from resilience_full_impl.timer_wheel import HashedTimerWheel
+
+
+def _manual_wheel():
+    clock = VirtualClock()
+    return HashedTimerWheel(tick_seconds=0.01, wheel_size=8, clock=clock,
+                            autostart=False), clock
+
+
+def test_timers_fire_in_their_tick_across_wheel_turns():
+    """
+       GIVEN an 8-slot wheel of 10ms ticks and timers at 30ms, 250ms and
+             1s, the last one cancelled
+       WHEN virtual time advances
+       THEN each fires once its tick passes, several turns later included
+    """
+    wheel, clock = _manual_wheel()
+    fired = []
+    wheel.schedule(0.03, lambda: fired.append("30ms"))
+    wheel.schedule(0.25, lambda: fired.append("250ms"))
+    wheel.cancel(wheel.schedule(1.0, lambda: fired.append("1s")))
+
+    clock.advance(0.02)
+    wheel.run_due()
+    assert fired == []
+
+    clock.advance(0.02)
+    wheel.run_due()
+    assert fired == ["30ms"]
+
+    clock.advance(0.2)
+    wheel.run_due()
+    assert fired == ["30ms"]
+
+    clock.advance(2)
+    wheel.run_due()
+    assert fired == ["30ms", "250ms"]
+    assert wheel.pending == 0
+
+
+def test_wheel_fires_token_deadline_without_polling():
+    """
+       GIVEN a token with a 50ms deadline on a running wheel
+       WHEN nobody polls it
+       THEN its callback runs once the deadline passes
+    """
+    fired = threading.Event()
+    token = CancellationToken(deadline_seconds=0.05,
+                              timer_wheel=HashedTimerWheel())
+    token.register_callback(fired.set)
+
+    assert fired.wait(1)
+
+
+def test_circuit_half_opens_when_recovery_timer_fires():
+    """
+       GIVEN an open circuit with a 5s recovery on a manual wheel
+       WHEN 5 seconds of virtual time pass without calls
+       THEN the circuit is HALF_OPEN
+    """
+    wheel, clock = _manual_wheel()
+    cb = CircuitBreaker(CircuitBreakerPolicy(failure_threshold=1,
+                                             recovery_timeout=5),
+                        clock=clock, timer_wheel=wheel)
+    cb.after_failure(ConnectionError("down"))
+    assert cb._state == CircuitBreaker.OPEN
+
+    wheel.sleep(5.01)
+
+    assert cb._state == CircuitBreaker.HALF_OPEN
+
+
+def test_finished_calls_release_their_deadline_timers():
+    """
+       GIVEN sync and async executors sharing a wheel and a 30s timeout
+       WHEN calls succeed
+       THEN no request or attempt deadline timer is left pending
+    """
+    wheel = HashedTimerWheel(autostart=False)
+    policies = (RetryPolicy(max_attempts=2, retry_interval_ms=0,
+                            exponential=False),
+                CircuitBreakerPolicy(failure_threshold=10,
+                                     recovery_timeout=5),
+                BulkheadPolicy(max_concurrent_calls=2, acquire_timeout=1))
+    executor = ResilienceExecutor(*policies, timer_wheel=wheel)
+    async_executor = AsyncResilienceExecutor(*policies, timer_wheel=wheel)
+    timeout = TimeoutPolicy(timeout_seconds=30)
+
+    async def call(token):
+        return "ok"
+
+    for _ in range(5):
+        assert executor.execute(lambda token: "ok", timeout, "dep") == "ok"
+        assert asyncio.run(async_executor.execute(call, timeout,
+                                                  "dep")) == "ok"
+
+    assert wheel.pending == 0
+    executor.shutdown()
+
+
+def test_timer_scheduled_after_long_idle_fires_on_time():
+    """
+       GIVEN a manual wheel left idle for an hour
+       WHEN a 50ms timer is scheduled
+       THEN it does not fire early and fires once 50ms pass, without
+            walking the idle hour of ticks
+    """
+    wheel, clock = _manual_wheel()
+    fired = []
+    clock.advance(3600)
+
+    wheel.schedule(0.05, lambda: fired.append(clock.monotonic()))
+
+    assert wheel._processed_tick == wheel._tick_of(clock.monotonic())
+    assert wheel.run_due() == 0
+    clock.advance(0.03)
+    assert wheel.run_due() == 0
+    clock.advance(0.03)
+    assert wheel.run_due() == 1
+    assert fired and fired[0] >= 3600.05
@@ -0,0 +1,134 @@
+import uuid
+
+from resilience_patterns_observability.clock import VirtualClock
+from resilience_patterns_observability.core.resilience_executor import \
+    ResilienceExecutor
+from resilience_patterns_observability.observability.inmemory_tracing import \
+    InMemoryTraceSpan
+from resilience_patterns_observability.observability.sampling import (
+    TailSampler, configure_sampling, head_sampled)
+from resilience_patterns_observability.policies import (
+    bulkhead_policy, cb_policy, retry_policy, timeout_policy)
+
+
+def _trace(clock, duration_seconds=0.0, error=None):
+    root = InMemoryTraceSpan("request", clock=clock)
+    root.start()
+    child = InMemoryTraceSpan("attempt", trace_id=root.trace_id,
+                              parent_span_id=root.span_id, clock=clock)
+    child.start()
+    clock.advance(duration_seconds)
+    if error is not None:
+        child.record_error(error)
+    child.end()
+    root.end()
+    return root
+
+
+def test_head_sampling_is_deterministic_per_trace_id():
+    """
+       GIVEN 10k random trace ids and a 10% head rate
+       WHEN each is sampled twice
+       THEN the decisions agree and about 10% are sampled
+    """
+    trace_ids = [str(uuid.uuid4()) for _ in range(10_000)]
+
+    first = [head_sampled(trace_id, 0.1) for trace_id in trace_ids]
+
+    assert first == [head_sampled(trace_id, 0.1) for trace_id in trace_ids]
+    assert 800 < sum(first) < 1200
+    assert all(head_sampled(trace_id, 1.0) for trace_id in trace_ids[:10])
+    assert not any(head_sampled(trace_id, 0.0)
+                   for trace_id in trace_ids[:10])
+
+
+def test_tail_keeps_only_errored_and_slow_traces():
+    """
+       GIVEN a tail sampler keeping traces of 100ms or more
+       WHEN a fast, a slow and an errored trace of two spans end
+       THEN the slow and the errored traces are kept whole
+    """
+    clock = VirtualClock()
+    tail = TailSampler(latency_threshold_ms=100)
+    configure_sampling(tail=tail)
+    try:
+        _trace(clock, duration_seconds=0.01)
+        slow = _trace(clock, duration_seconds=0.5)
+        errored = _trace(clock, error=ValueError("boom"))
+    finally:
+        configure_sampling()
+
+    assert [[span.name for span in spans] for spans in tail.kept] == [
+        ["attempt", "request"], ["attempt", "request"]]
+    assert [spans[-1] for spans in tail.kept] == [slow, errored]
+    assert (tail.traces_kept, tail.traces_dropped) == (2, 1)
+    assert tail.buffered_traces == 0
+
+
+def test_tail_buffer_is_bounded():
+    """
+       GIVEN room for 2 open traces of 2 spans each
+       WHEN 3 traces are open at once and one ends 3 spans
+       THEN the oldest trace is evicted and the extra span is not buffered
+    """
+    clock = VirtualClock()
+    tail = TailSampler(latency_threshold_ms=0, max_traces=2,
+                       max_spans_per_trace=2)
+    configure_sampling(tail=tail)
+    try:
+        roots = [InMemoryTraceSpan("request", clock=clock) for _ in range(3)]
+        for root in roots:
+            root.start()
+        assert (tail.buffered_traces, tail.traces_evicted) == (2, 1)
+
+        last = roots[-1]
+        for name in ("a", "b"):
+            span = InMemoryTraceSpan(name, trace_id=last.trace_id,
+                                     clock=clock)
+            span.start()
+            span.end()
+        last.end()
+        roots[0].end()
+    finally:
+        configure_sampling()
+
+    assert [span.name for span in tail.kept[0]] == ["a", "b"]
+    assert tail.spans_dropped == 2
+
+
+def test_executor_records_spans_only_for_sampled_traces():
+    """
+       GIVEN a tail sampler keeping every trace
+       WHEN a failing-then-successful call runs at head rate 0 and then 1
+       THEN only the second run is buffered, with its root and retry spans
+    """
+    executor = ResilienceExecutor(
+        retry_policy.RetryPolicy(max_retries=2, delay_seconds=0),
+        cb_policy.CircuitBreakerPolicy(failure_threshold=10,
+                                       recovery_timeout=5),
+        bulkhead_policy.BulkheadPolicy(max_concurrent_calls=2,
+                                       acquire_timeout=1),
+        timeout_policy.TimeoutPolicy(1))
+    tail = TailSampler(latency_threshold_ms=0)
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) % 2:
+            raise ConnectionError("reset")
+        return "ok"
+
+    try:
+        configure_sampling(head_rate=0.0, tail=tail)
+        assert executor.execute(flaky) == "ok"
+        assert tail.traces_kept == 0
+
+        configure_sampling(head_rate=1.0, tail=tail)
+        assert executor.execute(flaky) == "ok"
+    finally:
+        configure_sampling()
+
+    assert tail.traces_kept == 1
+    assert sorted(span.name for span in tail.kept[0]) == [
+        "resilience_executor.execute", "retry.attempt.1", "retry.attempt.2"]
+    assert tail.kept[0][-1].error is not None